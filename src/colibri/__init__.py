@@ -1,15 +1,16 @@
+import importlib
+from typing import Any
+
 from colibri.core import (
     ProjectData,
     ProjectOrchestrator,
 )
 from colibri.datamodel.dataset import DataSet
-from colibri.modules import (
-    AcvExploitationOnly,
-    InfinitePowerGenerator,
-    LayerWallLosses,
-    LimitedGenerator,
-    OccupantModel,
-    SimplifiedWallLosses,
-    ThermalSpaceSimplified,
-    WeatherModel,
-)
+from colibri.modules import MODULE_PATHS
+
+
+def __getattr__(name: str) -> Any:
+    # Modules are imported on first use (see colibri.modules)
+    if name not in MODULE_PATHS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module("colibri.modules"), name)
@@ -2,32 +2,45 @@
 Constants for the `colibri` package.
 """
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING, Any
 
 from colibri.utils.logging_utils import initialize_logger
-from colibri.utils.units_utils import UnitConverter, get_unit_converter
+from colibri.utils.units_utils import get_unit_converter
+
+if TYPE_CHECKING:
+    from colibri.utils.units_utils import UnitConverter
 
 # Logger to print info, debug, warning, error, etc.
 LOGGER: logging.Logger = initialize_logger()
-# Object to convert from one unit to another (has all unit conversion factors)
-UNIT_CONVERTER: UnitConverter = get_unit_converter()
+# Object to convert from one unit to another (has all unit conversion
+# factors), UNIT_CONVERTER is only created on first access (see __getattr__)
+UNIT_CONVERTER: UnitConverter
 
 # Internal variable names
 ATTACHED_TO: str = "attached_to"
 ARCHETYPES: str = "archetypes"
 ARCHETYPE_COLLECTION: str = "archetype_collection"
+ARRAY_FILE: str = "array_file"
 BUILDING_COLLECTION: str = "building_collection"
 BOUNDARY: str = "boundary"
 BOUNDARY_COLLECTION: str = "boundary_collection"
 CATEGORY: str = "category"
+CHOICES: str = "choices"
 COLIBRI: str = "colibri"
+# Environment variable of the directory where generated data is cached
+COLIBRI_CACHE_DIR: str = "COLIBRI_CACHE_DIR"
 COLIBRI_INTERFACES_MODULE_PATH: str = "colibri.interfaces"
+COLIBRI_MODULES_ENTRY_POINT_GROUP: str = "colibri.modules"
 COLIBRI_MODULES_MODULE_PATH: str = "colibri.modules"
 COLIBRI_PROJECT_OBJECTS_MODULE_PATH: str = "colibri.project_objects"
 COLLECTION: str = "collection"
 DEFAULT: str = "default"
 DESCRIPTION: str = "description"
 ELEMENT_OBJECT: str = "ElementObject"
+EMITTER: str = "emitter"
 ENUM: str = "enum"
 FORMAT: str = "format"
 FORWARD_REF: str = "ForwardRef"
@@ -35,6 +48,7 @@ INPUTS: str = "inputs"
 JUNCTION: str = "junction"
 LINEAR_JUNCTION: str = "linear_junction"
 MAX: str = "max"
+MEMORY_MAP: str = "memory_map"
 MIN: str = "min"
 MODULE: str = "module"
 MODULE_COLLECTION: str = "module_collection"
@@ -50,6 +64,8 @@ SPACE: str = "Space"
 SEGMENT: str = "segment"
 SEGMENTS: str = "segments"
 SERIES_EXTENSION_NAME: str = "_series"
+SHARED_FIELDS_BY_ROLE: str = "_shared_fields_by_role"
+SHARED_FIELDS_METADATA: str = "_shared_fields_metadata"
 SIMULATION_PARAMETERS: str = "simulation_parameters"
 SLOTS: str = "__slots__"
 SPACE_COLLECTION: str = "space_collection"
@@ -57,3 +73,12 @@ TYPE: str = "type"
 TYPING: str = "typing"
 TYPE_ID: str = "type_id"
 UNIT: str = "unit"
+
+
+def __getattr__(name: str) -> Any:
+    # Constants which are slow to create are created on first access
+    if name == "UNIT_CONVERTER":
+        unit_converter: UnitConverter = get_unit_converter()
+        globals()[name] = unit_converter
+        return unit_converter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
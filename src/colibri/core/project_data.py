@@ -7,7 +7,18 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from colibri.config.constants import (
     ARCHETYPE_COLLECTION,
@@ -18,6 +29,7 @@ from colibri.config.constants import (
     NODE_COLLECTION,
     OBJECT_COLLECTION,
     PROJECT,
+    PROJECT_DATA,
     SEGMENTS,
     SIMULATION_PARAMETERS,
     SPACE,
@@ -41,20 +53,94 @@ from colibri.project_objects import (
 from colibri.utils.class_utils import (
     create_class_instance,
 )
+from colibri.utils.data_utils import (
+    is_array_reference,
+    load_array_reference,
+    turn_format_to_string,
+)
 from colibri.utils.enums_utils import (
     ColibriObjectTypes,
+    ColibriProjectObjects,
     Units,
 )
+from colibri.utils.exceptions_utils import UserInputError
+from colibri.utils.json_utils import JsonStream
 
 
 class ProjectData(Module):
     """Class representing the project's data (structure of the project)."""
 
     INSTANCE_NAME: str = "project_data"
+    # Project objects' categories that require each collection to be created
+    COLLECTION_CATEGORIES: Dict[str, Tuple[ColibriProjectObjects, ...]] = {
+        "spaces": (ColibriProjectObjects.SPACE,),
+        "boundaries": (
+            ColibriProjectObjects.ARCHETYPE,
+            ColibriProjectObjects.BOUNDARY,
+            ColibriProjectObjects.BOUNDARY_OBJECT,
+            ColibriProjectObjects.ELEMENT_OBJECT,
+        ),
+    }
+    # Parameters defining the structure of the project (links between
+    # objects), whose changes require the objects to be created again
+    STRUCTURAL_PARAMETERS: Tuple[str, ...] = (
+        "id",
+        "object_collection",
+        "segments",
+        "side_1",
+        "side_2",
+        TYPE,
+        TYPE_ID,
+    )
+
+    # Keys of the collections that can be streamed from the project file
+    STREAMED_COLLECTIONS: Dict[str, Tuple[str, ...]] = {
+        "spaces": (PROJECT, NODE_COLLECTION, SPACE_COLLECTION),
+        "boundaries": (PROJECT, BOUNDARY_COLLECTION),
+    }
+
+    def __init__(
+        self, name: str, data: Union[dict, Path], stream: bool = False
+    ) -> None:
+        """Initialize a new ProjectData instance
+
+        Parameters
+        ----------
+        name : str
+            Name of the project data
+        data : Union[dict, Path]
+            Project/simulation/input data or path of the project file
+        stream : bool = False
+            If True (and data is a path), spaces and boundaries are not
+            loaded with the project file but read one by one from it when
+            their objects are created (for very large projects)
+
+        Returns
+        -------
+        None
 
-    def __init__(self, name: str, data: Union[dict, Path]) -> None:
-        """Initialize a new ProjectData instance."""
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
         super().__init__(name=name)
+        self.stream = stream and isinstance(data, Path)
+        # Positions of the streamed collections in the project file
+        self._streamed_positions: Dict[Tuple[str, ...], Tuple[int, int]] = (
+            dict()
+        )
+        self._spaces: Optional[List[Space]] = None
+        self._boundaries: Optional[List[Boundary]] = None
+        self._boundary_conditions: Optional[List[BoundaryCondition]] = None
+        # Objects built from each archetype (type, type_id) with the names
+        # of the parameters they define themselves
+        self._archetype_objects: Dict[
+            Tuple[str, str], List[Tuple[Any, FrozenSet[str]]]
+        ] = dict()
         self.project_file = data if isinstance(data, Path) is True else False
         self.project_data: dict = (
             self.read_project_file() if isinstance(data, Path) is True else data
@@ -66,10 +152,10 @@ class ProjectData(Module):
             self.simulation_parameters = self.project_data[PROJECT].get(
                 SIMULATION_PARAMETERS, dict()
             )
-            spaces: List[Space] = self.get_spaces()
+            # Collections are materialized on first access (see properties)
             self.spaces: List[Space] = self.define_output(
                 name="spaces",
-                default_value=spaces,
+                default_value=None,
                 description="Spaces of the project.",
                 format=List["Space"],
                 min=None,
@@ -77,10 +163,9 @@ class ProjectData(Module):
                 unit=Units.UNITLESS,
                 attached_to=None,
             )
-            boundaries: List[Boundary] = self.get_boundaries()
             self.boundaries: List[Boundary] = self.define_output(
                 name="boundaries",
-                default_value=boundaries,
+                default_value=None,
                 description="Boundaries of the project.",
                 format=List["Boundary"],
                 min=None,
@@ -88,13 +173,10 @@ class ProjectData(Module):
                 unit=Units.UNITLESS,
                 attached_to=None,
             )
-            boundary_conditions: List[BoundaryCondition] = (
-                self.get_boundary_conditions()
-            )
             self.boundary_conditions: List[BoundaryCondition] = (
                 self.define_output(
                     name="boundary_conditions",
-                    default_value=boundary_conditions,
+                    default_value=None,
                     description="Boundary conditions of the project.",
                     format=List["BoundaryCondition"],
                     min=None,
@@ -104,6 +186,368 @@ class ProjectData(Module):
                 )
             )
 
+    @property
+    def spaces(self) -> List[Space]:
+        """Spaces of the project, created on first access"""
+        if self._spaces is None:
+            self._spaces = self.get_spaces() if self.project_data else []
+        return self._spaces
+
+    @spaces.setter
+    def spaces(self, spaces: Optional[List[Space]]) -> None:
+        self._spaces = spaces
+
+    @property
+    def boundaries(self) -> List[Boundary]:
+        """Boundaries of the project, created on first access
+        (spaces are created beforehand to link them to the boundaries)"""
+        if self._boundaries is None:
+            self._boundaries = (
+                self.get_boundaries() if self.project_data else []
+            )
+        return self._boundaries
+
+    @boundaries.setter
+    def boundaries(self, boundaries: Optional[List[Boundary]]) -> None:
+        self._boundaries = boundaries
+
+    @property
+    def boundary_conditions(self) -> List[BoundaryCondition]:
+        """Boundary conditions of the project, created on first access"""
+        if self._boundary_conditions is None:
+            self._boundary_conditions = (
+                self.get_boundary_conditions() if self.project_data else []
+            )
+        return self._boundary_conditions
+
+    @boundary_conditions.setter
+    def boundary_conditions(
+        self, boundary_conditions: Optional[List[BoundaryCondition]]
+    ) -> None:
+        self._boundary_conditions = boundary_conditions
+
+    def load_required_collections(self, modules: List[Module]) -> List[str]:
+        """Create the collections (spaces, boundaries, etc.) whose objects
+        are required by the given modules, the other collections are only
+        created if they are accessed
+
+        Parameters
+        ----------
+        modules : List[Module]
+            Modules of the project
+
+        Returns
+        -------
+        collection_names : List[str]
+            Names of the collections that have been created
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        categories: Set[ColibriProjectObjects] = {
+            required_parameter.attached_to.category
+            for module in modules
+            for parameter in module.parameters
+            if turn_format_to_string(field_format=parameter.format)
+            == PROJECT_DATA
+            for required_parameter in (parameter.required or [])
+            if required_parameter.attached_to is not None
+        }
+        collection_names: List[str] = [
+            collection_name
+            for collection_name, collection_categories in (
+                self.COLLECTION_CATEGORIES.items()
+            )
+            if categories.intersection(collection_categories)
+        ]
+        for collection_name in collection_names:
+            _ = getattr(self, collection_name)
+        return collection_names
+
+    def patch(self, changes: Dict[str, Any]) -> List[str]:
+        """Apply changes to the project data (e.g. for a variant) without
+        rebuilding it: only the objects affected by the changes are updated
+
+        Parameters
+        ----------
+        changes : Dict[str, Any]
+            New values by JSON pointer inside the project data
+            (e.g. "/project/archetype_collection/layer_types/beton_1/thickness")
+
+        Returns
+        -------
+        module_names : List[str]
+            Names of the modules that must be initialized again
+
+        Raises
+        ------
+        UserInputError
+            If a JSON pointer does not exist in the project data
+
+        Examples
+        --------
+        >>> None
+        """
+        modules: Set[Module] = set()
+        for pointer, value in changes.items():
+            keys: List[str] = self._parse_pointer(pointer=pointer)
+            if (self.stream is True) and any(
+                tuple(keys[: len(collection_keys)]) == collection_keys
+                for collection_keys in self.STREAMED_COLLECTIONS.values()
+            ):
+                raise UserInputError(
+                    f"{pointer} cannot be patched, it is streamed "
+                    f"from the project file."
+                )
+            self._set_project_data_value(
+                pointer=pointer, keys=keys, value=value
+            )
+            modules.update(self._patch_objects(keys=keys))
+        for module in modules:
+            module._is_initialized = False
+        return sorted(module.name for module in modules)
+
+    @staticmethod
+    def _parse_pointer(pointer: str) -> List[str]:
+        # JSON pointer (RFC 6901): "/a/b~1c" -> ["a", "b/c"]
+        if (not isinstance(pointer, str)) or (not pointer.startswith("/")):
+            raise UserInputError(f"{pointer} is not a valid JSON pointer.")
+        return [
+            key.replace("~1", "/").replace("~0", "~")
+            for key in pointer[1:].split("/")
+        ]
+
+    def _set_project_data_value(
+        self, pointer: str, keys: List[str], value: Any
+    ) -> None:
+        container: Any = self.project_data
+        try:
+            for key in keys[:-1]:
+                container = container[
+                    int(key) if isinstance(container, list) else key
+                ]
+            if isinstance(container, list):
+                container[int(keys[-1])] = value
+            else:
+                container[keys[-1]] = value
+        except (IndexError, KeyError, TypeError, ValueError) as error:
+            raise UserInputError(
+                f"{pointer} does not exist in the project data."
+            ) from error
+
+    def _patch_objects(self, keys: List[str]) -> Set[Module]:
+        # Update the objects (already created) affected by a change,
+        # and return the modules that depend on it
+        if (len(keys) < 3) or (keys[0] != PROJECT):
+            return self._get_dependent_modules()
+        project: Dict[str, Any] = self.project_data[PROJECT]
+        collection_name: str = keys[1]
+        if collection_name == SIMULATION_PARAMETERS:
+            if self.project is not None:
+                setattr(
+                    self.project,
+                    keys[2],
+                    project[SIMULATION_PARAMETERS][keys[2]],
+                )
+            return self._get_dependent_modules()
+        if collection_name == MODULE_COLLECTION:
+            modules: List[Module] = (
+                self.project.get_modules_by_class(class_name=keys[2])
+                if self.project is not None
+                else []
+            )
+            if len(keys) > 3:
+                for module in modules:
+                    setattr(
+                        module,
+                        keys[3],
+                        self.resolve_array_reference(
+                            value=project[MODULE_COLLECTION][keys[2]][keys[3]]
+                        ),
+                    )
+            return set(modules)
+        if (collection_name == NODE_COLLECTION) and (
+            keys[2] == SPACE_COLLECTION
+        ):
+            return self._patch_space(keys=keys[3:])
+        if collection_name == BOUNDARY_COLLECTION:
+            return self._patch_boundary(keys=keys[2:])
+        if (collection_name == ARCHETYPE_COLLECTION) and (len(keys) > 3):
+            return self._patch_archetype(keys=keys[2:])
+        # Other changes (e.g. junctions) are only taken into account
+        # when the boundaries are created
+        self._reset_boundaries()
+        return self._get_dependent_modules(
+            categories=self.COLLECTION_CATEGORIES["boundaries"]
+        )
+
+    def _patch_space(self, keys: List[str]) -> Set[Module]:
+        # keys: [space_id, parameter_name, ...], structural changes (e.g.
+        # id) create the spaces and their boundaries again
+        if (len(keys) < 2) or (keys[1] in self.STRUCTURAL_PARAMETERS):
+            self._reset_spaces()
+            return self._get_dependent_modules(
+                categories=self.COLLECTION_CATEGORIES["spaces"]
+                + self.COLLECTION_CATEGORIES["boundaries"]
+            )
+        space_id, parameter_name = keys[0], keys[1]
+        space_data: Dict[str, Any] = self.project_data[PROJECT][
+            NODE_COLLECTION
+        ][SPACE_COLLECTION][space_id]
+        for space in self._spaces or []:
+            if space.id == space_data.get("id", space_id):
+                setattr(
+                    space,
+                    parameter_name,
+                    self.resolve_array_reference(
+                        value=space_data[parameter_name]
+                    ),
+                )
+        return self._get_dependent_modules(
+            categories=self.COLLECTION_CATEGORIES["spaces"],
+            parameter_name=parameter_name,
+        )
+
+    def _patch_boundary(self, keys: List[str]) -> Set[Module]:
+        # keys: [boundary_id, parameter_name, ...]
+        boundary_data: Dict[str, Any] = self.project_data[PROJECT][
+            BOUNDARY_COLLECTION
+        ].get(keys[0], dict())
+        is_value_patched: bool = (
+            (len(keys) == 2)
+            and (keys[1] not in self.STRUCTURAL_PARAMETERS)
+            and (
+                not self._has_archetype_reference(
+                    data=boundary_data.get(keys[1])
+                )
+            )
+        )
+        if is_value_patched is False:
+            self._reset_boundaries()
+            return self._get_dependent_modules(
+                categories=self.COLLECTION_CATEGORIES["boundaries"]
+            )
+        parameter_value: Any = boundary_data[keys[1]]
+        for boundary in self._boundaries or []:
+            if boundary.id == boundary_data.get("id", keys[0]):
+                setattr(
+                    boundary,
+                    keys[1],
+                    self.create_element_object(element_data=parameter_value),
+                )
+        return self._get_dependent_modules(
+            categories=self.COLLECTION_CATEGORIES["boundaries"],
+            parameter_name=keys[1],
+        )
+
+    def _patch_archetype(self, keys: List[str]) -> Set[Module]:
+        # keys: [archetype_type_key, archetype_type_id, parameter_name, ...]
+        archetype_type: str = keys[0].removesuffix(f"_{TYPE}s")
+        archetype_data: Dict[str, Any] = self.project_data[PROJECT][
+            ARCHETYPE_COLLECTION
+        ][keys[0]][keys[1]]
+        is_value_patched: bool = (
+            (len(keys) == 3)
+            and (keys[2] not in self.STRUCTURAL_PARAMETERS)
+            and (
+                not self._has_archetype_reference(data=archetype_data[keys[2]])
+            )
+        )
+        if is_value_patched is False:
+            self._reset_boundaries()
+            return self._get_dependent_modules(
+                categories=self.COLLECTION_CATEGORIES["boundaries"]
+            )
+        parameter_name: str = keys[2]
+        for element_object, parameter_names in self._archetype_objects.get(
+            (archetype_type, keys[1]), []
+        ):
+            # Values defined by the object itself override the archetype
+            if parameter_name in parameter_names:
+                continue
+            setattr(
+                element_object,
+                parameter_name,
+                self.create_element_object(
+                    element_data=archetype_data[parameter_name]
+                ),
+            )
+        return self._get_dependent_modules(
+            categories=self.COLLECTION_CATEGORIES["boundaries"],
+            parameter_name=parameter_name,
+        )
+
+    def _has_archetype_reference(self, data: Any) -> bool:
+        # True if the data contains objects defined by an archetype
+        if isinstance(data, dict):
+            return ((TYPE in data) and (TYPE_ID in data)) or any(
+                self._has_archetype_reference(data=value)
+                for value in data.values()
+            )
+        if isinstance(data, list):
+            return any(
+                self._has_archetype_reference(data=value) for value in data
+            )
+        return False
+
+    def _reset_spaces(self) -> None:
+        # Spaces (and boundaries, which are linked to them) are created
+        # again if they had already been created
+        were_spaces_created: bool = self._spaces is not None
+        self._spaces = None
+        self._reset_boundaries()
+        if were_spaces_created is True:
+            _ = self.spaces
+
+    def _reset_boundaries(self) -> None:
+        # Boundaries are created again if they had already been created
+        were_boundaries_created: bool = self._boundaries is not None
+        self._boundaries = None
+        self._archetype_objects = dict()
+        for space in self._spaces or []:
+            space.boundaries = []
+        if were_boundaries_created is True:
+            _ = self.boundaries
+
+    def _get_dependent_modules(
+        self,
+        categories: Optional[Tuple[ColibriProjectObjects, ...]] = None,
+        parameter_name: Optional[str] = None,
+    ) -> Set[Module]:
+        # Modules requiring the given parameter (any parameter if None) of
+        # the given project objects' categories (all modules if None)
+        if self.project is None:
+            return set()
+        modules: Set[Module] = set()
+        for module in self.project.modules:
+            if module is self:
+                continue
+            if categories is None:
+                modules.add(module)
+                continue
+            for parameter in module.parameters:
+                if (
+                    turn_format_to_string(field_format=parameter.format)
+                    != PROJECT_DATA
+                ):
+                    continue
+                if any(
+                    (required_parameter.attached_to is not None)
+                    and (required_parameter.attached_to.category in categories)
+                    and (
+                        (parameter_name is None)
+                        or (required_parameter.name == parameter_name)
+                    )
+                    for required_parameter in parameter.required or []
+                ):
+                    modules.add(module)
+        return modules
+
     def initialize(self) -> bool:
         return True
 
@@ -137,10 +581,86 @@ class ProjectData(Module):
         --------
         >>> None
         """
+        if self.stream is True:
+            with JsonStream(file_path=self.project_file) as json_stream:
+                project_data: dict = json_stream.read(
+                    skipped_keys=list(self.STREAMED_COLLECTIONS.values())
+                )
+            # Streamed collections are read from their position later on
+            self._streamed_positions = json_stream.skipped_positions
+            return project_data
         with open(self.project_file, "r") as _file_descriptor:
             project_data: dict = json.load(_file_descriptor)
         return project_data
 
+    def iter_collection(
+        self, collection_name: str
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over the items of a collection of the project data
+        (read one by one from the project file if it is streamed)
+
+        Parameters
+        ----------
+        collection_name : str
+            Name of the collection ("spaces" or "boundaries")
+
+        Returns
+        -------
+        Iterator[Tuple[str, Dict[str, Any]]]
+            Items (name, data) of the collection
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        keys: Tuple[str, ...] = self.STREAMED_COLLECTIONS[collection_name]
+        if self.stream is True:
+            if keys not in self._streamed_positions:
+                return
+            with JsonStream(file_path=self.project_file) as json_stream:
+                yield from json_stream.iter_items_at(
+                    position=self._streamed_positions[keys]
+                )
+            return
+        collection: Dict[str, Any] = self.project_data
+        for key in keys:
+            collection = collection.get(key, dict())
+        yield from collection.items()
+
+    def resolve_array_reference(self, value: Any) -> Any:
+        """Return the array referenced by the value if it is a reference
+        to an external array file (relative paths are relative to the
+        project file's directory), the value itself otherwise
+
+        Parameters
+        ----------
+        value : Any
+            Value of a parameter from the project/simulation/input data
+
+        Returns
+        -------
+        Any
+            Referenced array or value itself
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        if is_array_reference(value=value) is False:
+            return value
+        directory: Optional[Path] = (
+            self.project_file.parent if self.project_file else None
+        )
+        return load_array_reference(array_reference=value, directory=directory)
+
     def get_spaces(self) -> List[Space]:
         """Get spaces from the project/simulation/input data
 
@@ -158,13 +678,17 @@ class ProjectData(Module):
         >>> None
         """
         spaces: List[Space] = []
-        space_collection: List[dict] = self.project_data[PROJECT][
-            NODE_COLLECTION
-        ][SPACE_COLLECTION]
-        for space_name, space_data in space_collection.items():
+        for space_name, space_data in self.iter_collection(
+            collection_name="spaces"
+        ):
             space: Space = create_class_instance(
                 class_name=SPACE,
-                class_parameters=space_data,
+                class_parameters={
+                    parameter_name: self.resolve_array_reference(
+                        value=parameter_value
+                    )
+                    for parameter_name, parameter_value in space_data.items()
+                },
                 output_type=ColibriObjectTypes.PROJECT_OBJECT,
             )
             spaces.append(space)
@@ -187,13 +711,17 @@ class ProjectData(Module):
         >>> None
         """
         boundaries: List[Boundary] = []
-        boundary_collection: Dict[str, Dict[str, Any]] = self.project_data[
-            PROJECT
-        ].get(BOUNDARY_COLLECTION, dict())
-        for boundary_name, boundary_data in boundary_collection.items():
-            segments_data: Dict[str, Any] = boundary_data.pop(SEGMENTS, [])
+        for boundary_name, boundary_data in self.iter_collection(
+            collection_name="boundaries"
+        ):
+            # Project data is left untouched so that objects can be rebuilt
+            segments_data: Dict[str, Any] = boundary_data.get(SEGMENTS, [])
             boundary: Boundary = self.create_element_object(
-                element_data=boundary_data,
+                element_data={
+                    parameter_name: parameter_value
+                    for parameter_name, parameter_value in boundary_data.items()
+                    if parameter_name != SEGMENTS
+                },
                 class_signature=Boundary,
             )
             boundary.segments = self.get_segments(
@@ -219,10 +747,14 @@ class ProjectData(Module):
     ) -> List[Segment]:
         segments: List[Segment] = []
         for segment_data in segments_data:
-            junction_data: Dict[str, Any] = segment_data.pop(JUNCTION, [])
+            junction_data: Dict[str, Any] = segment_data.get(JUNCTION, [])
             segment: Segment = create_class_instance(
                 class_name=Segment.__name__,
-                class_parameters=segment_data,
+                class_parameters={
+                    parameter_name: parameter_value
+                    for parameter_name, parameter_value in segment_data.items()
+                    if parameter_name != JUNCTION
+                },
                 output_type=ColibriObjectTypes.PROJECT_OBJECT,
             )
             if junction_data is not None:
@@ -263,6 +795,9 @@ class ProjectData(Module):
         class_signature: Optional[Type] = None,
         parameter_name: Optional[str] = None,
     ):
+        # Reference to an external array file
+        if is_array_reference(value=element_data) is True:
+            return self.resolve_array_reference(value=element_data)
         # Object collection
         is_element_data_list: bool = isinstance(element_data, list)
         # Object
@@ -300,26 +835,33 @@ class ProjectData(Module):
             ):
                 class_signature: Type = ElementObject
             if class_signature.__name__ == ElementObject.__name__:
-                return class_signature.create_instance(
+                element_object: Any = class_signature.create_instance(
                     class_name=class_name,
                     fields={
-                        parameter_name: self.create_element_object(
-                            element_data=parameter_value
+                        field_name: self.create_element_object(
+                            element_data=field_value
                         )
-                        for parameter_name, parameter_value in class_parameters.items()
+                        for field_name, field_value in class_parameters.items()
                     },
                 )
-            if class_signature.__name__ == BoundaryObject.__name__:
-                return class_signature(**class_parameters)
-            return class_signature(
-                **{
-                    parameter_name: self.create_element_object(
-                        element_data=parameter_value,
-                        parameter_name=parameter_name,
-                    )
-                    for parameter_name, parameter_value in class_parameters.items()
-                }
-            )
+            elif class_signature.__name__ == BoundaryObject.__name__:
+                element_object: Any = class_signature(**class_parameters)
+            else:
+                element_object: Any = class_signature(
+                    **{
+                        field_name: self.create_element_object(
+                            element_data=field_value,
+                            parameter_name=field_name,
+                        )
+                        for field_name, field_value in class_parameters.items()
+                    }
+                )
+            # Keep track of the objects built from each archetype
+            # (with their own data) to be able to patch them
+            self._archetype_objects.setdefault(
+                (element_data[TYPE], element_data[TYPE_ID]), []
+            ).append((element_object, frozenset(element_data)))
+            return element_object
         if (
             is_element_data_dict
             and (not does_element_have_archetype)
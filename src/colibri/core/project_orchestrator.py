@@ -9,9 +9,6 @@ import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple, Type, Union
 
-from matplotlib import pyplot as plt
-from matplotlib.pyplot import Figure
-
 from colibri.config.constants import (
     ARCHETYPES,
     ATTACHED_TO,
@@ -44,6 +41,7 @@ from colibri.project_objects import (
     Segment,
     Space,
 )
+from colibri.utils.cache_utils import SCHEME_CACHE
 from colibri.utils.class_utils import (
     create_class_instance,
     get_class,
@@ -60,8 +58,22 @@ from colibri.utils.exceptions_utils import InitializationError, LinkError
 from colibri.utils.plot_utils import Plot
 
 if TYPE_CHECKING:
+    from matplotlib.pyplot import Figure
+
     from colibri.interfaces.module import Module
 
+# Structure objects described by every scheme
+PROJECT_OBJECT_CLASSES: List[Type[StructureObject]] = [
+    Boundary,
+    BoundaryCondition,
+    Building,
+    LinearJunction,
+    PunctualJunction,
+    Project,
+    Segment,
+    Space,
+]
+
 
 @dataclass
 class ProjectOrchestrator:
@@ -298,6 +310,9 @@ class ProjectOrchestrator:
         """
         # Plot only if there is at least one variable to be plotted
         if self._plots:
+            # Imported here as matplotlib is slow to import
+            from matplotlib import pyplot as plt
+
             # Create the figure to add plots onto it
             figure: Figure = plt.figure(figsize=(10, len(self._plots) * 2))
             location: int = len(self._plots) * 100 + 11
@@ -401,6 +416,27 @@ class ProjectOrchestrator:
         --------
         >>> None
         """
+        # Generated schemes are cached (by modules and source code)
+        scheme_classes: List[Type] = [
+            get_class(
+                class_name=module_name,
+                output_type=ColibriObjectTypes.MODULE,
+            )
+            for module_name in modules
+        ] + [Archetype, BoundaryObject, ElementObject, *PROJECT_OBJECT_CLASSES]
+        key: str = SCHEME_CACHE.get_key(modules=modules, classes=scheme_classes)
+        scheme: Union[Dict[str, Any], None] = SCHEME_CACHE.get(key=key)
+        if scheme is None:
+            # The scheme is returned as cached (serialized then loaded), as
+            # when it is found in the cache
+            SCHEME_CACHE.set(
+                key=key, scheme=cls._create_scheme(modules=modules)
+            )
+            scheme = SCHEME_CACHE.get(key=key)
+        return scheme
+
+    @classmethod
+    def _create_scheme(cls, modules: List[str]) -> Dict[str, Any]:
         # Define categories
         archetype_category: str = Archetype.__name__
         element_object_category: str = ElementObject.__name__
@@ -485,16 +521,7 @@ class ProjectOrchestrator:
     def _set_project_objects_base_scheme(
         cls, scheme: Dict[str, Dict[str, Any]], structure_object_category: str
     ) -> None:
-        for project_object_class in [
-            Boundary,
-            BoundaryCondition,
-            Building,
-            LinearJunction,
-            PunctualJunction,
-            Project,
-            Segment,
-            Space,
-        ]:
+        for project_object_class in PROJECT_OBJECT_CLASSES:
             temporary_class_name: str = project_object_class.__name__
             temporary_scheme: Dict[str, Any] = project_object_class.to_scheme()
             scheme[structure_object_category][temporary_class_name] = {
@@ -790,13 +817,16 @@ class ProjectOrchestrator:
         >>> None
         """
         for module in self.modules:
-            parameters: List[Parameter] = module.parameters
+            parameters: Tuple[Parameter, ...] = module.parameters
             for parameter in parameters:
                 parameter_format: str = turn_format_to_string(
                     field_format=parameter.format
                 )
                 if parameter_format == ProjectData.__name__:
                     setattr(module, parameter.name, self.project_data)
+        # Only create the project data's collections needed by the modules
+        if isinstance(self.project_data, ProjectData):
+            self.project_data.load_required_collections(modules=self.modules)
 
     def _set_intrinsic_modules_parameters_value(self) -> None:
         """Set the value for each intrinsic parameter
@@ -827,7 +857,13 @@ class ProjectOrchestrator:
                 module_parameter_name,
                 module_parameter_value,
             ) in module_parameters.items():
-                setattr(module, module_parameter_name, module_parameter_value)
+                setattr(
+                    module,
+                    module_parameter_name,
+                    self.project_data.resolve_array_reference(
+                        value=module_parameter_value
+                    ),
+                )
 
     def _initialize_module_output_series(self) -> None:
         """Create a variable for each output of each module to store results at
@@ -0,0 +1,558 @@
+"""
+ProjectValidator class that checks a whole project file against the
+scheme of its modules for the `colibri` package.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from colibri.config.constants import (
+    ARCHETYPE_COLLECTION,
+    BOUNDARY,
+    BOUNDARY_COLLECTION,
+    CHOICES,
+    DEFAULT,
+    FORMAT,
+    MAX,
+    MIN,
+    MODULE_COLLECTION,
+    NODE_COLLECTION,
+    OBJECT_COLLECTION,
+    PARAMETERS,
+    PROJECT,
+    REQUIRED,
+    SEGMENT,
+    SEGMENTS,
+    SPACE,
+    SPACE_COLLECTION,
+    TYPE,
+    TYPE_ID,
+)
+from colibri.core import ProjectOrchestrator
+from colibri.utils.data_utils import (
+    is_array_reference,
+    load_array_reference,
+)
+from colibri.utils.exceptions_utils import UserInputError
+
+# Python types accepted for each scalar format of the scheme (floats of
+# an "int" field must also be whole numbers)
+SCALAR_FORMATS: Dict[str, Tuple[Type, ...]] = {
+    "bool": (bool,),
+    "float": (int, float, np.integer, np.floating),
+    "int": (int, float, np.integer, np.floating),
+    "str": (str,),
+}
+# Scalar formats of numbers, which can also be given as time series or
+# values per object id (collections checked on their own)
+NUMBER_FORMATS: Tuple[str, ...] = ("float", "int")
+NUMBER_COLLECTION_TYPES: Tuple[Type, ...] = (list, tuple, dict, np.ndarray)
+# Prefixes of the collection formats of the scheme
+COLLECTION_FORMATS: Dict[str, Tuple[Type, ...]] = {
+    "Dict": (dict,),
+    "List": (list, tuple, np.ndarray),
+    "Tuple": (list, tuple, np.ndarray),
+}
+
+
+@dataclass
+class FieldRule:
+    """Compiled validation rule of a field."""
+
+    name: str
+    format: str
+    min: Optional[float] = None
+    max: Optional[float] = None
+    choices: Optional[List[Any]] = None
+    required: bool = False
+
+    @property
+    def is_numeric(self) -> bool:
+        """Return True if the field's values are numbers
+        (scalar or list of numbers), False otherwise"""
+        return (self.min is not None) or (self.max is not None)
+
+    @classmethod
+    def from_scheme(
+        cls, name: str, field_scheme: Dict[str, Any], required: bool = False
+    ) -> FieldRule:
+        """Compile the rule of a field from its scheme
+
+        Parameters
+        ----------
+        name : str
+            Name of the field
+        field_scheme : Dict[str, Any]
+            Scheme of the field
+        required : bool = False
+            True if the field must be given in the project file
+
+        Returns
+        -------
+        FieldRule
+            Compiled rule of the field
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        return cls(
+            name=name,
+            format=field_scheme.get(FORMAT) or "",
+            min=cls._to_float(limit=field_scheme.get(MIN)),
+            max=cls._to_float(limit=field_scheme.get(MAX)),
+            choices=field_scheme.get(CHOICES),
+            required=required,
+        )
+
+    @staticmethod
+    def _to_float(limit: Any) -> Optional[float]:
+        # Limits are serialized in the scheme ("inf" for float("inf"))
+        if limit is None:
+            return None
+        limit = float(limit)
+        return None if math.isinf(limit) is True else limit
+
+    @staticmethod
+    def _contains_numbers(value: Any, integers: bool = False) -> bool:
+        # Time series (possibly nested) or values per object id, only whole
+        # numbers for integers
+        if isinstance(value, dict) is True:
+            value = list(value.values())
+        try:
+            array: np.ndarray = np.asarray(value)
+        except ValueError:
+            return False
+        if array.size == 0:
+            return True
+        if array.dtype.kind == "f":
+            return (integers is False) or bool(
+                np.all(np.isfinite(array) & (np.mod(array, 1) == 0))
+            )
+        return array.dtype.kind in "iu"
+
+    def check_type(self, value: Any, path: str) -> List[str]:
+        """Check the type (and choices) of a value
+
+        Parameters
+        ----------
+        value : Any
+            Value of the field
+        path : str
+            Path of the value inside the project file
+
+        Returns
+        -------
+        errors : List[str]
+            Errors found for the value
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        if (value is None) and (self.is_numeric is True):
+            return [
+                f"{path} cannot be None if its limits are defined: "
+                f"[{self.min}, {self.max}]."
+            ]
+        if value is None:
+            return []
+        if (self.choices is not None) and (value not in self.choices):
+            return [f"{path} must be one of {self.choices}, not {value!r}."]
+        expected_types: Tuple[Type, ...] = SCALAR_FORMATS.get(
+            self.format,
+            COLLECTION_FORMATS.get(self.format.split("[")[0], (object,)),
+        )
+        if is_array_reference(value=value) is True:
+            expected_types = (dict,)
+        elif (self.format in NUMBER_FORMATS) and isinstance(
+            value, NUMBER_COLLECTION_TYPES
+        ):
+            integers: bool = self.format == "int"
+            if self._contains_numbers(value=value, integers=integers) is False:
+                numbers: str = "whole numbers" if integers else "numbers"
+                return [f"{path} must only contain {numbers}."]
+            return []
+        is_boolean_number: bool = isinstance(value, bool) and (
+            bool not in expected_types
+        )
+        if (isinstance(value, expected_types) is False) or is_boolean_number:
+            return [
+                f"{path} must be of format {self.format}, "
+                f"not {type(value).__name__}."
+            ]
+        if (
+            (self.format == "int")
+            and isinstance(value, (float, np.floating))
+            and (float(value).is_integer() is False)
+        ):
+            return [f"{path} must be a whole number, not {value!r}."]
+        return []
+
+    def check_range(self, values: np.ndarray, paths: List[str]) -> List[str]:
+        """Check the limits of numerical values at once
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values of the field (one row per path)
+        paths : List[str]
+            Paths of the values inside the project file
+
+        Returns
+        -------
+        errors : List[str]
+            Errors found for the values
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        errors: List[str] = []
+        for limit, is_out_of_range, message in (
+            (self.min, np.less, "below its minimum value of"),
+            (self.max, np.greater, "above its maximum value of"),
+        ):
+            if limit is None:
+                continue
+            out_of_range: np.ndarray = is_out_of_range(values, limit)
+            if out_of_range.ndim > 1:
+                out_of_range = out_of_range.reshape(len(paths), -1).any(axis=1)
+            for index in np.flatnonzero(out_of_range):
+                errors.append(f"{paths[index]} is {message} {limit}.")
+        return errors
+
+
+class ProjectValidator:
+    """Class checking a whole project file (dict) against the scheme
+    of its modules before any project object is created."""
+
+    def __init__(self, modules: List[str]) -> None:
+        """Initialize a new ProjectValidator instance
+
+        Parameters
+        ----------
+        modules : List[str]
+            Names of the modules of the project
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ColibriModuleNotFoundError
+            If a module does not exist
+
+        Examples
+        --------
+        >>> validator = ProjectValidator(modules=["OccupantModel"])
+        >>> validator.validate(project_data={"project": {}})
+        []
+        """
+        self.modules = modules
+        self.rules: Dict[str, Dict[str, FieldRule]] = self._compile_rules(
+            scheme=ProjectOrchestrator.generate_scheme(modules=modules)
+        )
+
+    @staticmethod
+    def _compile_rules(
+        scheme: Dict[str, Any],
+    ) -> Dict[str, Dict[str, FieldRule]]:
+        # Rules are grouped by object name (e.g. "Boundary" gathers the
+        # structure object and the archetype parameters). Fields required
+        # by the modules (their scheme has a "required" entry) must be
+        # given if they have no default value
+        rules: Dict[str, Dict[str, FieldRule]] = dict()
+        for category_scheme in scheme.values():
+            for object_name, object_scheme in category_scheme.items():
+                if PARAMETERS not in object_scheme:
+                    continue
+                object_rules: Dict[str, FieldRule] = rules.setdefault(
+                    object_name, dict()
+                )
+                for field_name, field_scheme in object_scheme[
+                    PARAMETERS
+                ].items():
+                    object_rules[field_name] = FieldRule.from_scheme(
+                        name=field_name,
+                        field_scheme=field_scheme,
+                        required=(REQUIRED in field_scheme)
+                        and (field_scheme.get(DEFAULT) is None),
+                    )
+        return rules
+
+    def validate(
+        self, project_data: Dict[str, Any], directory: Optional[Path] = None
+    ) -> List[str]:
+        """Check a whole project file and return all errors found
+
+        Parameters
+        ----------
+        project_data : Dict[str, Any]
+            Project/simulation/input data
+        directory : Optional[Path] = None
+            Directory used to resolve relative array file paths
+
+        Returns
+        -------
+        errors : List[str]
+            Errors found in the project file (empty if it is valid)
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        project: Dict[str, Any] = project_data.get(PROJECT, dict())
+        archetypes: Dict[str, Any] = project.get(ARCHETYPE_COLLECTION, dict())
+        errors: List[str] = []
+        # Values of each field are gathered so that their limits are
+        # checked at once, for all objects
+        values: Dict[Tuple[str, str], List[Tuple[str, Any]]] = dict()
+        # (object name, path, data, True if its values can be defined
+        # by an archetype)
+        objects: List[Tuple[str, str, Dict[str, Any], bool]] = []
+        for space_id, space_data in (
+            project.get(NODE_COLLECTION, dict())
+            .get(SPACE_COLLECTION, dict())
+            .items()
+        ):
+            objects.append(
+                (
+                    SPACE,
+                    f"{PROJECT}/{NODE_COLLECTION}/{SPACE_COLLECTION}/"
+                    f"{space_id}",
+                    space_data,
+                    False,
+                )
+            )
+        for boundary_id, boundary_data in project.get(
+            BOUNDARY_COLLECTION, dict()
+        ).items():
+            boundary_path: str = (
+                f"{PROJECT}/{BOUNDARY_COLLECTION}/{boundary_id}"
+            )
+            objects.append(
+                (BOUNDARY.capitalize(), boundary_path, boundary_data, True)
+            )
+            for index, segment_data in enumerate(
+                boundary_data.get(SEGMENTS) or []
+            ):
+                objects.append(
+                    (
+                        SEGMENT.capitalize(),
+                        f"{boundary_path}/{SEGMENTS}/{index}",
+                        segment_data,
+                        False,
+                    )
+                )
+            for index, object_data in enumerate(
+                boundary_data.get(OBJECT_COLLECTION) or []
+            ):
+                objects.append(
+                    (
+                        str(object_data.get(TYPE, "")).capitalize(),
+                        f"{boundary_path}/{OBJECT_COLLECTION}/{index}",
+                        object_data,
+                        True,
+                    )
+                )
+        for archetype_key, archetype_collection in archetypes.items():
+            object_name: str = archetype_key.removesuffix(f"_{TYPE}s")
+            for archetype_id, archetype_data in archetype_collection.items():
+                objects.append(
+                    (
+                        object_name.capitalize(),
+                        f"{PROJECT}/{ARCHETYPE_COLLECTION}/"
+                        f"{archetype_key}/{archetype_id}",
+                        archetype_data,
+                        False,
+                    )
+                )
+        for module_name, module_parameters in project.get(
+            MODULE_COLLECTION, dict()
+        ).items():
+            if module_name not in self.modules:
+                errors.append(
+                    f"{PROJECT}/{MODULE_COLLECTION}/{module_name} is not "
+                    f"among the validated modules {self.modules}."
+                )
+                continue
+            objects.append(
+                (
+                    module_name,
+                    f"{PROJECT}/{MODULE_COLLECTION}/{module_name}",
+                    module_parameters,
+                    False,
+                )
+            )
+        for object_name, object_path, object_data, has_archetype in objects:
+            errors.extend(
+                self._check_object(
+                    object_name=object_name,
+                    object_path=object_path,
+                    object_data=object_data,
+                    archetypes=archetypes if has_archetype is True else None,
+                    values=values,
+                )
+            )
+        errors.extend(self._check_ranges(values=values, directory=directory))
+        return errors
+
+    def check(
+        self, project_data: Dict[str, Any], directory: Optional[Path] = None
+    ) -> None:
+        """Check a whole project file and raise an error listing all
+        errors found
+
+        Parameters
+        ----------
+        project_data : Dict[str, Any]
+            Project/simulation/input data
+        directory : Optional[Path] = None
+            Directory used to resolve relative array file paths
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        UserInputError
+            If the project file is not valid
+
+        Examples
+        --------
+        >>> None
+        """
+        errors: List[str] = self.validate(
+            project_data=project_data, directory=directory
+        )
+        if errors:
+            raise UserInputError(
+                f"{len(errors)} error(s) found in the project file:\n- "
+                + "\n- ".join(errors)
+            )
+
+    def _check_object(
+        self,
+        object_name: str,
+        object_path: str,
+        object_data: Dict[str, Any],
+        archetypes: Optional[Dict[str, Any]],
+        values: Dict[Tuple[str, str], List[Tuple[str, Any]]],
+    ) -> List[str]:
+        object_rules: Optional[Dict[str, FieldRule]] = self.rules.get(
+            object_name
+        )
+        if object_rules is None:
+            return []
+        if isinstance(object_data, dict) is False:
+            return [f"{object_path} must be of format dict."]
+        errors: List[str] = []
+        # Values of an object can be defined by its archetype
+        archetype_data: Dict[str, Any] = dict()
+        archetype_type: Any = object_data.get(TYPE)
+        archetype_type_id: Any = object_data.get(TYPE_ID)
+        if (
+            (archetypes is not None)
+            and (archetype_type is not None)
+            and (archetype_type_id is not None)
+        ):
+            archetype_data = archetypes.get(
+                f"{archetype_type}_{TYPE}s", dict()
+            ).get(archetype_type_id)
+            if archetype_data is None:
+                errors.append(
+                    f"{object_path} refers to an unknown archetype "
+                    f"{archetype_type}/{archetype_type_id}."
+                )
+                archetype_data = dict()
+        for field_name, rule in object_rules.items():
+            if (
+                (rule.required is True)
+                and (field_name not in object_data)
+                and (field_name not in archetype_data)
+            ):
+                errors.append(f"{object_path}/{field_name} is required.")
+            if field_name not in object_data:
+                continue
+            value: Any = object_data[field_name]
+            path: str = f"{object_path}/{field_name}"
+            type_errors: List[str] = rule.check_type(value=value, path=path)
+            errors.extend(type_errors)
+            if (not type_errors) and (value is not None) and rule.is_numeric:
+                values.setdefault((object_name, field_name), []).append(
+                    (path, value)
+                )
+        return errors
+
+    def _check_ranges(
+        self,
+        values: Dict[Tuple[str, str], List[Tuple[str, Any]]],
+        directory: Optional[Path] = None,
+    ) -> List[str]:
+        errors: List[str] = []
+        for (object_name, field_name), field_values in values.items():
+            rule: FieldRule = self.rules[object_name][field_name]
+            scalar_paths: List[str] = []
+            scalar_values: List[Any] = []
+            for path, value in field_values:
+                if isinstance(value, (int, float)) is True:
+                    scalar_paths.append(path)
+                    scalar_values.append(value)
+                    continue
+                # Collections (or arrays) are checked on their own
+                if is_array_reference(value=value) is True:
+                    try:
+                        value = load_array_reference(
+                            array_reference=value, directory=directory
+                        )
+                    except FileNotFoundError as error:
+                        errors.append(f"{path}: {error}")
+                        continue
+                errors.extend(
+                    self._check_array_range(rule=rule, value=value, path=path)
+                )
+            if scalar_values:
+                errors.extend(
+                    rule.check_range(
+                        values=np.asarray(scalar_values, dtype=float),
+                        paths=scalar_paths,
+                    )
+                )
+        return errors
+
+    @staticmethod
+    def _check_array_range(rule: FieldRule, value: Any, path: str) -> List[str]:
+        if isinstance(value, dict) is True:
+            value = list(value.values())
+        try:
+            array: np.ndarray = np.asarray(value, dtype=float)
+        except (TypeError, ValueError):
+            return [f"{path} must only contain numbers."]
+        if array.size == 0:
+            return []
+        return rule.check_range(values=array.reshape(1, -1), paths=[path])
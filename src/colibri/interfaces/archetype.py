@@ -12,6 +12,8 @@ from colibri.utils.enums_utils import Units
 class Archetype(ClassMixin, MetaFieldMixin):
     """Class representing a archetype object."""
 
+    SHARE_FIELDS_METADATA: bool = True
+
     TYPE: str = "archetype"
     DESCRIPTION: str = (
         "An archetype groups objects' properties together to be reusable."
@@ -12,7 +12,6 @@ from colibri.config.constants import SERIES_EXTENSION_NAME
 from colibri.core.fields import Field
 from colibri.core.link import Link
 from colibri.mixins import ClassMixin, MetaFieldMixin
-from colibri.utils.enums_utils import Roles
 
 if TYPE_CHECKING:
     from colibri.core.project_orchestrator import ProjectOrchestrator
@@ -92,7 +91,7 @@ class Module(ClassMixin, MetaFieldMixin):
         --------
         >>> None
         """
-        for field in self.get_fields(role=Roles.OUTPUTS):
+        for field in self.outputs:
             getattr(self, f"{field.name}{SERIES_EXTENSION_NAME}")[time_step] = (
                 copy.deepcopy(getattr(self, field.name))
             )
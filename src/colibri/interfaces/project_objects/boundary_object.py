@@ -13,6 +13,8 @@ class BoundaryObject(ClassMixin, MetaFieldMixin):
     """Class representing a boundary object, that is,
     a project object which is associated to a boundary."""
 
+    SHARE_FIELDS_METADATA: bool = True
+
     TYPE: str = "boundary_object"
     DESCRIPTION: str = "A boundary object is an object attached to a boundary."
 
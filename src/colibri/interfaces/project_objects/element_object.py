@@ -5,7 +5,7 @@ ElementObject class, which is the parent class of each element object
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from colibri.config.constants import SLOTS
 from colibri.mixins import ClassMixin, MetaFieldMixin
@@ -15,6 +15,9 @@ class ElementObject(ClassMixin, MetaFieldMixin):
     """Class representing an element object, that is,
     a project object associated to a boundary object."""
 
+    # Classes created by create_instance, by (class name, field names)
+    _generated_classes: Dict[Tuple[str, Tuple[str, ...]], type] = dict()
+
     def __init__(self, **kwargs):
         """Initialize a new ElementObject instance."""
         super().__init__()
@@ -47,15 +50,51 @@ class ElementObject(ClassMixin, MetaFieldMixin):
         --------
         >>> None
         """
-        attribute_names: Dict[str, List[str]] = {
-            SLOTS: [field for field in fields]
-        }
-        new_class: type = type(
-            class_name.capitalize(), (ElementObject,), attribute_names
+        new_class: type = cls.get_generated_class(
+            class_name=class_name, field_names=list(fields)
         )
         new_instance: ElementObject = new_class(**fields)
         return new_instance
 
+    @classmethod
+    def get_generated_class(
+        cls, class_name: str, field_names: List[str]
+    ) -> type:
+        """Return the class (given its name) inheriting from the
+        ElementObject class for the given fields, classes are created once
+        and shared by all instances with the same name and fields
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class
+        field_names : List[str]
+            Names of the fields of the class
+
+        Returns
+        -------
+        type
+            Class inheriting from the ElementObject class
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        key: Tuple[str, Tuple[str, ...]] = (
+            class_name.capitalize(),
+            tuple(sorted(field_names)),
+        )
+        new_class: type | None = ElementObject._generated_classes.get(key)
+        if new_class is None:
+            attribute_names: Dict[str, List[str]] = {SLOTS: list(key[1])}
+            new_class = type(key[0], (ElementObject,), attribute_names)
+            ElementObject._generated_classes[key] = new_class
+        return new_class
+
 
 if __name__ == "__main__":
     from colibri.config.constants import LOGGER
@@ -10,6 +10,8 @@ class StructureObject(ClassMixin, MetaFieldMixin):
     """Class representing a structure object, that is,
     a project object which structures the project."""
 
+    SHARE_FIELDS_METADATA: bool = True
+
     def __init__(self) -> None:
         """Initialize a new StructureObject instance."""
         super().__init__()
@@ -6,7 +6,7 @@ related to fields' metadata for the `colibri` package.
 from __future__ import annotations
 
 from inspect import FullArgSpec, getfullargspec
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from colibri.config.constants import (
     ARCHETYPES,
@@ -18,6 +18,8 @@ from colibri.config.constants import (
     FORMAT,
     PROJECT_DATA,
     REQUIRED,
+    SHARED_FIELDS_BY_ROLE,
+    SHARED_FIELDS_METADATA,
     TYPE,
 )
 from colibri.core.fields import (
@@ -45,9 +47,67 @@ if TYPE_CHECKING:
 class MetaFieldMixin:
     """Class providing functionalities related to fields' metadata."""
 
+    # If True, fields' metadata is defined once per class and shared by all
+    # its instances, which only keep their own values
+    SHARE_FIELDS_METADATA: bool = False
+
     def __init__(self) -> None:
         """Initialize a new MetaFieldMixin instance."""
-        self._fields_metadata: Dict[str, Field] = dict()
+        if (self.SHARE_FIELDS_METADATA is True) and (
+            type(self).get_shared_fields_metadata() is not None
+        ):
+            self._fields_metadata: Dict[str, Field] = type(self).__dict__[
+                SHARED_FIELDS_METADATA
+            ]
+            self._fields_by_role: Dict[Roles, Tuple[Field, ...]] = type(
+                self
+            ).__dict__[SHARED_FIELDS_BY_ROLE]
+            return
+        self._fields_metadata = dict()
+        # Fields indexed by role (in their definition order), as tuples
+        # since they are returned as is by inputs, outputs and parameters
+        self._fields_by_role = {role: () for role in Roles}
+
+    @classmethod
+    def get_shared_fields_metadata(cls) -> Optional[Dict[str, Field]]:
+        """Get the fields' metadata shared by all instances of the class,
+        defined once from an instance created with None arguments (the same
+        as the one used by to_scheme)
+
+        Returns
+        -------
+        Optional[Dict[str, Field]]
+            Shared fields' metadata, None if it can not be defined
+            (each instance then keeps its own fields' metadata)
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        if SHARED_FIELDS_METADATA in cls.__dict__:
+            return cls.__dict__[SHARED_FIELDS_METADATA]
+        # The instance created below keeps its own fields' metadata
+        setattr(cls, SHARED_FIELDS_METADATA, None)
+        try:
+            instance: MetaFieldMixin = cls._create_template_instance()
+        except Exception:
+            return None
+        setattr(cls, SHARED_FIELDS_BY_ROLE, instance._fields_by_role)
+        setattr(cls, SHARED_FIELDS_METADATA, instance._fields_metadata)
+        return instance._fields_metadata
+
+    @classmethod
+    def _create_template_instance(cls) -> MetaFieldMixin:
+        # Instance whose arguments are all None, describing the fields
+        model_metadata: FullArgSpec = getfullargspec(cls.__init__)
+        instance: MetaFieldMixin = cls(
+            **{name: None for name in model_metadata.args[1:]}
+        )
+        return instance
 
     def define_parameter(
         self,
@@ -289,13 +349,41 @@ class MetaFieldMixin:
         --------
         >>> None
         """
+        if self._is_shared_field(
+            name=name,
+            role=role,
+            unit=unit,
+            description=description,
+            format=format,
+            min=min,
+            max=max,
+            attached_to=attached_to,
+            required=required,
+        ):
+            return default_value
         linked_to: List[Field] = list()
         model: Optional[Module] = None
         check_convergence: bool = False
         convergence_tolerance: float = 0.1
         maximum_number_of_iterations: int = 10
         if role is Roles.PARAMETERS:
-            self._fields_metadata[name] = Parameter(
+            self._set_field(
+                field=Parameter(
+                    name=name,
+                    default_value=default_value,
+                    role=role,
+                    unit=unit,
+                    description=description,
+                    format=format,
+                    min=min,
+                    max=max,
+                    attached_to=attached_to,
+                    required=required,
+                )
+            )
+            return default_value
+        self._set_field(
+            field=SimulationVariable(
                 name=name,
                 default_value=default_value,
                 role=role,
@@ -304,36 +392,84 @@ class MetaFieldMixin:
                 format=format,
                 min=min,
                 max=max,
+                linked_to=linked_to,
+                model=model,
+                check_convergence=check_convergence,
+                convergence_tolerance=convergence_tolerance,
+                maximum_number_of_iterations=maximum_number_of_iterations,
                 attached_to=attached_to,
                 required=required,
             )
-            return default_value
-        self._fields_metadata[name] = SimulationVariable(
-            name=name,
-            default_value=default_value,
-            role=role,
-            unit=unit,
-            description=description,
-            format=format,
-            min=min,
-            max=max,
-            linked_to=linked_to,
-            model=model,
-            check_convergence=check_convergence,
-            convergence_tolerance=convergence_tolerance,
-            maximum_number_of_iterations=maximum_number_of_iterations,
-            attached_to=attached_to,
-            required=required,
         )
         return default_value
 
+    def _set_field(self, field: Field) -> None:
+        # Fields are also indexed by role, the index is rebuilt when an
+        # existing field is redefined (to keep the definition order)
+        previous_field: Optional[Field] = self._fields_metadata.get(field.name)
+        self._fields_metadata[field.name] = field
+        if previous_field is None:
+            self._fields_by_role[field.role] = (
+                *self._fields_by_role[field.role],
+                field,
+            )
+            return
+        self._fields_by_role = {
+            role: tuple(
+                defined_field
+                for defined_field in self._fields_metadata.values()
+                if defined_field.role is role
+            )
+            for role in Roles
+        }
+
+    def _is_shared_field(
+        self,
+        name: str,
+        role: Roles,
+        unit: Units,
+        description: str,
+        format: Any,
+        min: Any,
+        max: Any,
+        attached_to: Optional[Attachment],
+        required: Optional[List[Parameter]],
+    ) -> bool:
+        # Fields' metadata shared by the class is only copied (then owned
+        # by the instance) when the field differs from the shared one (in
+        # anything but its default value, which is the instance's value)
+        shared_fields_metadata: Optional[Dict[str, Field]] = type(
+            self
+        ).__dict__.get(SHARED_FIELDS_METADATA)
+        if (shared_fields_metadata is None) or (
+            self._fields_metadata is not shared_fields_metadata
+        ):
+            return False
+        field: Optional[Field] = shared_fields_metadata.get(name)
+        if (
+            (field is not None)
+            and (field.role is role)
+            and (field.unit is unit)
+            and (field.description == description)
+            and (field.format == format)
+            and (field.min == min)
+            and (field.max == max)
+            and (field.attached_to == attached_to)
+            and (getattr(field, REQUIRED, None) == required)
+        ):
+            return True
+        self._fields_metadata = dict(shared_fields_metadata)
+        self._fields_by_role = dict(self._fields_by_role)
+        return False
+
     @property
-    def inputs(self) -> List[Field]:
-        """Get all field inputs of the model
+    def inputs(self) -> Tuple[Field, ...]:
+        """Get all field inputs of the model (indexed when the fields are
+        defined, shared by the instances of project objects)
 
         Returns
         -------
-        inputs : List[Field]
+        inputs : Tuple[Field, ...]
             All field inputs of the model
 
         Raises
@@ -344,16 +480,17 @@ class MetaFieldMixin:
         --------
         >>> None
         """
-        inputs: List[Field] = self.get_fields(role=Roles.INPUTS)
+        inputs: Tuple[Field, ...] = self._fields_by_role[Roles.INPUTS]
         return inputs
 
     @property
-    def outputs(self) -> List[Field]:
-        """Get all field outputs of the model
+    def outputs(self) -> Tuple[Field, ...]:
+        """Get all field outputs of the model (indexed when the fields are
+        defined, shared by the instances of project objects)
 
         Returns
         -------
-        outputs : List[Field]
+        outputs : Tuple[Field, ...]
             All field outputs of the model
 
         Raises
@@ -364,16 +501,17 @@ class MetaFieldMixin:
         --------
         >>> None
         """
-        outputs: List[Field] = self.get_fields(role=Roles.OUTPUTS)
+        outputs: Tuple[Field, ...] = self._fields_by_role[Roles.OUTPUTS]
         return outputs
 
     @property
-    def parameters(self) -> List[Field]:
-        """Get all field parameters of the model
+    def parameters(self) -> Tuple[Field, ...]:
+        """Get all field parameters of the model (indexed when the fields are
+        defined, shared by the instances of project objects)
 
         Returns
         -------
-        parameters : List[Field]
+        parameters : Tuple[Field, ...]
             All field parameters of the model
 
         Raises
@@ -384,7 +522,7 @@ class MetaFieldMixin:
         --------
         >>> None
         """
-        parameters: List[Field] = self.get_fields(role=Roles.PARAMETERS)
+        parameters: Tuple[Field, ...] = self._fields_by_role[Roles.PARAMETERS]
         return parameters
 
     def get_fields(self, role: Optional[Roles] = None) -> List[Field]:
@@ -409,12 +547,8 @@ class MetaFieldMixin:
         >>> None
         """
         if role:
-            return [
-                field
-                for field in self._fields_metadata.values()
-                if field.role == role
-            ]
-        return [field for field in self._fields_metadata.values()]
+            return list(self._fields_by_role[role])
+        return list(self._fields_metadata.values())
 
     @classmethod
     def to_scheme(cls) -> Dict[str, Any]:
@@ -433,11 +567,7 @@ class MetaFieldMixin:
         --------
         >>> None
         """
-        model_metadata: FullArgSpec = getfullargspec(cls.__init__)
-        required_parameters: List[str] = model_metadata.args[1:]
-        instance: MetaFieldMixin = cls(
-            **{name: None for name in required_parameters}
-        )
+        instance: MetaFieldMixin = cls._create_template_instance()
         module_parameters: Dict[str, Any] = {
             module_parameter.name: module_parameter.to_scheme()
             for module_parameter in instance.parameters
@@ -808,4 +938,6 @@ class MetaFieldMixin:
         # Module needs ProjectData instance "project_data"
         if ProjectData.INSTANCE_NAME in required_parameters:
             parameters.update({ProjectData.INSTANCE_NAME: project_data})
-        return cls(**parameters)
+        instance: MetaFieldMixin = cls(**parameters)
+        project_data.load_required_collections(modules=[instance])
+        return instance
@@ -1,25 +1,84 @@
-from colibri.modules.acvs.acv_exploitation import AcvExploitationOnly
-from colibri.modules.generators.infinite_power_generator import (
-    InfinitePowerGenerator,
-)
-from colibri.modules.generators.limited_generator import LimitedGenerator
-from colibri.modules.occupants.occupant import OccupantModel
-from colibri.modules.thermal_spaces.thermal_space_simplified import (
-    ThermalSpaceSimplified,
-)
-from colibri.modules.wall_losses.layer_wall_losses import LayerWallLosses
-from colibri.modules.wall_losses.simplified_wall_losses import (
-    SimplifiedWallLosses,
-)
-from colibri.modules.weathers.weather_model import WeatherModel
+"""
+COLIBRI's modules, which are imported on first use (e.g. by
+`get_class` or `create_class_instance`).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from colibri.modules.acvs.acv_exploitation import AcvExploitationOnly
+    from colibri.modules.generators.infinite_power_generator import (
+        InfinitePowerGenerator,
+    )
+    from colibri.modules.generators.limited_generator import LimitedGenerator
+    from colibri.modules.occupants.occupant import OccupantModel
+    from colibri.modules.thermal_spaces.thermal_space_rc_network import (
+        ThermalSpaceRcNetwork,
+    )
+    from colibri.modules.thermal_spaces.thermal_space_simplified import (
+        ThermalSpaceSimplified,
+    )
+    from colibri.modules.wall_losses.ctf_wall_losses import CtfWallLosses
+    from colibri.modules.wall_losses.layer_wall_losses import LayerWallLosses
+    from colibri.modules.wall_losses.simplified_wall_losses import (
+        SimplifiedWallLosses,
+    )
+    from colibri.modules.wall_losses.transient_wall_losses import (
+        TransientWallLosses,
+    )
+    from colibri.modules.weathers.weather_model import WeatherModel
+
+# Python module where each COLIBRI's module is defined
+MODULE_PATHS: Dict[str, str] = {
+    "AcvExploitationOnly": "colibri.modules.acvs.acv_exploitation",
+    "CtfWallLosses": "colibri.modules.wall_losses.ctf_wall_losses",
+    "InfinitePowerGenerator": (
+        "colibri.modules.generators.infinite_power_generator"
+    ),
+    "LayerWallLosses": "colibri.modules.wall_losses.layer_wall_losses",
+    "LimitedGenerator": "colibri.modules.generators.limited_generator",
+    "OccupantModel": "colibri.modules.occupants.occupant",
+    "SimplifiedWallLosses": (
+        "colibri.modules.wall_losses.simplified_wall_losses"
+    ),
+    "ThermalSpaceRcNetwork": (
+        "colibri.modules.thermal_spaces.thermal_space_rc_network"
+    ),
+    "ThermalSpaceSimplified": (
+        "colibri.modules.thermal_spaces.thermal_space_simplified"
+    ),
+    "TransientWallLosses": (
+        "colibri.modules.wall_losses.transient_wall_losses"
+    ),
+    "WeatherModel": "colibri.modules.weathers.weather_model",
+}
 
 __all__ = [
     "AcvExploitationOnly",
+    "CtfWallLosses",
     "InfinitePowerGenerator",
     "LayerWallLosses",
     "LimitedGenerator",
     "OccupantModel",
     "SimplifiedWallLosses",
+    "ThermalSpaceRcNetwork",
     "ThermalSpaceSimplified",
+    "TransientWallLosses",
     "WeatherModel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in MODULE_PATHS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_class: Any = getattr(
+        importlib.import_module(MODULE_PATHS[name]), name
+    )
+    # Next accesses do not go through __getattr__
+    globals()[name] = module_class
+    return module_class
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
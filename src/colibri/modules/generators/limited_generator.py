@@ -4,17 +4,25 @@ LimitedGenerator class from Generator interface.
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
 
 from colibri.core import ProjectData
 from colibri.core.fields import Parameter
 from colibri.interfaces.modules.generators import Generator
+from colibri.utils.array_utils import get_space_emitters, get_values
 from colibri.utils.colibri_utils import Attachment
 from colibri.utils.enums_utils import (
     ColibriProjectObjects,
     Units,
 )
 
+if TYPE_CHECKING:
+    from colibri.interfaces import BoundaryObject
+    from colibri.project_objects import Space
+
 
 class LimitedGenerator(Generator):
     """LimitedGenerator class from Generator interface"""
@@ -79,31 +87,42 @@ class LimitedGenerator(Generator):
                 ),
             ],
         )
-
-    def initialize(self) -> bool: ...
+        # Emitters indexed as arrays (see _index_emitters), the index is
+        # rebuilt when the spaces of the project data change
+        self._spaces: Optional[List[Space]] = None
+        self._space_ids: List[str] = list()
+        self._q_needs: npt.NDArray[np.float64] = np.zeros(0)
+        self._maximum_powers: npt.NDArray[np.float64] = np.zeros(0)
+        self._emitter_ids: List[str] = list()
+        self._emitter_spaces: npt.NDArray[np.int64] = np.zeros(0, dtype=int)
+        self._efficiencies: npt.NDArray[np.float64] = np.zeros(0)
+        self._emitter_shares: npt.NDArray[np.float64] = np.zeros(0)
+
+    def initialize(self) -> bool:
+        self._index_emitters()
+        return True
 
     def run(self, time_step: int, number_of_iterations: int) -> None:
-        for space in self.project_data.spaces:
-            emitters: list = [
-                boundary_object
-                for boundary in space.boundaries
-                for boundary_object in boundary.object_collection
-                if boundary_object.type.lower() == "emitter"
-            ]
-            max_q: float = sum([emitter.pn for emitter in emitters])
-            q_needs: float = self.q_needs.get(
-                space.id,
-                space.q_needs,
-            )
-            q_total_provided: float = min(max_q, q_needs)
-
-            for emitter in emitters:
-                self.q_consumed[emitter.id] = q_total_provided / (
-                    (max_q / emitter.pn) * emitter.efficiency
-                )
-                self.q_provided[emitter.id] = q_total_provided / (
-                    max_q / emitter.pn
-                )
+        if self._spaces is not self.project_data.spaces:
+            self._index_emitters()
+        # The needs of each space, capped by the nominal power of its
+        # emitters, are shared in proportion to their nominal power
+        q_provided: npt.NDArray[np.float64] = (
+            np.minimum(
+                self._maximum_powers,
+                get_values(
+                    values=self.q_needs,
+                    ids=self._space_ids,
+                    default_values=self._q_needs,
+                ),
+            )[self._emitter_spaces]
+            * self._emitter_shares
+        )
+        # Outputs are updated in place, they may be linked to other modules
+        self.q_provided.update(zip(self._emitter_ids, q_provided.tolist()))
+        self.q_consumed.update(
+            zip(self._emitter_ids, (q_provided / self._efficiencies).tolist())
+        )
 
     def end_iteration(self, time_step: int) -> None: ...
 
@@ -114,6 +133,36 @@ class LimitedGenerator(Generator):
     def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
         return True
 
+    def _index_emitters(self) -> None:
+        # Space of each emitter, nominal power of the emitters of each space
+        # (sum by space with bincount) and share of each emitter in it
+        self._spaces = self.project_data.spaces
+        self._space_ids = [space.id for space in self._spaces]
+        self._q_needs = np.array(
+            [space.q_needs for space in self._spaces], dtype=float
+        )
+        emitters: List[BoundaryObject]
+        emitters, self._emitter_spaces = get_space_emitters(spaces=self._spaces)
+        self._emitter_ids = [emitter.id for emitter in emitters]
+        self._efficiencies = np.array(
+            [emitter.efficiency for emitter in emitters], dtype=float
+        )
+        nominal_powers: npt.NDArray[np.float64] = np.array(
+            [emitter.pn for emitter in emitters], dtype=float
+        )
+        self._maximum_powers = np.bincount(
+            self._emitter_spaces,
+            weights=nominal_powers,
+            minlength=len(self._space_ids),
+        )
+        # Emitters without nominal power provide nothing
+        self._emitter_shares = np.divide(
+            nominal_powers,
+            self._maximum_powers[self._emitter_spaces],
+            out=np.zeros(len(emitters)),
+            where=nominal_powers > 0.0,
+        )
+
 
 if __name__ == "__main__":
     from typing import Any
@@ -4,7 +4,10 @@ OccupantModel class from Occupant interface.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
 
 from colibri.core import ProjectData
 from colibri.core.fields import Parameter
@@ -14,6 +17,10 @@ from colibri.utils.enums_utils import (
     ColibriProjectObjects,
     Units,
 )
+from colibri.utils.exceptions_utils import UserInputError
+
+if TYPE_CHECKING:
+    from colibri.project_objects import Space
 
 
 class OccupantModel(Occupants):
@@ -82,26 +89,28 @@ class OccupantModel(Occupants):
         # TODO: Use define_field maybe with no role?
         self.occupant_per_square_meter = 1.0 / 40.0
         self.occupant_gains = 100.0  # W
+        # Gains and setpoint temperatures of the whole simulation (time step
+        # x space, see _compute_schedules), computed again when the spaces
+        # of the project data change
+        self._spaces: Optional[List[Space]] = None
+        self._space_ids: List[str] = list()
+        self._gains: npt.NDArray[np.float64] = np.zeros((0, 0))
+        self._setpoint_temperatures: npt.NDArray[np.float64] = np.zeros((0, 0))
 
-    def initialize(self) -> bool: ...
+    def initialize(self) -> bool:
+        self._compute_schedules()
+        return True
 
     def run(self, time_step: int, number_of_iterations: int) -> None:
-        for space in self.project_data.spaces:
-            self.gains[space.id] = (
-                space.occupation[time_step]
-                * self.occupant_per_square_meter
-                * space.reference_area
-                * self.occupant_gains
+        if self._spaces is not self.project_data.spaces:
+            self._compute_schedules()
+        # Outputs are updated in place, they may be linked to other modules
+        self.gains.update(zip(self._space_ids, self._gains[time_step].tolist()))
+        self.setpoint_temperatures.update(
+            zip(
+                self._space_ids, self._setpoint_temperatures[time_step].tolist()
             )
-
-            if space.occupation[time_step] > 0:
-                self.setpoint_temperatures[space.id] = (
-                    space.presence_setpoint_temperature
-                )
-            else:
-                self.setpoint_temperatures[space.id] = (
-                    space.absence_setpoint_temperature
-                )
+        )
 
     def end_iteration(self, time_step: int) -> None: ...
 
@@ -111,3 +120,43 @@ class OccupantModel(Occupants):
 
     def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
         return True
+
+    def _compute_schedules(self) -> None:
+        # The occupation of the spaces is known in advance: gains and
+        # setpoint temperatures do not depend on the other modules, they
+        # are computed for all the time steps of the occupations, which
+        # must have the same length
+        self._spaces = self.project_data.spaces
+        self._space_ids = [space.id for space in self._spaces]
+        occupation_lengths: Dict[str, int] = {
+            space.id: len(space.occupation) for space in self._spaces
+        }
+        if len(set(occupation_lengths.values())) > 1:
+            raise UserInputError(
+                f"{self.name}: the occupations of the spaces must have the "
+                f"same length, not {occupation_lengths}."
+            )
+        number_of_time_steps: int = max(occupation_lengths.values(), default=0)
+        occupations: npt.NDArray[np.float64] = np.zeros(
+            (number_of_time_steps, len(self._spaces))
+        )
+        for space_index, space in enumerate(self._spaces):
+            occupations[:, space_index] = space.occupation
+        self._gains = occupations * (
+            self.occupant_per_square_meter
+            * self.occupant_gains
+            * np.array(
+                [space.reference_area for space in self._spaces], dtype=float
+            )
+        )
+        self._setpoint_temperatures = np.where(
+            occupations > 0.0,
+            np.array(
+                [space.presence_setpoint_temperature for space in self._spaces],
+                dtype=float,
+            ),
+            np.array(
+                [space.absence_setpoint_temperature for space in self._spaces],
+                dtype=float,
+            ),
+        )
@@ -0,0 +1,768 @@
+"""
+ThermalSpaceRcNetwork class from ThermalSpace interface.
+"""
+
+from __future__ import annotations
+
+from enum import Enum, unique
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from scipy import linalg, sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from colibri.core import ProjectData
+from colibri.core.fields import Parameter
+from colibri.interfaces.modules.thermal_space import ThermalSpace
+from colibri.utils.array_utils import (
+    create_incidence_matrix,
+    get_boundary_space_indices,
+    get_layer_value,
+    get_space_emitters,
+    get_values,
+)
+from colibri.utils.colibri_utils import Attachment
+from colibri.utils.enums_utils import (
+    ColibriProjectObjects,
+    Units,
+)
+
+if TYPE_CHECKING:
+    from colibri.interfaces import BoundaryObject
+    from colibri.project_objects import Boundary, Space
+
+
+@unique
+class Solvers(Enum):
+    IMPLICIT = "implicit"
+    STATE_SPACE = "state_space"
+
+
+class ThermalSpaceRcNetwork(ThermalSpace):
+    """Class representing the thermal spaces of the building as a
+    resistance-capacitance (RC) network, advanced with an implicit scheme
+    or as a discrete state space.
+
+    The network has one air node per space and one node per layer of each
+    boundary (at the middle of the layer), linked to the spaces on both
+    sides of the boundary. Sides which are not spaces of the project
+    (e.g. "exterior" or "ground") are at the exterior air temperature.
+    Boundaries without layers link their sides through their U-value
+    (without capacity), the losses of the boundaries with neither layers
+    nor U-value are taken from q_walls.
+
+    With the implicit solver, the network's matrix is factorized once
+    (sparse LU decomposition) and reused at each time step: large time
+    steps (e.g. hourly) are stable and no iteration is needed.
+
+    The network being linear and time-invariant, the state space solver
+    computes the exact discrete state space once (matrix exponential of
+    the state matrix): each time step is a matrix-vector product, which is
+    faster for small networks (the matrices are dense)."""
+
+    def __init__(
+        self,
+        name: str,
+        q_walls: Optional[Dict[str, float]] = None,
+        setpoint_temperatures: Optional[Dict[str, float]] = None,
+        q_provided: Optional[Dict[str, float]] = None,
+        gains: Optional[Dict[str, float]] = None,
+        previous_inside_air_temperatures: Optional[Dict[str, float]] = None,
+        inside_air_temperatures: Optional[Dict[str, float]] = None,
+        q_needs: Optional[Dict[str, float]] = None,
+        annual_needs: Optional[Dict[str, float]] = None,
+        exterior_air_temperature: float = 0.0,
+        time_step_duration: float = 3_600.0,
+        solver: str = Solvers.IMPLICIT.value,
+        project_data: Optional[ProjectData] = None,
+    ) -> None:
+        """Initialize a new ThermalSpaceRcNetwork instance."""
+        if q_walls is None:
+            q_walls: Dict[str, float] = dict()
+        if setpoint_temperatures is None:
+            setpoint_temperatures: Dict[str, float] = dict()
+        if q_provided is None:
+            q_provided: Dict[str, float] = dict()
+        if gains is None:
+            gains: Dict[str, float] = dict()
+        if previous_inside_air_temperatures is None:
+            previous_inside_air_temperatures: Dict[str, float] = dict()
+        if inside_air_temperatures is None:
+            inside_air_temperatures: Dict[str, float] = dict()
+        if q_needs is None:
+            q_needs: Dict[str, float] = dict()
+        if annual_needs is None:
+            annual_needs: Dict[str, float] = dict()
+        super().__init__(
+            name=name,
+            q_walls=q_walls,
+            setpoint_temperatures=setpoint_temperatures,
+            q_provided=q_provided,
+            gains=gains,
+            previous_inside_air_temperatures=previous_inside_air_temperatures,
+            inside_air_temperatures=inside_air_temperatures,
+            q_needs=q_needs,
+            annual_needs=annual_needs,
+        )
+        self.exterior_air_temperature = self.define_input(
+            name="exterior_air_temperature",
+            default_value=exterior_air_temperature,
+            description="Outside air temperature.",
+            format=float,
+            min=-100,
+            max=100,
+            unit=Units.DEGREE_CELSIUS,
+            attached_to=Attachment(
+                category=ColibriProjectObjects.PROJECT,
+            ),
+        )
+        self.time_step_duration = self.define_parameter(
+            name="time_step_duration",
+            default_value=time_step_duration,
+            description="Duration of a time step.",
+            format=float,
+            min=0,
+            max=float("inf"),
+            unit=Units.SECOND,
+        )
+        self.solver = self.define_parameter(
+            name="solver",
+            default_value=solver,
+            description="Solver of the network: implicit scheme or "
+            "discrete state space.",
+            format=Solvers,
+            min=None,
+            max=None,
+            unit=Units.UNITLESS,
+        )
+        self.project_data = self.define_parameter(
+            name="project_data",
+            default_value=project_data,
+            description="Project data.",
+            format=ProjectData,
+            min=None,
+            max=None,
+            unit=Units.UNITLESS,
+            attached_to=None,
+            required=[
+                Parameter(
+                    name="height",
+                    default_value=2.5,
+                    description="Height of the space.",
+                    format=float,
+                    min=0,
+                    max=float("inf"),
+                    unit=Units.METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.SPACE,
+                        from_archetype=False,
+                    ),
+                ),
+                Parameter(
+                    name="reference_area",
+                    default_value=50,
+                    description="Reference area of the space's surface",
+                    format=float,
+                    min=0,
+                    max=float("inf"),
+                    unit=Units.SQUARE_METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.SPACE,
+                        from_archetype=False,
+                    ),
+                ),
+                Parameter(
+                    name="setpoint_temperature",
+                    default_value=19,
+                    description="Setpoint temperature.",
+                    format=float,
+                    min=0,
+                    max=float("inf"),
+                    unit=Units.DEGREE_CELSIUS,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.SPACE,
+                        from_archetype=False,
+                    ),
+                ),
+                Parameter(
+                    name="gain",
+                    default_value=0,
+                    description="gain",
+                    format=float,
+                    min=0,
+                    max=float("inf"),
+                    unit=Units.WATT,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.SPACE,
+                        from_archetype=False,
+                    ),
+                ),
+                Parameter(
+                    name="u_value",
+                    default_value=1.5,
+                    description="Thermal conductance.",
+                    format=float,
+                    min=0,
+                    max=float("inf"),
+                    unit=Units.WATT_PER_SQUARE_METER_PER_KELVIN,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.BOUNDARY,
+                        from_archetype=True,
+                    ),
+                ),
+                Parameter(
+                    name="layers",
+                    default_value=[],
+                    description="Layers of a boundary.",
+                    format=List["Layer"],
+                    min=None,
+                    max=None,
+                    unit=Units.UNITLESS,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ARCHETYPE,
+                        class_name="Boundary",
+                        from_element_object="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="thickness",
+                    default_value=0.3,
+                    description="Thickness of the layer.",
+                    format=float,
+                    min=0.001,
+                    max=2,
+                    unit=Units.METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="thermal_conductivity",
+                    default_value=1.75,
+                    description="Thermal conductivity of the layer.",
+                    format=float,
+                    min=0.01,
+                    max=5,
+                    unit=Units.WATT_PER_METER_PER_KELVIN,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="specific_heat",
+                    default_value=900,
+                    description="Specific heat capacity (known as C) of the layer.",
+                    format=float,
+                    min=100,
+                    max=8_000,
+                    unit=Units.JOULE_PER_KILO_GRAM,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="density",
+                    default_value=2_500,
+                    description="Volumetric density of the layer.",
+                    format=float,
+                    min=0.1,
+                    max=50_000,
+                    unit=Units.KILOGRAM_PER_CUBIC_METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+            ],
+        )
+        self.thermal_capacity = 1_230.0  # J/(m³.K)
+        # Network (see _assemble_network), ordered as: air nodes (one per
+        # space) then layer nodes
+        self._space_ids: List[str] = list()
+        self._emitter_ids: List[str] = list()
+        self._other_boundary_ids: List[str] = list()
+        self._emitters_incidence: sparse.csr_matrix = sparse.csr_matrix((0, 0))
+        self._other_boundaries_incidence: sparse.csr_matrix = sparse.csr_matrix(
+            (0, 0)
+        )
+        self._capacities: npt.NDArray[np.float64] = np.zeros(0)
+        self._conductances: sparse.csr_matrix = sparse.csr_matrix((0, 0))
+        self._exterior_conductances: npt.NDArray[np.float64] = np.zeros(0)
+        self._air_nodes: sparse.csr_matrix = sparse.csr_matrix((0, 0))
+        self._reference_areas: npt.NDArray[np.float64] = np.zeros(0)
+        self._setpoint_temperatures: npt.NDArray[np.float64] = np.zeros(0)
+        self._gains: npt.NDArray[np.float64] = np.zeros(0)
+        # Implicit scheme: capacities per time step and factorized matrix,
+        # state space: state and input (exterior air temperature then power
+        # injected in each air node) matrices, for both: the air
+        # temperature rise of each space per watt injected in its air node
+        self._capacity_rates: sparse.dia_matrix = sparse.diags(np.zeros(0))
+        self._factorized_matrix: Optional[sparse_linalg.SuperLU] = None
+        self._state_matrix: Optional[npt.NDArray[np.float64]] = None
+        self._input_matrix: Optional[npt.NDArray[np.float64]] = None
+        self._air_responses: npt.NDArray[np.float64] = np.zeros(0)
+        # Temperatures of the nodes at the beginning and at the end of the
+        # current time step
+        self._temperatures: npt.NDArray[np.float64] = np.zeros(0)
+        self._next_temperatures: npt.NDArray[np.float64] = np.zeros(0)
+        # Needs of the current time step and their sum (Wh/m² of reference
+        # area) over the previous time steps
+        self._q_needs: npt.NDArray[np.float64] = np.zeros(0)
+        self._annual_needs: npt.NDArray[np.float64] = np.zeros(0)
+
+    def initialize(self) -> bool:
+        self._assemble_network()
+        number_of_spaces: int = len(self._space_ids)
+        self._factorized_matrix = None
+        self._state_matrix = None
+        self._input_matrix = None
+        if Solvers(self.solver) is Solvers.STATE_SPACE:
+            self._discretize_state_space()
+            self._air_responses = self._input_matrix[
+                np.arange(number_of_spaces), 1 + np.arange(number_of_spaces)
+            ]
+        else:
+            self._capacity_rates = sparse.diags(
+                self._capacities / self.time_step_duration
+            )
+            self._factorized_matrix = sparse_linalg.splu(
+                (self._capacity_rates + self._conductances).tocsc()
+            )
+            self._air_responses = self._get_air_responses()
+        # Layer nodes start at steady state (with the initial inside and
+        # exterior air temperatures)
+        self._temperatures = np.zeros(len(self._capacities))
+        self._temperatures[:number_of_spaces] = np.array(
+            [
+                self.previous_inside_air_temperatures.get(
+                    space.id, space.inside_air_temperature
+                )
+                for space in self.project_data.spaces
+            ],
+            dtype=float,
+        )
+        if len(self._capacities) > number_of_spaces:
+            layer_conductances: sparse.csr_matrix = self._conductances[
+                number_of_spaces:
+            ]
+            self._temperatures[number_of_spaces:] = sparse_linalg.spsolve(
+                layer_conductances[:, number_of_spaces:].tocsc(),
+                self._exterior_conductances[number_of_spaces:]
+                * self.exterior_air_temperature
+                - layer_conductances[:, :number_of_spaces]
+                @ self._temperatures[:number_of_spaces],
+            )
+        self._next_temperatures = self._temperatures.copy()
+        self._q_needs = np.zeros(number_of_spaces)
+        self._annual_needs = np.zeros(number_of_spaces)
+        self.inside_air_temperatures.clear()
+        self.inside_air_temperatures.update(
+            zip(self._space_ids, self._temperatures[:number_of_spaces].tolist())
+        )
+        return True
+
+    def run(self, time_step: int, number_of_iterations: int) -> None:
+        # The time step always starts from the temperatures of the end of
+        # the previous time step (run may be called once per iteration)
+        space_ids: List[str] = self._space_ids
+        number_of_spaces: int = len(space_ids)
+        gains: npt.NDArray[np.float64] = get_values(
+            values=self.gains, ids=space_ids, default_values=self._gains
+        )
+        q_walls: npt.NDArray[np.float64] = self._other_boundaries_incidence @ (
+            get_values(
+                values=self.q_walls,
+                ids=self._other_boundary_ids,
+                default_values=np.zeros(len(self._other_boundary_ids)),
+            )
+        )
+        q_provided: npt.NDArray[np.float64] = self._emitters_incidence @ (
+            get_values(
+                values=self.q_provided,
+                ids=self._emitter_ids,
+                default_values=np.zeros(len(self._emitter_ids)),
+            )
+        )
+        # Time step without and with the power provided by the emitters,
+        # computed at once
+        powers: npt.NDArray[np.float64] = np.column_stack(
+            (gains - q_walls, gains - q_walls + q_provided)
+        )
+        temperatures: npt.NDArray[np.float64] = self._advance(
+            temperatures=self._temperatures[:, np.newaxis],
+            forcings=self._get_forcings(
+                exterior_air_temperatures=np.full(
+                    2, self.exterior_air_temperature
+                ),
+                powers=powers,
+            ),
+        )
+        self._next_temperatures = temperatures[:, 1]
+        # Needs: power to be injected in the air node of each space to reach
+        # its setpoint at the end of the time step, from free floating
+        setpoint_temperatures: npt.NDArray[np.float64] = get_values(
+            values=self.setpoint_temperatures,
+            ids=space_ids,
+            default_values=self._setpoint_temperatures,
+        )
+        self._q_needs = np.maximum(
+            (setpoint_temperatures - temperatures[:number_of_spaces, 0])
+            / self._air_responses,
+            0,
+        )
+        # Outputs are updated in place, they may be linked to other modules
+        self.q_needs.update(zip(space_ids, self._q_needs.tolist()))
+        self.inside_air_temperatures.update(
+            zip(space_ids, self._next_temperatures[:number_of_spaces].tolist())
+        )
+
+    def end_iteration(self, time_step: int) -> None: ...
+
+    def end_time_step(self, time_step: int) -> None:
+        self._temperatures = self._next_temperatures
+        self._annual_needs += (
+            self._q_needs
+            * self.time_step_duration
+            / 3_600
+            / self._reference_areas
+        )
+
+    def end_simulation(self) -> None:
+        self.annual_needs.update(
+            zip(self._space_ids, self._annual_needs.tolist())
+        )
+
+    def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
+        return True
+
+    def compute_response(
+        self,
+        exterior_air_temperatures: npt.ArrayLike,
+        powers: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """Compute the inside air temperatures of the spaces over several
+        time steps at once, when the inputs are known in advance, from the
+        current temperatures of the network (which are left unchanged)
+
+        Parameters
+        ----------
+        exterior_air_temperatures : npt.ArrayLike
+            Exterior air temperature of each time step, shape (time steps,)
+        powers : npt.ArrayLike
+            Power injected in the air of each space (e.g. gains and
+            emitters, minus the losses not modeled by the network) during
+            each time step, shape (time steps, spaces), the spaces being
+            ordered as the project data's spaces
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            Inside air temperature of each space at the end of each time
+            step, shape (time steps, spaces)
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        exterior_air_temperatures = np.asarray(
+            exterior_air_temperatures, dtype=float
+        )
+        number_of_time_steps: int = len(exterior_air_temperatures)
+        number_of_spaces: int = len(self._space_ids)
+        powers = np.asarray(powers, dtype=float).reshape(
+            (number_of_time_steps, number_of_spaces)
+        )
+        forcings: npt.NDArray[np.float64] = self._get_forcings(
+            exterior_air_temperatures=exterior_air_temperatures,
+            powers=powers.T,
+        )
+        temperatures: npt.NDArray[np.float64] = self._temperatures
+        inside_air_temperatures: npt.NDArray[np.float64] = np.zeros(
+            (number_of_time_steps, number_of_spaces)
+        )
+        for time_step in range(0, number_of_time_steps):
+            temperatures = self._advance(
+                temperatures=temperatures, forcings=forcings[:, time_step]
+            )
+            inside_air_temperatures[time_step] = temperatures[:number_of_spaces]
+        return inside_air_temperatures
+
+    def _assemble_network(self) -> None:
+        # Capacities (J/K) and conductances (W/K) of the network, the
+        # conductances between nodes are stored as a sparse (symmetric)
+        # matrix: each link (i, j, g) adds g to (i, i) and (j, j) and
+        # subtracts g from (i, j) and (j, i), links to the exterior only
+        # add to the diagonal (and to the exterior conductances)
+        spaces: List[Space] = self.project_data.spaces
+        self._space_ids = [space.id for space in spaces]
+        space_indices: Dict[str, int] = {
+            space_id: index for index, space_id in enumerate(self._space_ids)
+        }
+        self._reference_areas = np.array(
+            [space.reference_area for space in spaces], dtype=float
+        )
+        self._setpoint_temperatures = np.array(
+            [space.setpoint_temperature for space in spaces], dtype=float
+        )
+        self._gains = np.array([space.gain for space in spaces], dtype=float)
+        capacities: List[float] = [
+            self.thermal_capacity * space.reference_area * space.height
+            for space in spaces
+        ]
+        links: List[Tuple[int, int, float]] = list()
+        exterior_links: List[Tuple[int, float]] = list()
+        other_boundary_indices: Dict[str, int] = dict()
+        other_boundary_entries: List[Tuple[int, int]] = list()
+        other_boundary_values: List[float] = list()
+        for boundary in self.project_data.boundaries:
+            # Boundaries without layers (e.g. no archetype) are linked
+            # through their U-value if they have one
+            is_in_network: bool = (
+                len(getattr(boundary, "layers", [])) > 0
+            ) or (getattr(boundary, "u_value", None) is not None)
+            side_indices: List[Optional[int]] = [
+                space_indices.get(boundary.side_1),
+                space_indices.get(boundary.side_2),
+            ]
+            _, gaining_space_index = get_boundary_space_indices(
+                boundary=boundary, space_indices=space_indices
+            )
+            for space_index in side_indices:
+                if (space_index is None) or is_in_network:
+                    continue
+                # q_walls are gains for the boundary's second space
+                other_boundary_values.append(
+                    -1.0 if space_index == gaining_space_index else 1.0
+                )
+                other_boundary_entries.append(
+                    (
+                        space_index,
+                        other_boundary_indices.setdefault(
+                            boundary.id, len(other_boundary_indices)
+                        ),
+                    )
+                )
+            if (is_in_network is False) or (side_indices == [None, None]):
+                continue
+            self._add_boundary(
+                boundary=boundary,
+                side_indices=side_indices,
+                capacities=capacities,
+                links=links,
+                exterior_links=exterior_links,
+            )
+        number_of_nodes: int = len(capacities)
+        self._capacities = np.array(capacities, dtype=float)
+        self._conductances = self._create_conductance_matrix(
+            links=links, number_of_nodes=number_of_nodes
+        )
+        self._exterior_conductances = np.zeros(number_of_nodes)
+        for node_index, conductance in exterior_links:
+            self._exterior_conductances[node_index] += conductance
+        self._conductances = self._conductances + sparse.diags(
+            self._exterior_conductances
+        )
+        self._air_nodes = sparse.eye(number_of_nodes, len(spaces), format="csr")
+        # Each emitter is in one space only (see get_space_emitters)
+        emitters: List[BoundaryObject]
+        emitter_spaces: npt.NDArray[np.int64]
+        emitters, emitter_spaces = get_space_emitters(spaces=spaces)
+        self._emitter_ids = [emitter.id for emitter in emitters]
+        self._emitters_incidence = create_incidence_matrix(
+            entries=list(
+                zip(emitter_spaces.tolist(), range(len(self._emitter_ids)))
+            ),
+            shape=(len(spaces), len(self._emitter_ids)),
+        )
+        self._other_boundary_ids = list(other_boundary_indices)
+        self._other_boundaries_incidence = create_incidence_matrix(
+            entries=other_boundary_entries,
+            shape=(len(spaces), len(self._other_boundary_ids)),
+            values=other_boundary_values,
+        )
+
+    def _add_boundary(
+        self,
+        boundary: Boundary,
+        side_indices: List[Optional[int]],
+        capacities: List[float],
+        links: List[Tuple[int, int, float]],
+        exterior_links: List[Tuple[int, float]],
+    ) -> None:
+        # Layers go from side 1 to side 2, each layer's node is linked to
+        # the previous one through half of both layers' resistances, a
+        # boundary without layers links its sides through its U-value
+        previous_index: Optional[int] = side_indices[0]
+        previous_resistance: float = 0.0
+        conductance: float
+        parameters: List[Parameter] = self._fields_metadata[
+            "project_data"
+        ].required
+        for layer in getattr(boundary, "layers", []):
+            thickness, thermal_conductivity, density, specific_heat = (
+                get_layer_value(layer=layer, name=name, parameters=parameters)
+                for name in [
+                    "thickness",
+                    "thermal_conductivity",
+                    "density",
+                    "specific_heat",
+                ]
+            )
+            half_resistance: float = thickness / thermal_conductivity / 2
+            node_index: int = len(capacities)
+            capacities.append(
+                boundary.area * thickness * density * specific_heat
+            )
+            conductance = boundary.area / (
+                previous_resistance + half_resistance
+            )
+            if previous_index is None:
+                exterior_links.append((node_index, conductance))
+            else:
+                links.append((previous_index, node_index, conductance))
+            previous_index = node_index
+            previous_resistance = half_resistance
+        if previous_resistance == 0.0:
+            conductance = boundary.u_value * boundary.area
+        else:
+            conductance = boundary.area / previous_resistance
+        if previous_index is None:
+            exterior_links.append((side_indices[1], conductance))
+        elif side_indices[1] is None:
+            exterior_links.append((previous_index, conductance))
+        else:
+            links.append((previous_index, side_indices[1], conductance))
+
+    @staticmethod
+    def _create_conductance_matrix(
+        links: List[Tuple[int, int, float]], number_of_nodes: int
+    ) -> sparse.csr_matrix:
+        # Duplicated entries are summed
+        if len(links) == 0:
+            return sparse.csr_matrix((number_of_nodes, number_of_nodes))
+        first_indices, second_indices, conductances = (
+            np.array(values) for values in zip(*links)
+        )
+        return sparse.csr_matrix(
+            (
+                np.concatenate(
+                    (conductances, conductances, -conductances, -conductances)
+                ),
+                (
+                    np.concatenate(
+                        (
+                            first_indices,
+                            second_indices,
+                            first_indices,
+                            second_indices,
+                        )
+                    ),
+                    np.concatenate(
+                        (
+                            first_indices,
+                            second_indices,
+                            second_indices,
+                            first_indices,
+                        )
+                    ),
+                ),
+            ),
+            shape=(number_of_nodes, number_of_nodes),
+        )
+
+    def _discretize_state_space(self) -> None:
+        # Continuous state space: dT/dt = A.T + B.u, with A = -K / C and
+        # B = [exterior conductances, air nodes] / C, discretized exactly for
+        # inputs constant during a time step, with the exponential of the
+        # augmented matrix [[A, B], [0, 0]] (A may not be invertible)
+        if np.any(self._capacities <= 0.0):
+            raise ValueError(
+                f"{self.name}: the state space solver needs a positive "
+                "capacity for each node of the network."
+            )
+        number_of_nodes: int = len(self._capacities)
+        number_of_inputs: int = 1 + len(self._space_ids)
+        inverse_capacities: sparse.dia_matrix = sparse.diags(
+            1.0 / self._capacities
+        )
+        augmented_matrix: npt.NDArray[np.float64] = np.zeros(
+            (number_of_nodes + number_of_inputs,) * 2
+        )
+        augmented_matrix[:number_of_nodes, :number_of_nodes] = -(
+            inverse_capacities @ self._conductances
+        ).toarray()
+        augmented_matrix[:number_of_nodes, number_of_nodes:] = (
+            inverse_capacities
+            @ sparse.hstack(
+                (
+                    sparse.csr_matrix(self._exterior_conductances).T,
+                    self._air_nodes,
+                )
+            )
+        ).toarray()
+        exponential: npt.NDArray[np.float64] = linalg.expm(
+            augmented_matrix * self.time_step_duration
+        )
+        self._state_matrix = exponential[:number_of_nodes, :number_of_nodes]
+        self._input_matrix = exponential[:number_of_nodes, number_of_nodes:]
+
+    def _get_forcings(
+        self,
+        exterior_air_temperatures: npt.NDArray[np.float64],
+        powers: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        # Contribution of the inputs to the temperatures of the nodes, for
+        # several sets of inputs (one per column)
+        if self._state_matrix is not None:
+            return self._input_matrix @ np.vstack(
+                (exterior_air_temperatures[np.newaxis], powers)
+            )
+        return (
+            np.outer(self._exterior_conductances, exterior_air_temperatures)
+            + self._air_nodes @ powers
+        )
+
+    def _advance(
+        self,
+        temperatures: npt.NDArray[np.float64],
+        forcings: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        # Temperatures of the nodes at the end of a time step
+        if self._state_matrix is not None:
+            return self._state_matrix @ temperatures + forcings
+        return self._factorized_matrix.solve(
+            self._capacity_rates @ temperatures + forcings
+        )
+
+    def _get_air_responses(self) -> npt.NDArray[np.float64]:
+        # Air temperature rise of each space at the end of a time step, per
+        # watt injected in its own air node (diagonal of the inverse matrix
+        # for the air nodes), solved by batches of spaces
+        number_of_spaces: int = len(self._space_ids)
+        air_responses: npt.NDArray[np.float64] = np.zeros(number_of_spaces)
+        batch_size: int = 64
+        for start in range(0, number_of_spaces, batch_size):
+            stop: int = min(start + batch_size, number_of_spaces)
+            unit_powers: npt.NDArray[np.float64] = np.zeros(
+                (len(self._capacities), stop - start)
+            )
+            unit_powers[np.arange(start, stop), np.arange(stop - start)] = 1.0
+            responses: npt.NDArray[np.float64] = self._factorized_matrix.solve(
+                unit_powers
+            )
+            air_responses[start:stop] = responses[
+                np.arange(start, stop), np.arange(stop - start)
+            ]
+        return air_responses
@@ -4,20 +4,41 @@ ThermalSpaceSimplified class from ThermalSpace interface.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
 
 from colibri.core import ProjectData
 from colibri.core.fields import Parameter
 from colibri.interfaces.modules.thermal_space import ThermalSpace
+from colibri.utils.array_utils import (
+    create_incidence_matrix,
+    get_boundary_space_indices,
+    get_space_emitters,
+    get_values,
+)
 from colibri.utils.colibri_utils import Attachment
 from colibri.utils.enums_utils import (
     ColibriProjectObjects,
     Units,
 )
 
+if TYPE_CHECKING:
+    from colibri.interfaces import BoundaryObject
+    from colibri.project_objects import Space
+
 
 class ThermalSpaceSimplified(ThermalSpace):
-    """Class representing a thermal space for energy balance."""
+    """Class representing a thermal space for energy balance.
+
+    q_walls of a boundary between two spaces are the heat lost by its
+    first space, taken as the heat gained by the second one: the heat
+    stored in the boundary during the time step (e.g. with
+    TransientWallLosses or CtfWallLosses) is missing from the balance of
+    the second space, which is exact in steady state only.
+    """
 
     def __init__(
         self,
@@ -192,6 +213,21 @@ class ThermalSpaceSimplified(ThermalSpace):
         self.thermal_capacity = 1_230.0  # J/(m³.K)
         self.previous_setpoint_temperature = 20.0  # °C
         self.temporary_annual_needs = dict()
+        # Spaces indexed as arrays (see _index_spaces), the index is rebuilt
+        # when the spaces of the project data change
+        self._spaces: Optional[List[Space]] = None
+        self._space_ids: List[str] = list()
+        self._boundary_ids: List[str] = list()
+        self._emitter_ids: List[str] = list()
+        self._boundaries_incidence: sparse.csr_matrix = sparse.csr_matrix(
+            (0, 0)
+        )
+        self._emitters_incidence: sparse.csr_matrix = sparse.csr_matrix((0, 0))
+        self._capacities: npt.NDArray[np.float64] = np.zeros(0)
+        self._reference_areas: npt.NDArray[np.float64] = np.zeros(0)
+        self._setpoint_temperatures: npt.NDArray[np.float64] = np.zeros(0)
+        self._gains: npt.NDArray[np.float64] = np.zeros(0)
+        self._inside_air_temperatures: npt.NDArray[np.float64] = np.zeros(0)
 
     def initialize(self) -> bool:
         self.previous_setpoint_temperature = 20.0
@@ -201,74 +237,73 @@ class ThermalSpaceSimplified(ThermalSpace):
         self.temporary_annual_needs = {
             space.id: 0.0 for space in self.project_data.spaces
         }
+        self._index_spaces()
         return True
 
     def run(self, time_step: int, number_of_iterations: int) -> None:
-        for space in self.project_data.spaces:
-            q_walls: float = sum(
-                [
-                    self.q_walls.get(boundary.id, 0.0)
-                    for boundary in space.boundaries
-                ]
-            )
-            self.q_needs[space.id] = max(
-                (
-                    (
-                        self.setpoint_temperatures.get(
-                            space.id,
-                            space.setpoint_temperature,
-                        )
-                        - self.previous_inside_air_temperatures.get(
-                            space.id,
-                            space.inside_air_temperature,
-                        )
-                    )
-                    * self.thermal_capacity
-                    * space.reference_area
-                    * space.height
-                    + q_walls
-                    - self.gains.get(
-                        space.id,
-                        space.gain,
-                    )
-                ),
-                0,
+        if self._spaces is not self.project_data.spaces:
+            self._index_spaces()
+        space_ids: List[str] = self._space_ids
+        q_walls: npt.NDArray[np.float64] = self._boundaries_incidence @ (
+            get_values(
+                values=self.q_walls,
+                ids=self._boundary_ids,
+                default_values=np.zeros(len(self._boundary_ids)),
             )
-            emitters = [
-                boundary_object
-                for boundary in space.boundaries
-                for boundary_object in boundary.object_collection
-                if boundary_object.type == "emitter"
-            ]
-            q_provided: float = sum(
-                [self.q_provided.get(emitter.id, 0.0) for emitter in emitters]
-            )
-            q_effective: float = (
-                q_provided + self.gains.get(space.id, space.gain) - q_walls
+        )
+        q_provided: npt.NDArray[np.float64] = self._emitters_incidence @ (
+            get_values(
+                values=self.q_provided,
+                ids=self._emitter_ids,
+                default_values=np.zeros(len(self._emitter_ids)),
             )
-            self.inside_air_temperatures[space.id] = (
-                self.previous_inside_air_temperatures.get(
-                    space.id,
-                    space.inside_air_temperature,
-                )
-                + q_effective
-                / (self.thermal_capacity * space.reference_area * space.height)
+        )
+        setpoint_temperatures: npt.NDArray[np.float64] = get_values(
+            values=self.setpoint_temperatures,
+            ids=space_ids,
+            default_values=self._setpoint_temperatures,
+        )
+        gains: npt.NDArray[np.float64] = get_values(
+            values=self.gains, ids=space_ids, default_values=self._gains
+        )
+        previous_inside_air_temperatures: npt.NDArray[np.float64] = get_values(
+            values=self.previous_inside_air_temperatures,
+            ids=space_ids,
+            default_values=self._inside_air_temperatures,
+        )
+        q_needs: npt.NDArray[np.float64] = np.maximum(
+            (setpoint_temperatures - previous_inside_air_temperatures)
+            * self._capacities
+            + q_walls
+            - gains,
+            0,
+        )
+        inside_air_temperatures: npt.NDArray[np.float64] = (
+            previous_inside_air_temperatures
+            + (q_provided + gains - q_walls) / self._capacities
+        )
+        temporary_annual_needs: npt.NDArray[np.float64] = (
+            get_values(
+                values=self.temporary_annual_needs,
+                ids=space_ids,
+                default_values=np.zeros(len(space_ids)),
             )
-            self.temporary_annual_needs[space.id] += (
-                (
-                    self.setpoint_temperatures.get(
-                        space.id,
-                        space.setpoint_temperature,
-                    )
-                    - self.previous_setpoint_temperature
-                )
-                * (self.thermal_capacity * space.reference_area * space.height)
+            + (
+                (setpoint_temperatures - self.previous_setpoint_temperature)
+                * self._capacities
                 + q_walls
-                - self.gains.get(
-                    space.id,
-                    space.gain,
-                )
-            ) / space.reference_area
+                - gains
+            )
+            / self._reference_areas
+        )
+        # Outputs are updated in place, they may be linked to other modules
+        self.q_needs.update(zip(space_ids, q_needs.tolist()))
+        self.inside_air_temperatures.update(
+            zip(space_ids, inside_air_temperatures.tolist())
+        )
+        self.temporary_annual_needs.update(
+            zip(space_ids, temporary_annual_needs.tolist())
+        )
 
     def end_iteration(self, time_step: int) -> None: ...
 
@@ -280,3 +315,70 @@ class ThermalSpaceSimplified(ThermalSpace):
 
     def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
         return True
+
+    def _index_spaces(self) -> None:
+        # Spaces' properties are gathered as arrays (ordered as the spaces),
+        # the boundaries and emitters of the spaces as incidence matrices
+        # (space x boundary, space x emitter), q_walls of a boundary between
+        # two spaces are losses for one and gains for the other (the heat
+        # stored in the boundary is ignored, see the class docstring)
+        self._spaces = self.project_data.spaces
+        self._space_ids = [space.id for space in self._spaces]
+        space_indices: Dict[str, int] = {
+            space_id: index for index, space_id in enumerate(self._space_ids)
+        }
+        boundary_indices: Dict[str, int] = dict()
+        boundary_entries: List[Tuple[int, int]] = list()
+        boundary_values: List[float] = list()
+        for space_index, space in enumerate(self._spaces):
+            for boundary in space.boundaries:
+                _, gaining_space_index = get_boundary_space_indices(
+                    boundary=boundary, space_indices=space_indices
+                )
+                boundary_values.append(
+                    -1.0 if space_index == gaining_space_index else 1.0
+                )
+                boundary_entries.append(
+                    (
+                        space_index,
+                        boundary_indices.setdefault(
+                            boundary.id, len(boundary_indices)
+                        ),
+                    )
+                )
+        self._boundary_ids = list(boundary_indices)
+        # Each emitter is in one space only (see get_space_emitters)
+        emitters: List[BoundaryObject]
+        emitter_spaces: npt.NDArray[np.int64]
+        emitters, emitter_spaces = get_space_emitters(spaces=self._spaces)
+        self._emitter_ids = [emitter.id for emitter in emitters]
+        self._boundaries_incidence = create_incidence_matrix(
+            entries=boundary_entries,
+            shape=(len(self._space_ids), len(self._boundary_ids)),
+            values=boundary_values,
+        )
+        self._emitters_incidence = create_incidence_matrix(
+            entries=list(
+                zip(emitter_spaces.tolist(), range(len(self._emitter_ids)))
+            ),
+            shape=(len(self._space_ids), len(self._emitter_ids)),
+        )
+        self._reference_areas = np.array(
+            [space.reference_area for space in self._spaces], dtype=float
+        )
+        self._capacities = (
+            self.thermal_capacity
+            * self._reference_areas
+            * np.array([space.height for space in self._spaces], dtype=float)
+        )
+        self._setpoint_temperatures = np.array(
+            [space.setpoint_temperature for space in self._spaces],
+            dtype=float,
+        )
+        self._gains = np.array(
+            [space.gain for space in self._spaces], dtype=float
+        )
+        self._inside_air_temperatures = np.array(
+            [space.inside_air_temperature for space in self._spaces],
+            dtype=float,
+        )
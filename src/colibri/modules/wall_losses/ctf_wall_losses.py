@@ -0,0 +1,440 @@
+"""
+CtfWallLosses class from WallLosses interface.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
+
+from colibri.core import ProjectData
+from colibri.core.fields import Parameter
+from colibri.interfaces.modules.wall_losses import WallLosses
+from colibri.utils.array_utils import (
+    create_incidence_matrix,
+    get_boundary_sides,
+    get_layer_cells,
+    get_layer_value,
+    get_values,
+)
+from colibri.utils.colibri_utils import Attachment
+from colibri.utils.enums_utils import (
+    ColibriProjectObjects,
+    Units,
+)
+
+if TYPE_CHECKING:
+    from colibri.project_objects import Boundary, Space
+
+
+class CtfWallLosses(WallLosses):
+    """Class representing wall losses with wall layers and their thermal
+    mass, computed with conduction transfer functions (CTF).
+
+    The CTF coefficients of each layer stack (per square meter) are
+    computed once, from the layers divided into cells (finite volumes) no
+    thicker than the maximum cell thickness: the cells' state space is
+    discretized exactly for air temperatures constant during a time step,
+    its modes faster than the time step are taken as instantaneous. The
+    coefficients are cached by layer stack, boundaries sharing an
+    archetype share their coefficients.
+
+    The transfer functions are kept in modal form (a sum of first order
+    terms, one per slow mode) rather than over a common denominator, whose
+    polynomial coefficients are too ill-conditioned for thick boundaries
+    at short time steps. At each time step, the state of every mode decays
+    by its pole and is driven by the air temperatures of the sides, and
+    the heat flows entering both faces of every boundary are a combination
+    of the modes' states and of the air temperatures. Sides which are not
+    spaces of the project (e.g. "exterior" or "ground") are at the
+    exterior air temperature. Boundaries without layers are not computed.
+
+    q_walls are the losses of the space on side 1 (or of the only space of
+    the boundary), at the end of the time step. For boundaries between two
+    spaces, the gains of the space on side 2 differ from these losses by
+    the heat stored in the boundary."""
+
+    def __init__(
+        self,
+        name: str,
+        inside_air_temperatures: Optional[Dict[str, float]] = None,
+        exterior_air_temperature: float = 0.0,
+        q_walls: Optional[Dict[str, float]] = None,
+        time_step_duration: float = 3_600.0,
+        maximum_cell_thickness: float = 0.01,
+        project_data: Optional[ProjectData] = None,
+    ) -> None:
+        """Initialize a new CtfWallLosses instance."""
+        if inside_air_temperatures is None:
+            inside_air_temperatures: Dict[str, float] = dict()
+        if q_walls is None:
+            q_walls: Dict[str, float] = dict()
+        super().__init__(
+            name=name,
+            inside_air_temperatures=inside_air_temperatures,
+            exterior_air_temperature=exterior_air_temperature,
+            q_walls=q_walls,
+        )
+        self.time_step_duration = self.define_parameter(
+            name="time_step_duration",
+            default_value=time_step_duration,
+            description="Duration of a time step.",
+            format=float,
+            min=0,
+            max=float("inf"),
+            unit=Units.SECOND,
+        )
+        self.maximum_cell_thickness = self.define_parameter(
+            name="maximum_cell_thickness",
+            default_value=maximum_cell_thickness,
+            description="Maximum thickness of the cells of a layer.",
+            format=float,
+            min=0.001,
+            max=2,
+            unit=Units.METER,
+        )
+        self.project_data = self.define_parameter(
+            name="project_data",
+            default_value=project_data,
+            description="Project data.",
+            format=ProjectData,
+            min=None,
+            max=None,
+            unit=Units.UNITLESS,
+            attached_to=None,
+            required=[
+                Parameter(
+                    name="layers",
+                    default_value=[],
+                    description="Layers of a boundary.",
+                    format=List["Layer"],
+                    min=None,
+                    max=None,
+                    unit=Units.UNITLESS,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ARCHETYPE,
+                        class_name="Boundary",
+                        from_element_object="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="thickness",
+                    default_value=0.3,
+                    description="Thickness of the layer.",
+                    format=float,
+                    min=0.001,
+                    max=2,
+                    unit=Units.METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="thermal_conductivity",
+                    default_value=1.75,
+                    description="Thermal conductivity of the layer.",
+                    format=float,
+                    min=0.01,
+                    max=5,
+                    unit=Units.WATT_PER_METER_PER_KELVIN,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="specific_heat",
+                    default_value=900,
+                    description=(
+                        "Specific heat capacity (known as C) of the layer."
+                    ),
+                    format=float,
+                    min=100,
+                    max=8_000,
+                    unit=Units.JOULE_PER_KILO_GRAM,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="density",
+                    default_value=2_500,
+                    description="Volumetric density of the layer.",
+                    format=float,
+                    min=0.1,
+                    max=50_000,
+                    unit=Units.KILOGRAM_PER_CUBIC_METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+            ],
+        )
+        # Modes of the boundaries whose pole (decay over a time step) is
+        # smaller are taken as instantaneous
+        self.minimum_pole = 1e-6
+        # CTF coefficients (see _compute_coefficients) by time step
+        # duration, maximum cell thickness and layer stack, kept when the
+        # boundaries change
+        self._coefficients: Dict[
+            Tuple[Any, ...], Tuple[npt.NDArray[np.float64], ...]
+        ] = dict()
+        # Boundaries indexed as arrays (see _index_boundaries), the index is
+        # rebuilt when the boundaries of the project data change, with the
+        # modes of each boundary padded to the largest number of modes
+        # (with a zero pole and no input nor output)
+        self._boundaries: Optional[List[Boundary]] = None
+        self._boundary_ids: List[str] = list()
+        self._space_ids: List[str] = list()
+        self._inside_air_temperatures: npt.NDArray[np.float64] = np.zeros(0)
+        self._areas: npt.NDArray[np.float64] = np.zeros(0)
+        # As matrices for batched products: poles (boundary x mode), inputs
+        # (boundary x mode x side), outputs (boundary x face x mode) and
+        # direct gains (boundary x face x side)
+        self._poles: npt.NDArray[np.float64] = np.zeros((0, 0))
+        self._inputs: npt.NDArray[np.float64] = np.zeros((0, 0, 2))
+        self._outputs: npt.NDArray[np.float64] = np.zeros((0, 2, 0))
+        self._direct_gains: npt.NDArray[np.float64] = np.zeros((0, 2, 2))
+        # Sides (2 x boundaries) x (spaces + exterior)
+        self._sides_incidence: sparse.csr_matrix = sparse.csr_matrix((0, 0))
+        self._loss_faces: npt.NDArray[np.int64] = np.zeros(0, dtype=int)
+        # States of the modes (boundary x mode) at the end of the previous
+        # time step and of the current one
+        self._states: npt.NDArray[np.float64] = np.zeros((0, 0))
+        self._next_states: npt.NDArray[np.float64] = np.zeros((0, 0))
+
+    def initialize(self) -> bool:
+        self._index_boundaries()
+        return True
+
+    def run(self, time_step: int, number_of_iterations: int) -> None:
+        if self._boundaries is not self.project_data.boundaries:
+            self._index_boundaries()
+        side_temperatures: npt.NDArray[np.float64] = (
+            self._get_side_temperatures(
+                inside_air_temperatures=get_values(
+                    values=self.inside_air_temperatures,
+                    ids=self._space_ids,
+                    default_values=self._inside_air_temperatures,
+                )
+            )
+        )
+        # Each iteration starts again from the states of the previous time
+        # step
+        self._next_states = (
+            self._poles * self._states
+            + (self._inputs @ side_temperatures[:, :, None])[:, :, 0]
+        )
+        heat_flows: npt.NDArray[np.float64] = (
+            self._direct_gains @ side_temperatures[:, :, None]
+            + self._outputs @ self._next_states[:, :, None]
+        )[:, :, 0]
+        q_walls: npt.NDArray[np.float64] = (
+            self._areas
+            * heat_flows[np.arange(len(self._boundary_ids)), self._loss_faces]
+        )
+        # Output is updated in place, it may be linked to other modules
+        self.q_walls.update(zip(self._boundary_ids, q_walls.tolist()))
+
+    def end_iteration(self, time_step: int) -> None: ...
+
+    def end_time_step(self, time_step: int) -> None:
+        self._states = self._next_states
+
+    def end_simulation(self) -> None: ...
+
+    def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
+        return True
+
+    def _index_boundaries(self) -> None:
+        # Coefficients of each boundary (from the cache), face of the space
+        # losing q_walls and spaces on both sides of each boundary as a
+        # matrix (one row per side, the exterior being the last column)
+        self._boundaries = self.project_data.boundaries
+        spaces: List[Space] = self.project_data.spaces
+        self._space_ids = [space.id for space in spaces]
+        space_indices: Dict[str, int] = {
+            space_id: index for index, space_id in enumerate(self._space_ids)
+        }
+        exterior_index: int = len(self._space_ids)
+        self._inside_air_temperatures = np.array(
+            [space.inside_air_temperature for space in spaces], dtype=float
+        )
+        self._boundary_ids = list()
+        areas: List[float] = list()
+        coefficients: List[Tuple[npt.NDArray[np.float64], ...]] = list()
+        entries: List[Tuple[int, int]] = list()
+        loss_faces: List[int] = list()
+        for boundary in self._boundaries:
+            sides: Optional[Tuple[Tuple[int, int], int]] = get_boundary_sides(
+                boundary=boundary, space_indices=space_indices
+            )
+            layers: List[Any] = getattr(boundary, "layers", [])
+            # Boundaries without space or without layers are not computed
+            if (sides is None) or (len(layers) == 0):
+                continue
+            side_indices, loss_side = sides
+            boundary_index: int = len(self._boundary_ids)
+            self._boundary_ids.append(boundary.id)
+            areas.append(boundary.area)
+            coefficients.append(self._get_coefficients(layers=layers))
+            loss_faces.append(loss_side)
+            entries.extend(
+                [
+                    (2 * boundary_index, side_indices[0]),
+                    (2 * boundary_index + 1, side_indices[1]),
+                ]
+            )
+        number_of_boundaries: int = len(self._boundary_ids)
+        number_of_modes: int = max(
+            (len(poles) for poles, *_ in coefficients), default=0
+        )
+        self._poles = np.zeros((number_of_boundaries, number_of_modes))
+        self._inputs = np.zeros((number_of_boundaries, number_of_modes, 2))
+        self._outputs = np.zeros((number_of_boundaries, 2, number_of_modes))
+        self._direct_gains = np.zeros((number_of_boundaries, 2, 2))
+        for boundary_index, (poles, inputs, outputs, direct_gains) in enumerate(
+            coefficients
+        ):
+            self._poles[boundary_index, : len(poles)] = poles
+            self._inputs[boundary_index, : len(poles)] = inputs
+            self._outputs[boundary_index, :, : len(poles)] = outputs
+            self._direct_gains[boundary_index] = direct_gains
+        self._areas = np.array(areas, dtype=float)
+        self._loss_faces = np.array(loss_faces, dtype=int)
+        self._sides_incidence = create_incidence_matrix(
+            entries=entries,
+            shape=(2 * number_of_boundaries, exterior_index + 1),
+        )
+        # States start at the steady state of the current air temperatures
+        side_temperatures: npt.NDArray[np.float64] = (
+            self._get_side_temperatures(
+                inside_air_temperatures=get_values(
+                    values=self.inside_air_temperatures,
+                    ids=self._space_ids,
+                    default_values=self._inside_air_temperatures,
+                )
+            )
+        )
+        self._states = (self._inputs @ side_temperatures[:, :, None])[
+            :, :, 0
+        ] / (1.0 - self._poles)
+        self._next_states = self._states
+
+    def _get_side_temperatures(
+        self, inside_air_temperatures: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        # Air temperatures of both sides of each boundary (boundary x side)
+        return (
+            self._sides_incidence
+            @ np.append(inside_air_temperatures, self.exterior_air_temperature)
+        ).reshape(-1, 2)
+
+    def _get_coefficients(
+        self, layers: List[Any]
+    ) -> Tuple[npt.NDArray[np.float64], ...]:
+        # CTF coefficients of a layer stack, computed once
+        parameters: List[Parameter] = self._fields_metadata[
+            "project_data"
+        ].required
+        stack: Tuple[Any, ...] = (
+            self.time_step_duration,
+            self.maximum_cell_thickness,
+            *(
+                tuple(
+                    get_layer_value(
+                        layer=layer, name=name, parameters=parameters
+                    )
+                    for name in [
+                        "thickness",
+                        "thermal_conductivity",
+                        "density",
+                        "specific_heat",
+                    ]
+                )
+                for layer in layers
+            ),
+        )
+        if stack not in self._coefficients:
+            self._coefficients[stack] = self._compute_coefficients(
+                layers=layers
+            )
+        return self._coefficients[stack]
+
+    def _compute_coefficients(
+        self, layers: List[Any]
+    ) -> Tuple[npt.NDArray[np.float64], ...]:
+        # Cells' state space (per m²): C.dT/dt = -K.T + B.u, with u the air
+        # temperatures of the sides, and heat flows entering the faces
+        # y = D.u - B'.T. With the symmetric eigendecomposition of
+        # C^-1/2.K.C^-1/2, each mode i decays by a pole p_i = exp(-r_i.dt)
+        # over a time step, and the heat flows at the end of a time step
+        # are: y(z) = [D + sum_i o_i.i_i' / (1 - p_i / z)] u(z), with o_i
+        # the faces' outputs of the mode and i_i its response to the sides
+        # over a time step. Fast modes are added to D with their steady
+        # state gain, each slow mode is a state x_i, with
+        # x_i = p_i.x_i(previous time step) + i_i'.u, and y = D.u + O.x.
+        # Returns the poles (mode), inputs (mode x side), outputs (face x
+        # mode) and direct gains D (face x side, W/(m².K)).
+        capacities, half_resistances = (
+            np.array(values)
+            for values in zip(
+                *get_layer_cells(
+                    layers=layers,
+                    parameters=self._fields_metadata["project_data"].required,
+                    maximum_cell_thickness=self.maximum_cell_thickness,
+                )
+            )
+        )
+        couplings: npt.NDArray[np.float64] = 1.0 / (
+            half_resistances[:-1] + half_resistances[1:]
+        )
+        side_conductances: npt.NDArray[np.float64] = (
+            1.0 / half_resistances[[0, -1]]
+        )
+        number_of_cells: int = len(capacities)
+        input_matrix: npt.NDArray[np.float64] = np.zeros((number_of_cells, 2))
+        input_matrix[[0, -1], [0, 1]] = side_conductances
+        conductance_matrix: npt.NDArray[np.float64] = (
+            np.diag(
+                np.append(couplings, 0.0)
+                + np.append(0.0, couplings)
+                + input_matrix.sum(axis=1)
+            )
+            - np.diag(couplings, 1)
+            - np.diag(couplings, -1)
+        )
+        scales: npt.NDArray[np.float64] = 1.0 / np.sqrt(capacities)
+        rates, modes = np.linalg.eigh(
+            scales[:, None] * conductance_matrix * scales[None, :]
+        )
+        modes = scales[:, None] * modes
+        poles: npt.NDArray[np.float64] = np.exp(
+            -rates * self.time_step_duration
+        )
+        inputs: npt.NDArray[np.float64] = ((1.0 - poles) / rates)[:, None] * (
+            modes.T @ input_matrix
+        )
+        outputs: npt.NDArray[np.float64] = -(input_matrix.T @ modes)
+        is_slow: npt.NDArray[np.bool_] = poles > self.minimum_pole
+        direct_gains: npt.NDArray[np.float64] = np.diag(
+            side_conductances
+        ) + outputs[:, ~is_slow] @ (
+            inputs[~is_slow] / (1.0 - poles[~is_slow])[:, None]
+        )
+        return (
+            poles[is_slow],
+            inputs[is_slow],
+            outputs[:, is_slow],
+            direct_gains,
+        )
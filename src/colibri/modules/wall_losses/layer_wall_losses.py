@@ -5,17 +5,25 @@ LayerWallLosses class from WallLosses interface.
 from __future__ import annotations
 
 from enum import Enum, unique
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
 
 from colibri.core import ProjectData
 from colibri.core.fields import Parameter
 from colibri.interfaces.modules.wall_losses import WallLosses
+from colibri.utils.array_utils import get_values, index_boundaries
 from colibri.utils.colibri_utils import Attachment
 from colibri.utils.enums_utils import (
     ColibriProjectObjects,
     Units,
 )
 
+if TYPE_CHECKING:
+    from colibri.project_objects import Boundary, Space
+
 
 @unique
 class Materials(Enum):
@@ -144,27 +152,33 @@ class LayerWallLosses(WallLosses):
                 ),
             ],
         )
+        # Boundaries indexed as arrays (see _index_boundaries), the index is
+        # rebuilt when the boundaries of the project data change
+        self._boundaries: Optional[List[Boundary]] = None
+        self._boundary_ids: List[str] = list()
+        self._space_ids: List[str] = list()
+        self._conductances: npt.NDArray[np.float64] = np.zeros(0)
+        self._sides_incidence: sparse.csr_matrix = sparse.csr_matrix((0, 0))
+        self._inside_air_temperatures: npt.NDArray[np.float64] = np.zeros(0)
 
-    def initialize(self) -> bool: ...
+    def initialize(self) -> bool:
+        self._index_boundaries()
+        return True
 
     def run(self, time_step: int, number_of_iterations: int) -> None:
-        for boundary in self.project_data.boundaries:
-            # TODO: How to handle multiple spaces?
-            inside_air_temperature: float = self.inside_air_temperatures.get(
-                boundary.spaces[0].id,
-                boundary.spaces[0].inside_air_temperature,
-            )
-            thermal_resistance: float = 0.0
-            for layer in boundary.layers:
-                thickness: float = layer.thickness
-                thermal_conductivity: float = layer.thermal_conductivity
-                thermal_resistance += thickness / thermal_conductivity
-            thermal_conductance: float = 1.0 / thermal_resistance
-            self.q_walls[boundary.id] = (
-                thermal_conductance
-                * boundary.area
-                * (inside_air_temperature - self.exterior_air_temperature)
-            )
+        if self._boundaries is not self.project_data.boundaries:
+            self._index_boundaries()
+        inside_air_temperatures: npt.NDArray[np.float64] = get_values(
+            values=self.inside_air_temperatures,
+            ids=self._space_ids,
+            default_values=self._inside_air_temperatures,
+        )
+        q_walls: npt.NDArray[np.float64] = self._conductances * (
+            self._sides_incidence
+            @ np.append(inside_air_temperatures, self.exterior_air_temperature)
+        )
+        # Output is updated in place, it may be linked to other modules
+        self.q_walls.update(zip(self._boundary_ids, q_walls.tolist()))
 
     def end_iteration(self, time_step: int) -> None: ...
 
@@ -175,6 +189,40 @@ class LayerWallLosses(WallLosses):
     def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
         return True
 
+    def _index_boundaries(self) -> None:
+        # Thermal conductance times area (W/K) of each boundary, computed
+        # once since layers do not change during a simulation, and sides of
+        # each boundary as a matrix (boundary x (spaces + exterior), +1 for
+        # the space losing q_walls, -1 for the other side) so that the
+        # temperature differences are a single product
+        self._boundaries = self.project_data.boundaries
+        spaces: List[Space] = self.project_data.spaces
+        self._space_ids = [space.id for space in spaces]
+        self._inside_air_temperatures = np.array(
+            [space.inside_air_temperature for space in spaces], dtype=float
+        )
+        (
+            self._boundary_ids,
+            self._conductances,
+            self._sides_incidence,
+        ) = index_boundaries(
+            boundaries=self._boundaries,
+            space_ids=self._space_ids,
+            get_conductance=lambda boundary: (
+                boundary.area / self._get_thermal_resistance(boundary=boundary)
+            ),
+        )
+
+    @staticmethod
+    def _get_thermal_resistance(boundary: Boundary) -> float:
+        # Thermal resistance of the boundary's layers (m².K/W)
+        thermal_resistance: float = 0.0
+        for layer in boundary.layers:
+            thickness: float = layer.thickness
+            thermal_conductivity: float = layer.thermal_conductivity
+            thermal_resistance += thickness / thermal_conductivity
+        return thermal_resistance
+
 
 if __name__ == "__main__":
     from colibri.config.constants import LOGGER
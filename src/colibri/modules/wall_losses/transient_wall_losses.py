@@ -0,0 +1,371 @@
+"""
+TransientWallLosses class from WallLosses interface.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
+from scipy.linalg import lapack
+
+from colibri.core import ProjectData
+from colibri.core.fields import Parameter
+from colibri.interfaces.modules.wall_losses import WallLosses
+from colibri.utils.array_utils import (
+    create_incidence_matrix,
+    get_boundary_sides,
+    get_layer_cells,
+    get_values,
+)
+from colibri.utils.colibri_utils import Attachment
+from colibri.utils.enums_utils import (
+    ColibriProjectObjects,
+    Units,
+)
+
+if TYPE_CHECKING:
+    from colibri.project_objects import Boundary, Space
+
+
+class TransientWallLosses(WallLosses):
+    """Class representing wall losses with wall layers and their thermal
+    mass, advanced with an implicit scheme.
+
+    Each layer of a boundary is divided into cells (finite volumes) no
+    thicker than the maximum cell thickness, the cells of the first and
+    last layers are linked to the air on both sides of the boundary. Sides
+    which are not spaces of the project (e.g. "exterior" or "ground") are
+    at the exterior air temperature. Boundaries without layers are not
+    computed.
+
+    The cells of all the boundaries are stacked in a single tridiagonal
+    system (the boundaries are not linked to each other), factorized once
+    and solved at each time step with one LAPACK call (gttrs) for all the
+    boundaries.
+
+    q_walls are the losses of the space on side 1 (or of the only space of
+    the boundary), at the end of the time step. For boundaries between two
+    spaces, the gains of the space on side 2 differ from these losses by
+    the heat stored in the boundary."""
+
+    def __init__(
+        self,
+        name: str,
+        inside_air_temperatures: Optional[Dict[str, float]] = None,
+        exterior_air_temperature: float = 0.0,
+        q_walls: Optional[Dict[str, float]] = None,
+        time_step_duration: float = 3_600.0,
+        maximum_cell_thickness: float = 0.05,
+        project_data: Optional[ProjectData] = None,
+    ) -> None:
+        """Initialize a new TransientWallLosses instance."""
+        if inside_air_temperatures is None:
+            inside_air_temperatures: Dict[str, float] = dict()
+        if q_walls is None:
+            q_walls: Dict[str, float] = dict()
+        super().__init__(
+            name=name,
+            inside_air_temperatures=inside_air_temperatures,
+            exterior_air_temperature=exterior_air_temperature,
+            q_walls=q_walls,
+        )
+        self.time_step_duration = self.define_parameter(
+            name="time_step_duration",
+            default_value=time_step_duration,
+            description="Duration of a time step.",
+            format=float,
+            min=0,
+            max=float("inf"),
+            unit=Units.SECOND,
+        )
+        self.maximum_cell_thickness = self.define_parameter(
+            name="maximum_cell_thickness",
+            default_value=maximum_cell_thickness,
+            description="Maximum thickness of the cells of a layer.",
+            format=float,
+            min=0.001,
+            max=2,
+            unit=Units.METER,
+        )
+        self.project_data = self.define_parameter(
+            name="project_data",
+            default_value=project_data,
+            description="Project data.",
+            format=ProjectData,
+            min=None,
+            max=None,
+            unit=Units.UNITLESS,
+            attached_to=None,
+            required=[
+                Parameter(
+                    name="layers",
+                    default_value=[],
+                    description="Layers of a boundary.",
+                    format=List["Layer"],
+                    min=None,
+                    max=None,
+                    unit=Units.UNITLESS,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ARCHETYPE,
+                        class_name="Boundary",
+                        from_element_object="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="thickness",
+                    default_value=0.3,
+                    description="Thickness of the layer.",
+                    format=float,
+                    min=0.001,
+                    max=2,
+                    unit=Units.METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="thermal_conductivity",
+                    default_value=1.75,
+                    description="Thermal conductivity of the layer.",
+                    format=float,
+                    min=0.01,
+                    max=5,
+                    unit=Units.WATT_PER_METER_PER_KELVIN,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="specific_heat",
+                    default_value=900,
+                    description="Specific heat capacity (known as C) of the layer.",
+                    format=float,
+                    min=100,
+                    max=8_000,
+                    unit=Units.JOULE_PER_KILO_GRAM,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+                Parameter(
+                    name="density",
+                    default_value=2_500,
+                    description="Volumetric density of the layer.",
+                    format=float,
+                    min=0.1,
+                    max=50_000,
+                    unit=Units.KILOGRAM_PER_CUBIC_METER,
+                    attached_to=Attachment(
+                        category=ColibriProjectObjects.ELEMENT_OBJECT,
+                        from_archetype=True,
+                        class_name="Layer",
+                    ),
+                ),
+            ],
+        )
+        # Cells of the boundaries stacked as a tridiagonal system (see
+        # _index_boundaries), the index is rebuilt when the boundaries of
+        # the project data change
+        self._boundaries: Optional[List[Boundary]] = None
+        self._boundary_ids: List[str] = list()
+        self._space_ids: List[str] = list()
+        self._inside_air_temperatures: npt.NDArray[np.float64] = np.zeros(0)
+        self._capacity_rates: npt.NDArray[np.float64] = np.zeros(0)
+        self._couplings: npt.NDArray[np.float64] = np.zeros(0)
+        # Cells x (spaces + exterior) conductances to the air of the sides
+        self._sides_incidence: sparse.csr_matrix = sparse.csr_matrix((0, 0))
+        self._loss_cells: npt.NDArray[np.int64] = np.zeros(0, dtype=int)
+        self._loss_spaces: npt.NDArray[np.int64] = np.zeros(0, dtype=int)
+        self._loss_conductances: npt.NDArray[np.float64] = np.zeros(0)
+        # LU factorization of the implicit scheme's matrix (gttrf)
+        self._factors: Tuple[npt.NDArray[Any], ...] = tuple()
+        # Temperatures of the cells at the beginning and at the end of the
+        # current time step
+        self._temperatures: npt.NDArray[np.float64] = np.zeros(0)
+        self._next_temperatures: npt.NDArray[np.float64] = np.zeros(0)
+
+    def initialize(self) -> bool:
+        self._index_boundaries()
+        return True
+
+    def run(self, time_step: int, number_of_iterations: int) -> None:
+        if self._boundaries is not self.project_data.boundaries:
+            self._index_boundaries()
+        inside_air_temperatures: npt.NDArray[np.float64] = get_values(
+            values=self.inside_air_temperatures,
+            ids=self._space_ids,
+            default_values=self._inside_air_temperatures,
+        )
+        # Each iteration starts again from the temperatures of the
+        # beginning of the time step
+        self._next_temperatures = self._solve(
+            factors=self._factors,
+            right_hand_side=self._capacity_rates * self._temperatures
+            + self._get_sides_forcing(
+                inside_air_temperatures=inside_air_temperatures
+            ),
+        )
+        q_walls: npt.NDArray[np.float64] = self._loss_conductances * (
+            inside_air_temperatures[self._loss_spaces]
+            - self._next_temperatures[self._loss_cells]
+        )
+        # Output is updated in place, it may be linked to other modules
+        self.q_walls.update(zip(self._boundary_ids, q_walls.tolist()))
+
+    def end_iteration(self, time_step: int) -> None: ...
+
+    def end_time_step(self, time_step: int) -> None:
+        self._temperatures = self._next_temperatures
+
+    def end_simulation(self) -> None: ...
+
+    def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
+        return True
+
+    def _index_boundaries(self) -> None:
+        # Cells of all the boundaries, in the order of the boundaries and
+        # of their layers (from side 1 to side 2): capacities, conductances
+        # between consecutive cells (zero between two boundaries) and
+        # conductances of the first and last cells to the air of the sides
+        self._boundaries = self.project_data.boundaries
+        spaces: List[Space] = self.project_data.spaces
+        self._space_ids = [space.id for space in spaces]
+        space_indices: Dict[str, int] = {
+            space_id: index for index, space_id in enumerate(self._space_ids)
+        }
+        exterior_index: int = len(self._space_ids)
+        self._inside_air_temperatures = np.array(
+            [space.inside_air_temperature for space in spaces], dtype=float
+        )
+        self._boundary_ids = list()
+        capacities: List[float] = list()
+        couplings: List[float] = list()
+        entries: List[Tuple[int, int]] = list()
+        values: List[float] = list()
+        loss_cells: List[int] = list()
+        loss_spaces: List[int] = list()
+        loss_conductances: List[float] = list()
+        # Layers' properties missing in the project data (e.g. density)
+        # take the default value of the module's required parameter
+        parameters: List[Parameter] = self._fields_metadata[
+            "project_data"
+        ].required
+        for boundary in self._boundaries:
+            sides: Optional[Tuple[Tuple[int, int], int]] = get_boundary_sides(
+                boundary=boundary, space_indices=space_indices
+            )
+            layers: List[Any] = getattr(boundary, "layers", [])
+            # Boundaries without space or without layers are not computed
+            if (sides is None) or (len(layers) == 0):
+                continue
+            side_indices, loss_side = sides
+            self._boundary_ids.append(boundary.id)
+            cells: List[Tuple[float, float]] = get_layer_cells(
+                layers=layers,
+                parameters=parameters,
+                maximum_cell_thickness=self.maximum_cell_thickness,
+            )
+            first_cell: int = len(capacities)
+            previous_resistance: Optional[float] = None
+            for capacity, half_resistance in cells:
+                if previous_resistance is not None:
+                    couplings.append(
+                        boundary.area / (previous_resistance + half_resistance)
+                    )
+                elif first_cell > 0:
+                    couplings.append(0.0)
+                capacities.append(boundary.area * capacity)
+                previous_resistance = half_resistance
+            last_cell: int = len(capacities) - 1
+            first_conductance: float = boundary.area / cells[0][1]
+            last_conductance: float = boundary.area / cells[-1][1]
+            # The space losing q_walls is on the first cell's side (side 1)
+            # or on the last cell's side (side 2)
+            loss_cells.append((first_cell, last_cell)[loss_side])
+            loss_conductances.append(
+                (first_conductance, last_conductance)[loss_side]
+            )
+            loss_spaces.append(side_indices[loss_side])
+            entries.extend(
+                [(first_cell, side_indices[0]), (last_cell, side_indices[1])]
+            )
+            values.extend([first_conductance, last_conductance])
+        number_of_cells: int = len(capacities)
+        self._couplings = np.array(couplings, dtype=float)
+        self._sides_incidence = create_incidence_matrix(
+            entries=entries,
+            shape=(number_of_cells, exterior_index + 1),
+            values=values,
+        )
+        self._loss_cells = np.array(loss_cells, dtype=int)
+        self._loss_spaces = np.array(loss_spaces, dtype=int)
+        self._loss_conductances = np.array(loss_conductances, dtype=float)
+        self._capacity_rates = (
+            np.array(capacities, dtype=float) / self.time_step_duration
+        )
+        self._factors = self._factorize(diagonal=self._capacity_rates)
+        # Cells start at the steady state of the current air temperatures
+        self._temperatures = self._solve(
+            factors=self._factorize(diagonal=np.zeros(number_of_cells)),
+            right_hand_side=self._get_sides_forcing(
+                inside_air_temperatures=get_values(
+                    values=self.inside_air_temperatures,
+                    ids=self._space_ids,
+                    default_values=self._inside_air_temperatures,
+                )
+            ),
+        )
+        self._next_temperatures = self._temperatures
+
+    def _get_sides_forcing(
+        self, inside_air_temperatures: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        # Conductances to the sides times the air temperatures of the sides
+        # (W), the part of the heat flows depending on the cells'
+        # temperatures being in the matrix
+        return self._sides_incidence @ np.append(
+            inside_air_temperatures, self.exterior_air_temperature
+        )
+
+    def _factorize(
+        self, diagonal: npt.NDArray[np.float64]
+    ) -> Tuple[npt.NDArray[Any], ...]:
+        # Tridiagonal matrix (diagonal + conductance matrix of the cells)
+        # factorized with LAPACK's gttrf
+        if len(diagonal) == 0:
+            return tuple()
+        diagonal = (
+            diagonal
+            + np.asarray(self._sides_incidence.sum(axis=1)).ravel()
+            + np.append(self._couplings, 0.0)
+            + np.append(0.0, self._couplings)
+        )
+        *factors, info = lapack.dgttrf(
+            -self._couplings, diagonal, -self._couplings
+        )
+        if info != 0:
+            raise ValueError(
+                f"The cells' matrix of {self.name} is singular (gttrf info "
+                f"{info})."
+            )
+        return tuple(factors)
+
+    @staticmethod
+    def _solve(
+        factors: Tuple[npt.NDArray[Any], ...],
+        right_hand_side: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        # Solve all the boundaries at once, with the LU factorization
+        if len(factors) == 0:
+            return np.zeros(0)
+        temperatures, _ = lapack.dgttrs(*factors, right_hand_side)
+        return temperatures
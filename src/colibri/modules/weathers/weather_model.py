@@ -2,7 +2,10 @@
 WeatherModel class from Weather interface.
 """
 
-from typing import List
+from typing import Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
 
 from colibri.interfaces.modules.weather import Weather
 from colibri.utils.colibri_utils import Attachment
@@ -10,6 +13,7 @@ from colibri.utils.enums_utils import (
     ColibriProjectObjects,
     Units,
 )
+from colibri.utils.epw_utils import read_epw
 
 
 class WeatherModel(Weather):
@@ -19,6 +23,7 @@ class WeatherModel(Weather):
         exterior_air_temperature: float = 0.0,
         altitudes: List[float] = [0.0],
         scenario_exterior_air_temperatures: List[float] = [],
+        epw_file: Optional[str] = None,
     ):
         super().__init__(
             name=name, exterior_air_temperature=exterior_air_temperature
@@ -41,6 +46,16 @@ class WeatherModel(Weather):
             max=100,
             unit=Units.DEGREE_CELSIUS,
         )
+        self.epw_file = self.define_parameter(
+            name="epw_file",
+            default_value=epw_file,
+            description="EPW weather file, whose dry-bulb temperatures are "
+            "used without scenario exterior air temperatures.",
+            format=str,
+            min=None,
+            max=None,
+            unit=Units.UNITLESS,
+        )
         self.corrected_exterior_air_temperatures = self.define_parameter(
             name="corrected_exterior_air_temperatures",
             default_value=list(),
@@ -56,18 +71,40 @@ class WeatherModel(Weather):
             ),
         )
         self.temperature_diminution_with_altitude: float = 0.0065  # °C/m
+        # Arrays of the EPW file by field (see read_epw), read-only
+        self.weather_data: Dict[str, npt.NDArray[np.float64]] = dict()
+        # Corrected temperatures as an array, for the lookup of each time
+        # step
+        self._corrected_exterior_air_temperatures: npt.NDArray[np.float64] = (
+            np.zeros(0)
+        )
 
     def initialize(self) -> bool:
-        mean_altitude = sum(self.altitudes) / len(self.altitudes)
-        self.corrected_exterior_air_temperatures: List[float] = [
-            temperature
+        # The EPW file is parsed once, then read from the cache
+        if self.epw_file is not None:
+            self.weather_data = read_epw(epw_file=self.epw_file)
+        exterior_air_temperatures: npt.NDArray[np.float64] = np.asarray(
+            self.scenario_exterior_air_temperatures, dtype=float
+        )
+        if (len(exterior_air_temperatures) == 0) and (
+            len(self.weather_data) > 0
+        ):
+            exterior_air_temperatures = self.weather_data[
+                "dry_bulb_temperature"
+            ]
+        mean_altitude: float = sum(self.altitudes) / len(self.altitudes)
+        self._corrected_exterior_air_temperatures = (
+            exterior_air_temperatures
             - self.temperature_diminution_with_altitude * mean_altitude
-            for temperature in self.scenario_exterior_air_temperatures
-        ]
+        )
+        self.corrected_exterior_air_temperatures = (
+            self._corrected_exterior_air_temperatures.tolist()
+        )
+        return True
 
     def run(self, time_step: int, number_of_iterations: int) -> None:
-        self.exterior_air_temperature = (
-            self.corrected_exterior_air_temperatures[time_step]
+        self.exterior_air_temperature = float(
+            self._corrected_exterior_air_temperatures[time_step]
         )
 
     def end_iteration(self, time_step: int) -> None: ...
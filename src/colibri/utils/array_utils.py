@@ -0,0 +1,405 @@
+"""
+Helper functions to handle modules' values (dictionaries keyed by the ids
+of the project objects) as arrays, for vectorized modules.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
+
+from colibri.config.constants import EMITTER
+from colibri.utils.exceptions_utils import UserInputError
+
+if TYPE_CHECKING:
+    from colibri.core.fields import Parameter
+    from colibri.interfaces import BoundaryObject
+    from colibri.project_objects import Boundary, Space
+
+
+def get_values(
+    values: Dict[str, float],
+    ids: Sequence[str],
+    default_values: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Get the values of the given ids as an array
+
+    Parameters
+    ----------
+    values : Dict[str, float]
+        Values by id (e.g. a module's input)
+    ids : Sequence[str]
+        Ids of the values, in the order of the array
+    default_values : npt.NDArray[np.float64]
+        Values used for the ids missing in values (same order as the ids),
+        returned as is if values is empty
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Values of the given ids
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    if len(values) == 0:
+        return default_values
+    return np.fromiter(
+        (
+            values.get(id_, default_value)
+            for id_, default_value in zip(ids, default_values.tolist())
+        ),
+        dtype=float,
+        count=len(ids),
+    )
+
+
+def create_incidence_matrix(
+    entries: List[Tuple[int, int]],
+    shape: Tuple[int, int],
+    values: Optional[Sequence[float]] = None,
+) -> sparse.csr_matrix:
+    """Create a sparse incidence matrix (e.g. space x boundary), where each
+    entry (row, column) counts for one (or for its value)
+
+    Parameters
+    ----------
+    entries : List[Tuple[int, int]]
+        Entries (row, column) of the matrix, duplicated entries are summed
+    shape : Tuple[int, int]
+        Shape of the matrix
+    values : Optional[Sequence[float]] = None
+        Values of the entries (e.g. -1 for a boundary's second space), one
+        for each entry by default
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Incidence matrix
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    if len(entries) == 0:
+        return sparse.csr_matrix(shape, dtype=float)
+    if values is None:
+        values = np.ones(len(entries))
+    rows, columns = zip(*entries)
+    return sparse.csr_matrix((values, (rows, columns)), shape=shape)
+
+
+def get_boundary_space_indices(
+    boundary: Boundary, space_indices: Dict[str, int]
+) -> Tuple[Optional[int], Optional[int]]:
+    """Get the indices of the spaces on both sides of a boundary: the space
+    losing the boundary's q_walls (space on side 1, or on side 2 if side 1
+    is not a space) and the space gaining them
+
+    Parameters
+    ----------
+    boundary : Boundary
+        Boundary between the spaces
+    space_indices : Dict[str, int]
+        Indices of the spaces of the project, by id
+
+    Returns
+    -------
+    Tuple[Optional[int], Optional[int]]
+        Index of the space losing q_walls (the boundary's first space if
+        no side is a space, None if the boundary has no space) and index
+        of the space gaining q_walls (None if the other side is not a
+        space, e.g. the exterior)
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    first_index: Optional[int] = space_indices.get(boundary.side_1)
+    second_index: Optional[int] = space_indices.get(boundary.side_2)
+    if first_index is None:
+        first_index, second_index = second_index, None
+    if (first_index is None) and (len(boundary.spaces) > 0):
+        first_index = space_indices.get(boundary.spaces[0].id)
+    return first_index, second_index
+
+
+def get_boundary_sides(
+    boundary: Boundary, space_indices: Dict[str, int]
+) -> Optional[Tuple[Tuple[int, int], int]]:
+    """Get the columns of both sides of a boundary (side 1 then side 2, the
+    order of its layers) among the spaces followed by the exterior, and the
+    side of the space losing the boundary's q_walls
+
+    Parameters
+    ----------
+    boundary : Boundary
+        Boundary between the spaces
+    space_indices : Dict[str, int]
+        Indices of the spaces of the project (from 0 to the number of
+        spaces), by id
+
+    Returns
+    -------
+    Optional[Tuple[Tuple[int, int], int]]
+        Columns of side 1 and of side 2 (the number of spaces for a side
+        which is not a space, e.g. the exterior) and side (0 or 1) of the
+        space losing q_walls, None if the boundary has no space
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    first_index, second_index = get_boundary_space_indices(
+        boundary=boundary, space_indices=space_indices
+    )
+    if first_index is None:
+        return None
+    exterior_index: int = len(space_indices)
+    # The space losing q_walls is on side 1, unless side 1 is not a space
+    # (e.g. "exterior") and side 2 is
+    if (space_indices.get(boundary.side_1) is None) and (
+        space_indices.get(boundary.side_2) == first_index
+    ):
+        return (exterior_index, first_index), 1
+    return (
+        first_index,
+        exterior_index if second_index is None else second_index,
+    ), 0
+
+
+def index_boundaries(
+    boundaries: Sequence[Boundary],
+    space_ids: Sequence[str],
+    get_conductance: Callable[[Boundary], float],
+) -> Tuple[List[str], npt.NDArray[np.float64], sparse.csr_matrix]:
+    """Index the boundaries with a space, whose q_walls are their
+    conductance times the difference of the air temperatures of their
+    sides
+
+    Parameters
+    ----------
+    boundaries : Sequence[Boundary]
+        Boundaries of the project
+    space_ids : Sequence[str]
+        Ids of the spaces of the project
+    get_conductance : Callable[[Boundary], float]
+        Conductance (W/K) of a boundary
+
+    Returns
+    -------
+    Tuple[List[str], npt.NDArray[np.float64], sparse.csr_matrix]
+        Ids of the boundaries with a space, their conductances and their
+        sides as a matrix (boundary x (spaces + exterior), +1 for the side
+        losing q_walls and -1 for the other one), so that q_walls are
+        conductances * (sides @ air temperatures of the spaces and of the
+        exterior)
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    space_indices: Dict[str, int] = {
+        space_id: index for index, space_id in enumerate(space_ids)
+    }
+    boundary_ids: List[str] = list()
+    conductances: List[float] = list()
+    entries: List[Tuple[int, int]] = list()
+    values: List[float] = list()
+    for boundary in boundaries:
+        sides: Optional[Tuple[Tuple[int, int], int]] = get_boundary_sides(
+            boundary=boundary, space_indices=space_indices
+        )
+        # Boundaries without space are not computed
+        if sides is None:
+            continue
+        side_indices, loss_side = sides
+        boundary_index: int = len(boundary_ids)
+        boundary_ids.append(boundary.id)
+        conductances.append(get_conductance(boundary))
+        entries.extend(
+            [
+                (boundary_index, side_indices[loss_side]),
+                (boundary_index, side_indices[1 - loss_side]),
+            ]
+        )
+        values.extend([1.0, -1.0])
+    return (
+        boundary_ids,
+        np.array(conductances, dtype=float),
+        create_incidence_matrix(
+            entries=entries,
+            shape=(len(boundary_ids), len(space_ids) + 1),
+            values=values,
+        ),
+    )
+
+
+def get_space_emitters(
+    spaces: Sequence[Space],
+) -> Tuple[List[BoundaryObject], npt.NDArray[np.int64]]:
+    """Get the emitters of the spaces (boundary objects whose type is
+    "emitter", whatever its case) and the index of their space
+
+    Parameters
+    ----------
+    spaces : Sequence[Space]
+        Spaces of the project
+
+    Returns
+    -------
+    Tuple[List[BoundaryObject], npt.NDArray[np.int64]]
+        Emitters, each one once (an emitter of a boundary between two
+        spaces belongs to the first one), and index of their space in the
+        spaces
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    emitters: Dict[str, BoundaryObject] = dict()
+    space_indices: List[int] = list()
+    for space_index, space in enumerate(spaces):
+        for boundary in space.boundaries:
+            for boundary_object in boundary.object_collection:
+                if (boundary_object.type.lower() == EMITTER) and (
+                    boundary_object.id not in emitters
+                ):
+                    emitters[boundary_object.id] = boundary_object
+                    space_indices.append(space_index)
+    return list(emitters.values()), np.array(space_indices, dtype=int)
+
+
+def get_layer_value(
+    layer: Any, name: str, parameters: Sequence[Parameter]
+) -> float:
+    """Get a property of a boundary's layer, the default value of the
+    module's required parameter if the layer does not have it (e.g. no
+    density in the project data)
+
+    Parameters
+    ----------
+    layer : Any
+        Layer of a boundary
+    name : str
+        Name of the property (e.g. "thermal_conductivity")
+    parameters : Sequence[Parameter]
+        Required parameters of the module, one of them named as the
+        property
+
+    Returns
+    -------
+    float
+        Value of the layer's property
+
+    Raises
+    ------
+    UserInputError
+        If the layer does not have the property and no parameter is named
+        as it
+
+    Examples
+    --------
+    >>> None
+    """
+    if hasattr(layer, name):
+        return getattr(layer, name)
+    for parameter in parameters:
+        if parameter.name == name:
+            return parameter.default_value
+    raise UserInputError(
+        f"Layer {getattr(layer, 'name', None)!r} has no {name} and no "
+        "default value."
+    )
+
+
+def get_layer_cells(
+    layers: Sequence[Any],
+    parameters: Sequence[Parameter],
+    maximum_cell_thickness: float,
+) -> List[Tuple[float, float]]:
+    """Discretize the layers of a boundary into cells (in the order of the
+    layers, from side 1 to side 2), each layer into equal cells no thicker
+    than the maximum thickness
+
+    Parameters
+    ----------
+    layers : Sequence[Any]
+        Layers of a boundary
+    parameters : Sequence[Parameter]
+        Required parameters of the module, giving the default values of the
+        layers' properties (see get_layer_value)
+    maximum_cell_thickness : float
+        Maximum thickness of a cell (m)
+
+    Returns
+    -------
+    List[Tuple[float, float]]
+        Capacity per area (J/(m².K)) and half thermal resistance (m².K/W)
+        of each cell
+
+    Raises
+    ------
+    UserInputError
+        If a layer does not have a property and no parameter is named as it
+
+    Examples
+    --------
+    >>> None
+    """
+    cells: List[Tuple[float, float]] = list()
+    for layer in layers:
+        thickness, thermal_conductivity, density, specific_heat = (
+            get_layer_value(layer=layer, name=name, parameters=parameters)
+            for name in [
+                "thickness",
+                "thermal_conductivity",
+                "density",
+                "specific_heat",
+            ]
+        )
+        number_of_cells: int = max(
+            int(np.ceil(thickness / maximum_cell_thickness)), 1
+        )
+        cell_thickness: float = thickness / number_of_cells
+        capacity: float = cell_thickness * density * specific_heat
+        half_resistance: float = cell_thickness / (2.0 * thermal_conductivity)
+        cells.extend([(capacity, half_resistance)] * number_of_cells)
+    return cells
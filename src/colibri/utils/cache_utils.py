@@ -0,0 +1,223 @@
+"""
+Helper classes or functions to cache generated data (e.g. schemes)
+for the `colibri` package.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from colibri.config.constants import (
+    COLIBRI,
+    COLIBRI_CACHE_DIR,
+    LOGGER,
+)
+
+
+class SchemeCache:
+    """Class caching the schemes generated for a set of modules, in memory
+    and (if COLIBRI_CACHE_DIR is set) in JSON files, which are keyed by
+    COLIBRI's version and the source code of the classes of the scheme."""
+
+    def __init__(self) -> None:
+        """Initialize a new SchemeCache instance."""
+        # Schemes are kept serialized, each caller gets its own copy
+        self._schemes: Dict[str, str] = dict()
+        # Fingerprints of the source files (of the class and its parents),
+        # by class
+        self._fingerprints: Dict[type, Dict[str, str]] = dict()
+        self._version: Optional[str] = None
+
+    def get_key(self, modules: Sequence[str], classes: Sequence[type]) -> str:
+        """Get the key of the scheme generated for the given modules
+
+        Parameters
+        ----------
+        modules : Sequence[str]
+            Names of the modules of the scheme
+        classes : Sequence[type]
+            Classes used to generate the scheme (modules, project objects)
+
+        Returns
+        -------
+        str
+            Key of the scheme
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        fingerprints: Dict[str, str] = dict()
+        for class_signature in classes:
+            fingerprints.update(
+                self._get_fingerprints(class_signature=class_signature)
+            )
+        if self._version is None:
+            self._version = self._get_version()
+        key_data: Dict[str, Any] = {
+            "version": self._version,
+            "modules": list(modules),
+            "fingerprints": sorted(fingerprints.items()),
+        }
+        return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached scheme (from memory or from its cache file)
+
+        Parameters
+        ----------
+        key : str
+            Key of the scheme
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Copy of the cached scheme, None if the scheme is not cached
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        if key not in self._schemes:
+            cache_file: Optional[Path] = self.get_cache_file(key=key)
+            if (cache_file is None) or (cache_file.is_file() is False):
+                return None
+            try:
+                self._schemes[key] = cache_file.read_text()
+                scheme: Dict[str, Any] = json.loads(self._schemes[key])
+            except (OSError, ValueError) as error:
+                LOGGER.warning(
+                    f"Scheme cache file {cache_file} ignored: {error}"
+                )
+                self._schemes.pop(key, None)
+                return None
+            return scheme
+        return json.loads(self._schemes[key])
+
+    def set(self, key: str, scheme: Dict[str, Any]) -> None:
+        """Cache a scheme (in memory and in its cache file)
+
+        Parameters
+        ----------
+        key : str
+            Key of the scheme
+        scheme : Dict[str, Any]
+            Scheme to be cached
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        TypeError
+            If the scheme can not be serialized to JSON
+
+        Examples
+        --------
+        >>> None
+        """
+        self._schemes[key] = json.dumps(scheme)
+        cache_file: Optional[Path] = self.get_cache_file(key=key)
+        if cache_file is None:
+            return
+        # The file is written under another name then renamed, so that a
+        # cache file is never read while being written
+        temporary_file: Path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temporary_file.write_text(self._schemes[key])
+            os.replace(temporary_file, cache_file)
+        except OSError as error:
+            LOGGER.warning(
+                f"Scheme cache file {cache_file} not written: {error}"
+            )
+            temporary_file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Clear the schemes cached in memory (cache files are kept)
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        self._schemes.clear()
+        self._fingerprints.clear()
+
+    @staticmethod
+    def get_cache_file(key: str) -> Optional[Path]:
+        """Get the cache file of a scheme
+
+        Parameters
+        ----------
+        key : str
+            Key of the scheme
+
+        Returns
+        -------
+        Optional[Path]
+            Cache file of the scheme, None if COLIBRI_CACHE_DIR is not set
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        cache_directory: Optional[str] = os.environ.get(COLIBRI_CACHE_DIR)
+        if not cache_directory:
+            return None
+        return Path(cache_directory) / f"scheme_{key}.json"
+
+    def _get_fingerprints(self, class_signature: type) -> Dict[str, str]:
+        # Source files are only read once per class (built-in classes,
+        # e.g. object, have no source file)
+        if class_signature not in self._fingerprints:
+            fingerprints: Dict[str, str] = dict()
+            for parent_class in inspect.getmro(class_signature):
+                try:
+                    source_file: Optional[str] = inspect.getsourcefile(
+                        parent_class
+                    )
+                except TypeError:
+                    source_file = None
+                if (source_file is None) or (source_file in fingerprints):
+                    continue
+                fingerprints[source_file] = hashlib.sha256(
+                    Path(source_file).read_bytes()
+                ).hexdigest()
+            self._fingerprints[class_signature] = fingerprints
+        return self._fingerprints[class_signature]
+
+    @staticmethod
+    def _get_version() -> str:
+        try:
+            return version(COLIBRI)
+        except PackageNotFoundError:
+            return ""
+
+
+# Schemes already generated (used by ProjectOrchestrator.generate_scheme)
+SCHEME_CACHE: SchemeCache = SchemeCache()
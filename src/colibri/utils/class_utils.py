@@ -4,12 +4,15 @@ Helper classes or functions when working with classes for the `colibri` package.
 
 import importlib
 import inspect
+from dataclasses import dataclass
+from importlib.metadata import EntryPoint, entry_points
 from inspect import FullArgSpec
 from types import ModuleType
 from typing import Any, Dict, List, Tuple, Type, Union
 
 from colibri.config.constants import (
     COLIBRI_INTERFACES_MODULE_PATH,
+    COLIBRI_MODULES_ENTRY_POINT_GROUP,
     COLIBRI_MODULES_MODULE_PATH,
     COLIBRI_PROJECT_OBJECTS_MODULE_PATH,
 )
@@ -21,6 +24,267 @@ from colibri.utils.exceptions_utils import (
 )
 
 
+@dataclass(frozen=True)
+class ClassRecord:
+    """Class gathering all information needed to instantiate a class
+    (resolved once by the class registry)."""
+
+    class_signature: Type
+    parameter_names: Tuple[str, ...]
+    default_values: Dict[str, Any]
+    is_project_object: bool
+
+    def create_instance(self, class_parameters: Dict[str, Any]) -> object:
+        """Create an instance of the class
+
+        Parameters
+        ----------
+        class_parameters : Dict[str, Any]
+            Parameters required to create the instance of the class
+
+        Returns
+        -------
+        instance : object
+            Instance of the class
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        parameters: Dict[str, Any] = {
+            name: class_parameters.get(name, self.default_values[name])
+            for name in self.parameter_names
+        }
+        instance: object = self.class_signature(**parameters)
+        if self.is_project_object is True:
+            for name, value in class_parameters.items():
+                if name not in parameters:
+                    setattr(instance, name, value)
+        return instance
+
+
+class ClassRegistry:
+    """Class resolving COLIBRI's classes by their name, each class is
+    looked up (and inspected) only once."""
+
+    def __init__(self) -> None:
+        """Initialize a new ClassRegistry instance."""
+        self._classes: Dict[Tuple[str, ColibriObjectTypes], Type] = dict()
+        self._records: Dict[Tuple[str, ColibriObjectTypes], ClassRecord] = (
+            dict()
+        )
+        # Modules provided by other packages (loaded on first use)
+        self._entry_points: Union[Dict[str, EntryPoint], None] = None
+
+    def get_class(
+        self, class_name: str, output_type: ColibriObjectTypes
+    ) -> Type:
+        """Return a class given its name (ElementObject if the class
+        does not exist)
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class to be returned
+        output_type : ColibriObjectTypes
+            Type of output expected
+
+        Returns
+        -------
+        class_signature : Type
+            Class signature
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        key: Tuple[str, ColibriObjectTypes] = (class_name, output_type)
+        if key not in self._classes:
+            class_signature: Union[Type, None] = self._find_class(
+                class_name=class_name, output_type=output_type
+            )
+            self._classes[key] = (
+                ElementObject if class_signature is None else class_signature
+            )
+        return self._classes[key]
+
+    def get_record(
+        self, class_name: str, output_type: ColibriObjectTypes
+    ) -> ClassRecord:
+        """Return the record (signature, constructor's parameters and
+        default values) of a class given its name
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class
+        output_type : ColibriObjectTypes
+            Type of output expected
+
+        Returns
+        -------
+        ClassRecord
+            Record of the class
+
+        Raises
+        ------
+        ColibriModuleNotFoundError
+            If the module does not exist
+        UnauthorizedColibriModule
+            If the module is unauthorized
+
+        Examples
+        --------
+        >>> None
+        """
+        key: Tuple[str, ColibriObjectTypes] = (class_name, output_type)
+        record: Union[ClassRecord, None] = self._records.get(key)
+        if record is None:
+            record = self._create_record(
+                class_name=class_name, output_type=output_type
+            )
+            self._records[key] = record
+        return record
+
+    def clear(self) -> None:
+        """Forget all classes resolved so far
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        self._classes.clear()
+        self._records.clear()
+        self._entry_points = None
+
+    def get_module_names(self) -> List[str]:
+        """Return the names of all available modules (COLIBRI's modules
+        and modules provided by other packages through entry points)
+
+        Returns
+        -------
+        List[str]
+            Names of the available modules
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        colibri_modules_module: ModuleType = importlib.import_module(
+            COLIBRI_MODULES_MODULE_PATH
+        )
+        return sorted(
+            set(colibri_modules_module.__all__).union(self._get_entry_points())
+        )
+
+    def _get_entry_points(self) -> Dict[str, EntryPoint]:
+        if self._entry_points is None:
+            self._entry_points = {
+                entry_point.name: entry_point
+                for entry_point in entry_points(
+                    group=COLIBRI_MODULES_ENTRY_POINT_GROUP
+                )
+            }
+        return self._entry_points
+
+    def _find_class(
+        self, class_name: str, output_type: ColibriObjectTypes
+    ) -> Union[Type, None]:
+        classes_path: str = (
+            COLIBRI_MODULES_MODULE_PATH
+            if output_type is ColibriObjectTypes.MODULE
+            else COLIBRI_PROJECT_OBJECTS_MODULE_PATH
+        )
+        colibri_classes_module: ModuleType = importlib.import_module(
+            classes_path
+        )
+        class_signature: Union[Type, None] = getattr(
+            colibri_classes_module, class_name, None
+        )
+        # Modules of other packages are only imported if they are used
+        if (class_signature is None) and (
+            output_type is ColibriObjectTypes.MODULE
+        ):
+            entry_point: Union[EntryPoint, None] = self._get_entry_points().get(
+                class_name
+            )
+            if entry_point is not None:
+                class_signature = entry_point.load()
+        return class_signature
+
+    def _create_record(
+        self, class_name: str, output_type: ColibriObjectTypes
+    ) -> ClassRecord:
+        # Check that the class exists
+        model_class: Union[Type, None] = self._find_class(
+            class_name=class_name, output_type=output_type
+        )
+        if model_class is None:
+            raise ColibriModuleNotFoundError(
+                f"{class_name} is not a valid model."
+            )
+        # Check that the interface is acceptable
+        # (interfaces are different for project objects)
+        is_project_object: bool = (
+            output_type is ColibriObjectTypes.PROJECT_OBJECT
+        )
+        if is_project_object is False:
+            colibri_interfaces_module: ModuleType = importlib.import_module(
+                COLIBRI_INTERFACES_MODULE_PATH
+            )
+            colibri_interfaces: List[str] = dir(colibri_interfaces_module)
+            parent_module_class_name: Type = model_class.__bases__[0].__name__
+            if parent_module_class_name not in colibri_interfaces:
+                raise UnauthorizedColibriModule(
+                    f"{class_name} of {model_class} class is not a subclass "
+                    f"of the available scheme configuration."
+                )
+        model_metadata: FullArgSpec = inspect.getfullargspec(
+            model_class.__init__
+        )
+        required_parameters: List[str] = model_metadata.args[1:]
+        default_values: Tuple[Any, ...] = model_metadata.defaults or ()
+        # Defaults are given for the last parameters, the other ones are None
+        missing_default_values: int = len(required_parameters) - len(
+            default_values
+        )
+        return ClassRecord(
+            class_signature=model_class,
+            parameter_names=tuple(required_parameters),
+            default_values=dict(
+                zip(
+                    required_parameters,
+                    (None,) * missing_default_values + tuple(default_values),
+                )
+            ),
+            is_project_object=is_project_object,
+        )
+
+
+# Registry used to resolve COLIBRI's classes by their name
+CLASS_REGISTRY: ClassRegistry = ClassRegistry()
+
+
 def get_class(class_name: str, output_type: ColibriObjectTypes) -> Type:
     """Return a class given its name
 
@@ -44,16 +308,9 @@ def get_class(class_name: str, output_type: ColibriObjectTypes) -> Type:
     --------
     >>> None
     """
-    classes_path: str = (
-        COLIBRI_MODULES_MODULE_PATH
-        if output_type is ColibriObjectTypes.MODULE
-        else COLIBRI_PROJECT_OBJECTS_MODULE_PATH
+    class_signature: Type = CLASS_REGISTRY.get_class(
+        class_name=class_name, output_type=output_type
     )
-    colibri_classes_module: ModuleType = importlib.import_module(classes_path)
-    if hasattr(colibri_classes_module, class_name) is False:
-        class_signature: Type = ElementObject
-        return class_signature
-    class_signature: Type = getattr(colibri_classes_module, class_name)
     return class_signature
 
 
@@ -89,62 +346,12 @@ def create_class_instance(
     --------
     >>> None
     """
-    # Define the paths where to find the classes and interfaces
-    classes_path: str = COLIBRI_MODULES_MODULE_PATH
-    interfaces_path: Union[str, None] = COLIBRI_INTERFACES_MODULE_PATH
-    # Classes and interfaces are different for project objects
-    if output_type is ColibriObjectTypes.PROJECT_OBJECT:
-        classes_path = COLIBRI_PROJECT_OBJECTS_MODULE_PATH
-        interfaces_path = None
-    # Check that the class exists
-    colibri_classes_module: ModuleType = importlib.import_module(classes_path)
-    if hasattr(colibri_classes_module, class_name) is False:
-        raise ColibriModuleNotFoundError(f"{class_name} is not a valid model.")
-    model_class: Type = getattr(colibri_classes_module, class_name)
-    # Check that the interface is acceptable
-    if interfaces_path is not None:
-        colibri_interfaces_module: ModuleType = importlib.import_module(
-            COLIBRI_INTERFACES_MODULE_PATH
-        )
-        colibri_interfaces: List[str] = dir(colibri_interfaces_module)
-        parent_module_class_name: Type = model_class.__bases__[0].__name__
-        if parent_module_class_name not in colibri_interfaces:
-            raise UnauthorizedColibriModule(
-                f"{class_name} of {model_class} class is not a subclass "
-                f"of the available scheme configuration."
-            )
-    model_metadata: FullArgSpec = inspect.getfullargspec(model_class.__init__)
-    required_parameters: List[str] = model_metadata.args[1:]
-    temporary_default_parameters_values: Tuple[Any] | None = (
-        model_metadata.defaults
+    class_record: ClassRecord = CLASS_REGISTRY.get_record(
+        class_name=class_name, output_type=output_type
+    )
+    instance: object = class_record.create_instance(
+        class_parameters=class_parameters
     )
-    default_parameters_values: Dict[str, Any] = dict()
-    if temporary_default_parameters_values is not None:
-        reversed_parameters: List[str] = required_parameters[::-1]
-        reversed_default_parameters_values: Tuple[Any] = (
-            temporary_default_parameters_values[::-1]
-        )
-        missing_default_values: int = len(reversed_parameters) - len(
-            reversed_default_parameters_values
-        )
-        default_parameters_values: Dict[str, Any] = dict(
-            zip(
-                reversed_parameters,
-                reversed_default_parameters_values
-                + (None,) * missing_default_values,
-            )
-        )
-    parameters: Dict[str, Any] = {
-        name: class_parameters.get(
-            name, default_parameters_values.get(name, None)
-        )
-        for name in required_parameters
-    }
-    instance: object = model_class(**parameters)
-    if output_type is ColibriObjectTypes.PROJECT_OBJECT:
-        for name, value in class_parameters.items():
-            if name not in parameters:
-                setattr(instance, name, value)
     return instance
 
 
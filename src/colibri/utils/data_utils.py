@@ -6,16 +6,29 @@ import inspect
 import math
 import re
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
 
+import numpy as np
+
 from colibri.config.constants import (
+    ARRAY_FILE,
     COLIBRI,
     ENUM,
     FORWARD_REF,
     LOGGER,
+    MEMORY_MAP,
     TYPING,
 )
 
+# Patterns used to turn formats into strings
+FORWARD_REF_PATTERN: re.Pattern = re.compile(rf"{FORWARD_REF}\('(\w+)'\)")
+GENERIC_PATTERN: re.Pattern = re.compile(r"(\w+)\[(.*?)\]")
+QUALIFIED_NAME_PATTERN: re.Pattern = re.compile(r"(?:\w+\.)*(\w+)")
+# Number of formats cached with their string representation
+FORMAT_STRINGS_SIZE: int = 1024
+
 
 def are_dictionaries_equal(
     dict_1: Dict[str, Any],
@@ -85,6 +98,27 @@ def turn_format_to_string(field_format: Any) -> str:
     --------
     >>> None
     """
+    # Formats are cached with their arguments, since formats that are
+    # equal can have different representations (e.g. Union[int, float]
+    # and Union[float, int]), unhashable formats are not cached (arguments
+    # are positional, which makes the cache keys faster to build)
+    try:
+        return _get_format_string(
+            field_format, getattr(field_format, "__args__", None)
+        )
+    except TypeError:
+        return _resolve_format_string(field_format=field_format)
+
+
+@lru_cache(maxsize=FORMAT_STRINGS_SIZE)
+def _get_format_string(field_format: Any, arguments: Any) -> str:
+    # Cached string representation of the format (and its arguments)
+    return _resolve_format_string(field_format=field_format)
+
+
+def _resolve_format_string(field_format: Any) -> str:
+    # Resolve the string representation of the format (see
+    # turn_format_to_string, which caches the result)
     format_representation: str = repr(field_format)
     has_typing_types: bool = TYPING in format_representation
     has_colibri_types: bool = COLIBRI in format_representation
@@ -107,22 +141,16 @@ def turn_format_to_string(field_format: Any) -> str:
     if has_typing_types:
         format_representation = format_representation.replace(f"{TYPING}.", "")
     if has_forward_ref_types:
-        pattern: str = f"{FORWARD_REF}\('(\w+)'\)"
-        return re.sub(pattern, r"\1", format_representation)
+        return FORWARD_REF_PATTERN.sub(r"\1", format_representation)
     if has_colibri_types:
-        pattern: str = r"(\w+)\[(.*?)\]"
-        matches: Union[List[str], None] = re.match(
-            pattern, format_representation
+        match: Union[re.Match, None] = GENERIC_PATTERN.match(
+            format_representation
         )
-        if matches is None:
-            pattern = r"\b(?:\w+\.)*(\w+)\b"
-            matches = re.findall(pattern, format_representation)
-            return matches[-1]
-        prefix = matches.group(1)
-        inside_brackets = matches.group(2)
-        pattern = r"(?:\w+\.)*(\w+)"
-        matches = re.findall(pattern, inside_brackets)
-        return f"{prefix}[" + ", ".join(matches) + "]"
+        if match is None:
+            return QUALIFIED_NAME_PATTERN.findall(format_representation)[-1]
+        prefix: str = match.group(1)
+        names: List[str] = QUALIFIED_NAME_PATTERN.findall(match.group(2))
+        return f"{prefix}[" + ", ".join(names) + "]"
     return format_representation
 
 
@@ -150,3 +178,74 @@ def turn_max_min_to_string(max_or_min: Any) -> str:
     if (max_or_min is not None) and (math.isinf(max_or_min) is True):
         return repr(max_or_min)
     return max_or_min
+
+
+def is_array_reference(value: Any) -> bool:
+    """Return True if the value is a reference to an external array file
+    (e.g. {"array_file": "occupation.npy", "memory_map": true}),
+    False otherwise
+
+    Parameters
+    ----------
+    value : Any
+        Value to be checked
+
+    Returns
+    -------
+    bool
+        True if the value is a reference to an external array file,
+        False otherwise
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> is_array_reference({"array_file": "occupation.npy"})
+    True
+    >>> is_array_reference([0, 1, 1])
+    False
+    """
+    return (
+        isinstance(value, dict)
+        and (ARRAY_FILE in value)
+        and set(value.keys()).issubset({ARRAY_FILE, MEMORY_MAP})
+    )
+
+
+def load_array_reference(
+    array_reference: Dict[str, Any], directory: Optional[Path] = None
+) -> np.ndarray:
+    """Load the array referenced by an external array file (.npy),
+    the array is memory-mapped (read-only) if required so that only
+    the accessed values are read from disk
+
+    Parameters
+    ----------
+    array_reference : Dict[str, Any]
+        Reference to the external array file
+    directory : Optional[Path] = None
+        Directory used to resolve relative array file paths
+
+    Returns
+    -------
+    np.ndarray
+        Array stored in the external array file
+
+    Raises
+    ------
+    FileNotFoundError
+        If the array file does not exist
+
+    Examples
+    --------
+    >>> None
+    """
+    array_file: Path = Path(array_reference[ARRAY_FILE])
+    if (array_file.is_absolute() is False) and (directory is not None):
+        array_file = Path(directory) / array_file
+    if array_file.exists() is False:
+        raise FileNotFoundError(f"Array file {array_file} does not exist.")
+    memory_map: bool = array_reference.get(MEMORY_MAP, False) is True
+    return np.load(array_file, mmap_mode="r" if memory_map is True else None)
@@ -0,0 +1,271 @@
+"""
+Helper functions to read EnergyPlus weather (EPW) files as arrays, cached
+(in memory and, if COLIBRI_CACHE_DIR is set, in NumPy files) by the
+content of the EPW file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from colibri.config.constants import COLIBRI_CACHE_DIR, LOGGER
+
+# Hourly fields of an EPW file, in the order of its columns (None for the
+# columns which are not numbers: data source flags and weather codes)
+EPW_FIELDS: Tuple[Optional[str], ...] = (
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    None,
+    "dry_bulb_temperature",
+    "dew_point_temperature",
+    "relative_humidity",
+    "atmospheric_pressure",
+    "extraterrestrial_horizontal_radiation",
+    "extraterrestrial_direct_normal_radiation",
+    "horizontal_infrared_radiation",
+    "global_horizontal_radiation",
+    "direct_normal_radiation",
+    "diffuse_horizontal_radiation",
+    "global_horizontal_illuminance",
+    "direct_normal_illuminance",
+    "diffuse_horizontal_illuminance",
+    "zenith_luminance",
+    "wind_direction",
+    "wind_speed",
+    "total_sky_cover",
+    "opaque_sky_cover",
+    "visibility",
+    "ceiling_height",
+    "present_weather_observation",
+    None,
+    "precipitable_water",
+    "aerosol_optical_depth",
+    "snow_depth",
+    "days_since_last_snowfall",
+    "albedo",
+    "liquid_precipitation_depth",
+    "liquid_precipitation_quantity",
+)
+# Version of the cached arrays, changed when the parsing changes
+EPW_CACHE_VERSION: str = "1"
+# Number of header lines of an EPW file
+EPW_HEADER_LINES: int = 8
+
+# EPW data already read, by key (see get_epw_key)
+_EPW_DATA: Dict[str, Dict[str, npt.NDArray[np.float64]]] = dict()
+
+
+def read_epw(
+    epw_file: Union[str, Path],
+) -> Dict[str, npt.NDArray[np.float64]]:
+    """Read an EPW file: hourly fields (e.g. "dry_bulb_temperature",
+    "relative_humidity", "global_horizontal_radiation", "wind_speed"),
+    location ("latitude", "longitude", "time_zone", "elevation") and
+    monthly ground temperatures ("ground_temperatures", one row per depth
+    of "ground_temperature_depths"), parsed once per EPW file content
+
+    Parameters
+    ----------
+    epw_file : Union[str, Path]
+        EPW file
+
+    Returns
+    -------
+    Dict[str, npt.NDArray[np.float64]]
+        Arrays of the EPW file by field, read-only since they are shared
+        by all the readers of the same EPW file
+
+    Raises
+    ------
+    ValueError
+        If the EPW file can not be parsed
+
+    Examples
+    --------
+    >>> None
+    """
+    content: bytes = Path(epw_file).read_bytes()
+    key: str = get_epw_key(content=content)
+    if key not in _EPW_DATA:
+        epw_data: Optional[Dict[str, npt.NDArray[np.float64]]] = (
+            _load_epw_cache_file(key=key)
+        )
+        if epw_data is None:
+            epw_data = _parse_epw(text=content.decode("latin-1"))
+            _write_epw_cache_file(key=key, epw_data=epw_data)
+        for array in epw_data.values():
+            array.flags.writeable = False
+        _EPW_DATA[key] = epw_data
+    return dict(_EPW_DATA[key])
+
+
+def get_epw_key(content: bytes) -> str:
+    """Get the key of an EPW file's data
+
+    Parameters
+    ----------
+    content : bytes
+        Content of the EPW file
+
+    Returns
+    -------
+    str
+        Key of the EPW file's data (hash of its content and of the cache
+        version)
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    return hashlib.sha256(
+        EPW_CACHE_VERSION.encode("utf-8") + content
+    ).hexdigest()
+
+
+def get_epw_cache_file(key: str) -> Optional[Path]:
+    """Get the cache file of an EPW file's data
+
+    Parameters
+    ----------
+    key : str
+        Key of the EPW file's data
+
+    Returns
+    -------
+    Optional[Path]
+        Cache file of the EPW file's data, None if COLIBRI_CACHE_DIR is
+        not set
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    cache_directory: Optional[str] = os.environ.get(COLIBRI_CACHE_DIR)
+    if not cache_directory:
+        return None
+    return Path(cache_directory) / f"epw_{key}.npz"
+
+
+def clear_epw_cache() -> None:
+    """Clear the EPW data cached in memory (cache files are kept)
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    >>> None
+    """
+    _EPW_DATA.clear()
+
+
+def _parse_epw(text: str) -> Dict[str, npt.NDArray[np.float64]]:
+    # Header lines: "LOCATION,city,state,country,source,WMO,latitude,
+    # longitude,time zone,elevation" and "GROUND TEMPERATURES,number of
+    # depths,[depth,conductivity,density,specific heat,12 monthly
+    # temperatures] for each depth", then one line per hour
+    lines: List[str] = text.splitlines()
+    header: Dict[str, List[str]] = dict()
+    for line in lines[:EPW_HEADER_LINES]:
+        name, _, values = line.partition(",")
+        header[name.strip().upper()] = values.split(",")
+    columns: List[int] = [
+        column for column, field in enumerate(EPW_FIELDS) if field is not None
+    ]
+    try:
+        values: npt.NDArray[np.float64] = np.loadtxt(
+            lines[EPW_HEADER_LINES:],
+            delimiter=",",
+            usecols=columns,
+            ndmin=2,
+        )
+        location: List[float] = [
+            float(value) for value in header["LOCATION"][5:9]
+        ]
+        ground_temperatures: npt.NDArray[np.float64] = np.zeros((0, 16))
+        number_of_depths: int = int(
+            header.get("GROUND TEMPERATURES", ["0"])[0] or 0
+        )
+        if number_of_depths > 0:
+            ground_temperatures = np.array(
+                [
+                    float(value) if value.strip() else np.nan
+                    for value in header["GROUND TEMPERATURES"][
+                        1 : 1 + 16 * number_of_depths
+                    ]
+                ]
+            ).reshape(number_of_depths, 16)
+    except (KeyError, IndexError, ValueError) as error:
+        raise ValueError(f"EPW file can not be parsed: {error}") from error
+    # One contiguous row per field
+    values = np.ascontiguousarray(values.T)
+    epw_data: Dict[str, npt.NDArray[np.float64]] = {
+        EPW_FIELDS[column]: values[index]
+        for index, column in enumerate(columns)
+    }
+    epw_data.update(
+        {
+            name: np.array(value)
+            for name, value in zip(
+                ["latitude", "longitude", "time_zone", "elevation"], location
+            )
+        }
+    )
+    epw_data["ground_temperature_depths"] = ground_temperatures[:, 0]
+    epw_data["ground_temperatures"] = ground_temperatures[:, 4:]
+    return epw_data
+
+
+def _load_epw_cache_file(
+    key: str,
+) -> Optional[Dict[str, npt.NDArray[np.float64]]]:
+    cache_file: Optional[Path] = get_epw_cache_file(key=key)
+    if (cache_file is None) or (cache_file.is_file() is False):
+        return None
+    try:
+        with np.load(cache_file, allow_pickle=False) as arrays:
+            return {name: arrays[name] for name in arrays.files}
+    except (OSError, ValueError) as error:
+        LOGGER.warning(f"EPW cache file {cache_file} ignored: {error}")
+        return None
+
+
+def _write_epw_cache_file(
+    key: str, epw_data: Dict[str, npt.NDArray[np.float64]]
+) -> None:
+    cache_file: Optional[Path] = get_epw_cache_file(key=key)
+    if cache_file is None:
+        return
+    # The file is written under another name then renamed, so that a
+    # cache file is never read while being written
+    temporary_file: Path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with temporary_file.open("wb") as file:
+            np.savez(file, **epw_data)
+        os.replace(temporary_file, cache_file)
+    except OSError as error:
+        LOGGER.warning(f"EPW cache file {cache_file} not written: {error}")
+        temporary_file.unlink(missing_ok=True)
@@ -0,0 +1,346 @@
+"""
+Helper classes or functions to read large JSON files incrementally
+for the `colibri` package.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+)
+
+# Size of the chunks read from the file (characters)
+CHUNK_SIZE: int = 1 << 20
+WHITESPACES: re.Pattern = re.compile(r"[ \t\n\r]*")
+# Characters that can follow a complete JSON value
+DELIMITERS: str = " \t\n\r,:]}"
+
+
+class JsonStream:
+    """Class reading a JSON file by chunks, one value at a time, so that
+    large collections never have to be loaded at once."""
+
+    def __init__(self, file_path: Path, chunk_size: int = CHUNK_SIZE) -> None:
+        """Initialize a new JsonStream instance
+
+        Parameters
+        ----------
+        file_path : Path
+            Path of the JSON file
+        chunk_size : int = CHUNK_SIZE
+            Number of characters read from the file at once
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._file: Optional[TextIO] = None
+        self._buffer: str = ""
+        self._position: int = 0
+        self._is_end_of_file: bool = False
+        # Chunks in the buffer: (file position of the chunk, index of its
+        # first character in the buffer, negative if partly released)
+        self._chunks: List[Tuple[int, int]] = []
+        # Positions (see tell) of the objects skipped by read, by keys
+        self.skipped_positions: Dict[Tuple[str, ...], Tuple[int, int]] = dict()
+
+    def __enter__(self) -> JsonStream:
+        self._file = open(self.file_path, "r")
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._file.close()
+        self._file = None
+
+    def iter_items(self, keys: Sequence[str]) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the items of the object found at the given keys,
+        each item's value is only decoded when it is reached
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            Keys leading to the object (e.g. ["project", "boundary_collection"])
+
+        Returns
+        -------
+        Iterator[Tuple[str, Any]]
+            Items (key, value) of the object, nothing if it does not exist
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the file is not a valid JSON file
+
+        Examples
+        --------
+        >>> None
+        """
+        if self._next_character() != "{":
+            return
+        for key in self._iter_keys():
+            if (len(keys) == 0) or (key != keys[0]):
+                self._skip_value()
+                continue
+            if len(keys) > 1:
+                yield from self.iter_items(keys=keys[1:])
+            else:
+                yield from self._iter_object_items()
+            # The rest of the file is not needed
+            return
+
+    def iter_items_at(
+        self, position: Tuple[int, int]
+    ) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the items of the object found at the given
+        position, without reading the file before it
+
+        Parameters
+        ----------
+        position : Tuple[int, int]
+            Position of the object (see tell)
+
+        Returns
+        -------
+        Iterator[Tuple[str, Any]]
+            Items (key, value) of the object
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the file is not a valid JSON file
+
+        Examples
+        --------
+        >>> None
+        """
+        self.seek(position=position)
+        yield from self._iter_object_items()
+
+    def tell(self) -> Tuple[int, int]:
+        """Get the position of the next value
+
+        Returns
+        -------
+        Tuple[int, int]
+            Position of the next value: position of its chunk in the file
+            (opaque number of the text file) and index in the chunk
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        self._next_character()
+        for chunk_position, chunk_start in reversed(self._chunks):
+            if chunk_start <= self._position:
+                return chunk_position, self._position - chunk_start
+        return self._file.tell(), 0
+
+    def seek(self, position: Tuple[int, int]) -> None:
+        """Move to a position given by tell
+
+        Parameters
+        ----------
+        position : Tuple[int, int]
+            Position of the next value to read
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        chunk_position, index = position
+        self._file.seek(chunk_position)
+        self._buffer = ""
+        self._position = 0
+        self._chunks = []
+        self._is_end_of_file = False
+        self._read_chunk(size=max(self.chunk_size, index + 1))
+        self._position = min(index, len(self._buffer))
+
+    def read(
+        self,
+        skipped_keys: Sequence[Sequence[str]],
+        keys: Tuple[str, ...] = (),
+    ) -> Any:
+        """Read the JSON value (whole file by default), except the objects
+        found at the skipped keys, which are replaced by empty objects
+        (their positions are kept in skipped_positions)
+
+        Parameters
+        ----------
+        skipped_keys : Sequence[Sequence[str]]
+            Keys leading to the objects that are not read
+        keys : Tuple[str, ...] = ()
+            Keys of the value being read
+
+        Returns
+        -------
+        Any
+            JSON value without the skipped objects
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the file is not a valid JSON file
+
+        Examples
+        --------
+        >>> None
+        """
+        skipped_paths: Set[Tuple[str, ...]] = {
+            tuple(skipped_key) for skipped_key in skipped_keys
+        }
+        is_parent_of_skipped_value: bool = any(
+            skipped_path[: len(keys)] == keys for skipped_path in skipped_paths
+        )
+        if (self._next_character() != "{") or (
+            is_parent_of_skipped_value is False
+        ):
+            return self._decode()
+        value: Dict[str, Any] = dict()
+        for key in self._iter_keys():
+            if keys + (key,) in skipped_paths:
+                self.skipped_positions[keys + (key,)] = self.tell()
+                self._skip_value(is_collection=True)
+                value[key] = dict()
+            else:
+                value[key] = self.read(
+                    skipped_keys=skipped_keys, keys=keys + (key,)
+                )
+        return value
+
+    def _iter_object_items(self) -> Iterator[Tuple[str, Any]]:
+        # Items of the object starting at the current position, nothing
+        # if it is not an object
+        if self._next_character() != "{":
+            return
+        for key in self._iter_keys():
+            yield key, self._decode()
+
+    def _iter_keys(self) -> Iterator[str]:
+        # Iterate over the keys of the object starting at the current
+        # position, the value of each key must be consumed by the caller
+        self._expect(character="{")
+        if self._next_character() == "}":
+            self._position += 1
+            return
+        while True:
+            key: str = self._decode()
+            self._expect(character=":")
+            yield key
+            if self._next_character() == ",":
+                self._position += 1
+                continue
+            self._expect(character="}")
+            return
+
+    def _skip_value(self, is_collection: bool = False) -> None:
+        # Objects are skipped item by item so that only one item is
+        # decoded at once (other values are decoded and released), the
+        # items of a collection (small objects) are decoded at once
+        if self._next_character() == "{":
+            for _ in self._iter_keys():
+                if is_collection is True:
+                    _ = self._decode()
+                else:
+                    self._skip_value()
+            return
+        _ = self._decode()
+
+    def _decode(self) -> Any:
+        # Decode the value starting at the current position, more
+        # characters are read until the value is complete: it must be
+        # followed by a delimiter (e.g. numbers split in two chunks)
+        self._next_character()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer, self._position
+                )
+                if self._is_end_of_file or (
+                    (end < len(self._buffer))
+                    and (self._buffer[end] in DELIMITERS)
+                ):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._is_end_of_file:
+                    raise
+            self._read_chunk(
+                size=max(self.chunk_size, len(self._buffer) - self._position)
+            )
+
+    def _expect(self, character: str) -> None:
+        if self._next_character() != character:
+            raise json.JSONDecodeError(
+                f"Expecting '{character}'", self._buffer, self._position
+            )
+        self._position += 1
+
+    def _next_character(self) -> str:
+        # Return the next non-whitespace character ("" at the end of file)
+        while True:
+            self._position = WHITESPACES.match(
+                self._buffer, self._position
+            ).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._is_end_of_file:
+                return ""
+            self._read_chunk(size=self.chunk_size)
+
+    def _read_chunk(self, size: int) -> None:
+        # Characters already consumed are released, with the chunks
+        # they belong to (unless partly consumed)
+        chunk_position: int = self._file.tell()
+        chunk: str = self._file.read(size)
+        self._buffer = self._buffer[self._position :] + chunk
+        self._chunks = [
+            (previous_position, chunk_start - self._position)
+            for previous_position, chunk_start in self._chunks
+        ]
+        self._chunks.append((chunk_position, len(self._buffer) - len(chunk)))
+        while (len(self._chunks) > 1) and (self._chunks[1][1] <= 0):
+            self._chunks.pop(0)
+        self._position = 0
+        self._is_end_of_file = len(chunk) < size
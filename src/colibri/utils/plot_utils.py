@@ -2,14 +2,16 @@
 Plot class to help with plotting simulation variables.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, List
 
-from matplotlib.pyplot import Axes, Figure
-
 from colibri.interfaces.module import Module
 
 if TYPE_CHECKING:
+    from matplotlib.pyplot import Axes, Figure
+
     from colibri.core.fields import SimulationVariable
 
 
@@ -5,7 +5,10 @@ Helper classes orr functions for units.
 import json
 from dataclasses import dataclass
 from importlib import resources
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
 
 from colibri.config import data
 from colibri.utils.enums_utils import Units
@@ -135,16 +138,82 @@ class UnitConverter(metaclass=SingletonMeta):
             if isinstance(dimension, dict) is True:
                 dimension: Dimension = Dimension(**dimension)
             self.dimensions.append(dimension)
-
-    def get_unit(self, unit: Units):
+        # Units by name (the first unit found wins if a name is repeated)
+        self._units: Dict[str, Unit] = dict()
         for dimension in self.dimensions:
-            if dimension.base_unit.name == unit.value:
-                return dimension.base_unit
-            else:
-                for equivalent_unit in dimension.equivalent_units:
-                    if equivalent_unit.name == unit.value:
-                        return equivalent_unit
-        return None
+            for unit in [dimension.base_unit, *dimension.equivalent_units]:
+                self._units.setdefault(unit.name, unit)
+        # Conversion factors (slope, intercept) by units (from, to)
+        self._conversion_factors: Dict[
+            Tuple[Units, Units], Tuple[float, float]
+        ] = dict()
+
+    def get_unit(self, unit: Units) -> Optional[Unit]:
+        """Get the unit given its name
+
+        Parameters
+        ----------
+        unit : Units
+            Unit to be found
+
+        Returns
+        -------
+        Optional[Unit]
+            Unit, None if it cannot be found
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        >>> None
+        """
+        return self._units.get(unit.value)
+
+    def get_conversion_factors(
+        self, unit_from: Units, unit_to: Units
+    ) -> Tuple[float, float]:
+        """Get the factors (slope, intercept) to convert a value from one
+        unit to another (value_to = value_from * slope + intercept)
+
+        Parameters
+        ----------
+        unit_from : Units
+            Initial unit
+        unit_to : Units
+            Final unit
+
+        Returns
+        -------
+        Tuple[float, float]
+            Slope and intercept of the conversion
+
+        Raises
+        ------
+        UnitError
+            Raise an error if one of the unit cannot be found
+
+        Examples
+        --------
+        >>> None
+        """
+        key: Tuple[Units, Units] = (unit_from, unit_to)
+        if key not in self._conversion_factors:
+            unit_1: Unit = self.get_unit(unit_from)
+            if not unit_1:
+                raise UnitError(f"Unit {unit_from.value} not found")
+            unit_2: Unit = self.get_unit(unit_to)
+            if not unit_2:
+                raise UnitError(f"Unit {unit_to.value} not found")
+            slope: float = float(unit_2.multiplication_factor) / float(
+                unit_1.multiplication_factor
+            )
+            intercept: float = float(unit_2.addition_factor) - (
+                float(unit_1.addition_factor) * slope
+            )
+            self._conversion_factors[key] = (slope, intercept)
+        return self._conversion_factors[key]
 
     def convert(self, value: float, unit_from: Units, unit_to: Units) -> float:
         """Convert the value from one unit to another
@@ -172,16 +241,44 @@ class UnitConverter(metaclass=SingletonMeta):
         --------
         >>> None
         """
-        unit_1: Unit = self.get_unit(unit_from)
-        if not unit_1:
-            raise UnitError(f"Unit {unit_from.value} not found")
-        unit_2: Unit = self.get_unit(unit_to)
-        if not unit_2:
-            raise UnitError(f"Unit {unit_to.value} not found")
-        return (
-            (value - float(unit_1.addition_factor))
-            / float(unit_1.multiplication_factor)
-        ) * float(unit_2.multiplication_factor) + float(unit_2.addition_factor)
+        slope, intercept = self.get_conversion_factors(
+            unit_from=unit_from, unit_to=unit_to
+        )
+        return value * slope + intercept
+
+    def convert_array(
+        self, values: npt.ArrayLike, unit_from: Units, unit_to: Units
+    ) -> np.ndarray:
+        """Convert all values (e.g. a series) from one unit to another
+        at once
+
+        Parameters
+        ----------
+        values : npt.ArrayLike
+            Values to be converted
+        unit_from : Units
+            Initial unit
+        unit_to : Units
+            Final unit
+
+        Returns
+        -------
+        np.ndarray
+            Converted values
+
+        Raises
+        ------
+        UnitError
+            Raise an error if one of the unit cannot be found
+
+        Examples
+        --------
+        >>> None
+        """
+        slope, intercept = self.get_conversion_factors(
+            unit_from=unit_from, unit_to=unit_to
+        )
+        return np.asarray(values, dtype=float) * slope + intercept
 
     def __str__(self) -> str:
         """Return the string representation of the object
@@ -238,6 +335,9 @@ def get_unit_converter() -> UnitConverter:
     --------
     >>> None
     """
+    # The units file is only read for the first (and only) instance
+    if UnitConverter in SingletonMeta._instances:
+        return SingletonMeta._instances[UnitConverter]
     units_file_path = resources.files(data) / "units" / "units.json"
     with open(units_file_path, mode="r", encoding="utf-8") as _file_descriptor:
         units: Dict[str, List[Dict[str, Any]]] = json.load(_file_descriptor)
@@ -0,0 +1,49 @@
+"""
+Tests for the `constants.py` module.
+"""
+
+import subprocess
+import sys
+from typing import Dict, List
+
+from colibri.config import constants
+from colibri.utils.units_utils import UnitConverter
+
+# Maximum time to import colibri, without numpy (microseconds)
+IMPORT_TIME_BUDGET: int = 500_000
+
+
+def test_unit_converter() -> None:
+    """Test the UNIT_CONVERTER constant, created on first access."""
+    from colibri.config.constants import UNIT_CONVERTER
+
+    assert isinstance(UNIT_CONVERTER, UnitConverter)
+    assert constants.UNIT_CONVERTER is UNIT_CONVERTER
+
+
+def test_import_time() -> None:
+    """Benchmark the import of colibri, slow dependencies and constants
+    are only loaded when they are used."""
+    code: str = (
+        "import sys\n"
+        "import colibri\n"
+        "from colibri.config import constants\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "assert 'UNIT_CONVERTER' not in vars(constants)\n"
+    )
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    # Lines are "import time: self [us] | cumulative | imported package"
+    import_times: Dict[str, int] = dict()
+    for line in result.stderr.splitlines():
+        columns: List[str] = line.split("|")
+        if (len(columns) == 3) and columns[1].strip().isdigit():
+            import_times[columns[2].strip()] = int(columns[1])
+    assert (
+        import_times["colibri"] - import_times.get("numpy", 0)
+        < IMPORT_TIME_BUDGET
+    )
@@ -2,7 +2,20 @@
 Test for the `project_data.py` module.
 """
 
-from colibri.core import ProjectData
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from colibri.core import ProjectData, ProjectOrchestrator
+from colibri.modules import (
+    LayerWallLosses,
+    OccupantModel,
+    SimplifiedWallLosses,
+    WeatherModel,
+)
+from colibri.utils.exceptions_utils import UserInputError
 
 
 def test_project_data() -> None:
@@ -191,5 +204,215 @@ def test_project_data() -> None:
     assert project_data.get_archetype_data(object_data=object_data) == dict()
 
 
+def test_project_data_lazy_collections() -> None:
+    """Test that ProjectData's collections are only created when required."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[1] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project_data", data=project_file
+    )
+    assert project_data._spaces is None
+    assert project_data._boundaries is None
+    assert (
+        project_data.load_required_collections(
+            modules=[WeatherModel(name="weather")]
+        )
+        == []
+    )
+    assert project_data._spaces is None
+    assert project_data.load_required_collections(
+        modules=[OccupantModel(name="occupants")]
+    ) == ["spaces"]
+    assert len(project_data._spaces) == 2
+    assert project_data._boundaries is None
+    assert project_data.load_required_collections(
+        modules=[LayerWallLosses(name="layer_wall_losses")]
+    ) == ["boundaries"]
+    assert len(project_data.boundaries) == 12
+    assert all(len(space.boundaries) > 0 for space in project_data.spaces)
+    project_data_2: ProjectData = ProjectData(name="project_data", data=dict())
+    assert project_data_2.spaces == []
+    assert project_data_2.boundaries == []
+
+
+def test_project_data_array_references(tmp_path: Path) -> None:
+    """Test that ProjectData resolves references to external array files."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[1] / "data" / "house_1.json"
+    )
+    with open(project_file, "r") as _file_descriptor:
+        data: dict = json.load(_file_descriptor)
+    space_collection: dict = data["project"]["node_collection"][
+        "space_collection"
+    ]
+    occupations: dict = dict()
+    for space_id, space_data in space_collection.items():
+        occupations[space_id] = space_data["occupation"]
+        np.save(tmp_path / f"{space_id}.npy", np.array(occupations[space_id]))
+        space_data["occupation"] = {
+            "array_file": f"{space_id}.npy",
+            "memory_map": True,
+        }
+    with open(tmp_path / "house.json", "w") as _file_descriptor:
+        json.dump(data, _file_descriptor)
+    project_data: ProjectData = ProjectData(
+        name="project_data", data=tmp_path / "house.json"
+    )
+    for space in project_data.spaces:
+        assert isinstance(space.occupation, np.memmap)
+        assert space.occupation.tolist() == occupations[space.id]
+    occupant_model: OccupantModel = OccupantModel(
+        name="occupants", project_data=project_data
+    )
+    occupant_model.run(time_step=10, number_of_iterations=0)
+    assert len(occupant_model.gains) == 2
+
+
+def test_project_data_patch() -> None:
+    """Test the patch method of the ProjectData class."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[1] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project_data", data=project_file
+    )
+    occupants: OccupantModel = OccupantModel(name="occupants")
+    layer_wall_losses: LayerWallLosses = LayerWallLosses(
+        name="layer_wall_losses"
+    )
+    simplified_wall_losses: SimplifiedWallLosses = SimplifiedWallLosses(
+        name="simplified_wall_losses"
+    )
+    weather: WeatherModel = WeatherModel(name="weather")
+    project_orchestrator: ProjectOrchestrator = ProjectOrchestrator(
+        name="project_orchestrator", verbose=False
+    )
+    for module in [
+        project_data,
+        occupants,
+        layer_wall_losses,
+        simplified_wall_losses,
+        weather,
+    ]:
+        project_orchestrator.add_module(module=module)
+        module._is_initialized = True
+    project_data.load_required_collections(modules=project_orchestrator.modules)
+    spaces: dict = {space.id: space for space in project_data.spaces}
+    boundaries: dict = {
+        boundary.id: boundary for boundary in project_data.boundaries
+    }
+    layers: list = [
+        layer
+        for boundary in project_data.boundaries
+        for layer in boundary.layers
+        if layer.type_id == "beton_1"
+    ]
+    assert len(layers) > 0
+    # Archetype value: all objects built from the archetype are updated
+    assert project_data.patch(
+        changes={
+            "/project/archetype_collection/layer_types/beton_1/thickness": 0.25
+        }
+    ) == ["layer_wall_losses"]
+    assert all(layer.thickness == 0.25 for layer in layers)
+    assert layer_wall_losses.has_been_initialized() is False
+    assert occupants.has_been_initialized() is True
+    # Space and boundary values: objects are updated in place
+    assert project_data.patch(
+        changes={
+            "/project/node_collection/space_collection/living_room_1/"
+            "presence_setpoint_temperature": 21.0,
+            "/project/boundary_collection/mur_salon_sud_1/u_value": 0.3,
+        }
+    ) == ["occupants", "simplified_wall_losses"]
+    assert spaces["living_room_1"].presence_setpoint_temperature == 21.0
+    assert boundaries["mur_salon_sud_1"].u_value == 0.3
+    assert project_data.spaces[0] is spaces["living_room_1"]
+    # Structural changes: boundaries are created again
+    assert project_data.patch(
+        changes={
+            "/project/boundary_collection/mur_salon_sud_1/side_2": "kitchen_1"
+        }
+    ) == ["layer_wall_losses", "simplified_wall_losses"]
+    assert len(project_data.boundaries) == 12
+    new_boundary = next(
+        boundary
+        for boundary in project_data.boundaries
+        if boundary.id == "mur_salon_sud_1"
+    )
+    assert new_boundary is not boundaries["mur_salon_sud_1"]
+    assert new_boundary.spaces == [spaces["kitchen_1"]]
+    assert new_boundary.u_value == 0.3
+    assert len(new_boundary.segments) > 0
+    # Structural space changes: spaces and boundaries are created again
+    assert project_data.patch(
+        changes={
+            "/project/node_collection/space_collection/kitchen_1/id": (
+                "kitchen_2"
+            )
+        }
+    ) == ["layer_wall_losses", "occupants", "simplified_wall_losses"]
+    assert [space.id for space in project_data.spaces] == [
+        "living_room_1",
+        "kitchen_2",
+    ]
+    assert project_data.spaces[0] is not spaces["living_room_1"]
+    # Module parameters
+    assert project_data.patch(
+        changes={
+            "/project/module_collection/WeatherModel/altitudes": 10,
+        }
+    ) == ["weather"]
+    assert weather.altitudes == 10
+    with pytest.raises(UserInputError):
+        project_data.patch(changes={"/project/unknown/value": 1})
+    with pytest.raises(UserInputError):
+        project_data.patch(changes={"project/module_collection": 1})
+
+
+def test_project_data_stream() -> None:
+    """Test the ProjectData class when its collections are streamed."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[1] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project_data", data=project_file
+    )
+    streamed_project_data: ProjectData = ProjectData(
+        name="project_data", data=project_file, stream=True
+    )
+    assert (
+        streamed_project_data.project_data["project"]["boundary_collection"]
+        == dict()
+    )
+    assert (
+        streamed_project_data.module_parameters
+        == project_data.module_parameters
+    )
+    assert [
+        (space.id, space.occupation) for space in streamed_project_data.spaces
+    ] == [(space.id, space.occupation) for space in project_data.spaces]
+    assert [
+        (boundary.id, [space.id for space in boundary.spaces])
+        for boundary in streamed_project_data.boundaries
+    ] == [
+        (boundary.id, [space.id for space in boundary.spaces])
+        for boundary in project_data.boundaries
+    ]
+    streamed_project_data.patch(
+        changes={
+            "/project/archetype_collection/layer_types/beton_1/thickness": 0.25
+        }
+    )
+    with pytest.raises(UserInputError):
+        streamed_project_data.patch(
+            changes={"/project/boundary_collection/mur_salon_sud_1/area": 1.0}
+        )
+
+
 if __name__ == "__main__":
     test_project_data()
+    test_project_data_lazy_collections()
+    test_project_data_patch()
+    test_project_data_stream()
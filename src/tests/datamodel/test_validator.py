@@ -0,0 +1,143 @@
+"""
+Test for the `validator.py` module.
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from colibri.datamodel.validator import FieldRule, ProjectValidator
+from colibri.utils.exceptions_utils import UserInputError
+
+
+def test_field_rule() -> None:
+    """Test the FieldRule class."""
+    rule: FieldRule = FieldRule.from_scheme(
+        name="occupation",
+        field_scheme={"format": "List[float]", "min": 0, "max": "inf"},
+    )
+    assert rule.min == 0.0
+    assert rule.max is None
+    assert rule.check_type(value=[0, 1], path="occupation") == []
+    assert rule.check_type(value="a", path="occupation") == [
+        "occupation must be of format List[float], not str."
+    ]
+    assert rule.check_range(
+        values=np.array([[0, 1, 2], [0, -1, 2]]), paths=["a", "b"]
+    ) == ["b is below its minimum value of 0.0."]
+    # Numbers can be given as time series or values per object id, but
+    # neither as other collections nor as booleans
+    rule = FieldRule.from_scheme(
+        name="area", field_scheme={"format": "float", "min": 0, "max": "inf"}
+    )
+    for value in [1, 2.5, np.float64(1.0), [1.0, 2.0], {"a": 1.0}]:
+        assert rule.check_type(value=value, path="area") == []
+    for value in [["a"], {"a": "b"}, [[1.0], [1.0, 2.0]]]:
+        assert rule.check_type(value=value, path="area") == [
+            "area must only contain numbers."
+        ]
+    assert rule.check_type(value=True, path="area") == [
+        "area must be of format float, not bool."
+    ]
+    # Integers can be given as floats only if they are whole numbers
+    rule = FieldRule.from_scheme(
+        name="service_life",
+        field_scheme={"format": "int", "min": 0, "max": 100},
+    )
+    for value in [50, np.int64(50), 50.0, [1, 2.0], {"a": 3}]:
+        assert rule.check_type(value=value, path="service_life") == []
+    assert rule.check_type(value=2.5, path="service_life") == [
+        "service_life must be a whole number, not 2.5."
+    ]
+    assert rule.check_type(value=[1, 2.5], path="service_life") == [
+        "service_life must only contain whole numbers."
+    ]
+    rule = FieldRule.from_scheme(
+        name="material_type",
+        field_scheme={"format": "enum", "choices": ["concrete", "wood"]},
+    )
+    assert rule.check_type(value="wood", path="material_type") == []
+    assert rule.check_type(value="glass", path="material_type") == [
+        "material_type must be one of ['concrete', 'wood'], not 'glass'."
+    ]
+
+
+def test_project_validator(tmp_path: Path) -> None:
+    """Test the ProjectValidator class."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[1] / "data" / "house_1.json"
+    )
+    with open(project_file, "r") as _file_descriptor:
+        project_data: Dict[str, Any] = json.load(_file_descriptor)
+    modules: List[str] = list(project_data["project"]["module_collection"])
+    validator: ProjectValidator = ProjectValidator(modules=modules)
+    assert validator.validate(project_data=project_data) == []
+    validator.check(project_data=project_data)
+    wrong_project_data: Dict[str, Any] = copy.deepcopy(project_data)
+    spaces: Dict[str, Any] = wrong_project_data["project"]["node_collection"][
+        "space_collection"
+    ]
+    spaces["living_room_1"]["occupation"][10] = -1
+    spaces["living_room_1"]["reference_area"] = -20.9
+    spaces["kitchen_1"]["reference_area"] = "20"
+    wrong_project_data["project"]["boundary_collection"]["mur_salon_sud_1"][
+        "type_id"
+    ] = "unknown_wall"
+    wrong_project_data["project"]["archetype_collection"]["layer_types"][
+        "beton_1"
+    ]["emissivity"] = 1.5
+    assert sorted(validator.validate(project_data=wrong_project_data)) == [
+        "project/archetype_collection/layer_types/beton_1/emissivity is "
+        "above its maximum value of 1.0.",
+        "project/boundary_collection/mur_salon_sud_1 refers to an unknown "
+        "archetype boundary/unknown_wall.",
+        "project/node_collection/space_collection/kitchen_1/reference_area "
+        "must be of format float, not str.",
+        "project/node_collection/space_collection/living_room_1/occupation "
+        "is below its minimum value of 0.0.",
+        "project/node_collection/space_collection/living_room_1/"
+        "reference_area is below its minimum value of 0.0.",
+    ]
+    with pytest.raises(UserInputError):
+        validator.check(project_data=wrong_project_data)
+    # Fields required by the modules without default value must be given,
+    # even without limits
+    rules: Dict[str, Dict[str, FieldRule]] = ProjectValidator._compile_rules(
+        scheme={
+            "node": {
+                "Space": {
+                    "parameters": {
+                        field_name: {
+                            "format": "str",
+                            "default": default_value,
+                            "required": None,
+                        }
+                        for field_name, default_value in [
+                            ("usage", None),
+                            ("label", "space"),
+                        ]
+                    }
+                }
+            }
+        }
+    )
+    assert rules["Space"]["usage"].required is True
+    assert rules["Space"]["label"].required is False
+    # Array references are loaded to check their values
+    np.save(tmp_path / "occupation.npy", np.array([0.0, 2.0, -3.0]))
+    spaces["living_room_1"]["occupation"] = {"array_file": "occupation.npy"}
+    assert (
+        "project/node_collection/space_collection/living_room_1/occupation "
+        "is below its minimum value of 0.0."
+        in validator.validate(
+            project_data=wrong_project_data, directory=tmp_path
+        )
+    )
+
+
+if __name__ == "__main__":
+    test_field_rule()
@@ -0,0 +1,43 @@
+"""
+Tests for the `element_object.py` module.
+"""
+
+from pathlib import Path
+
+from colibri.core import ProjectData
+from colibri.interfaces import ElementObject
+
+
+def test_element_object_generated_classes() -> None:
+    """Test that generated classes are shared by element objects."""
+    layer_1: ElementObject = ElementObject.create_instance(
+        class_name="layer",
+        fields={"label": "concrete", "thickness": 0.2},
+    )
+    layer_2: ElementObject = ElementObject.create_instance(
+        class_name="Layer",
+        fields={"thickness": 0.4, "label": "insulation"},
+    )
+    layer_3: ElementObject = ElementObject.create_instance(
+        class_name="Layer",
+        fields={"label": "wood", "thickness": 0.1, "density": 500},
+    )
+    assert type(layer_1) is type(layer_2)
+    assert type(layer_1) is not type(layer_3)
+    assert type(layer_1).__name__ == type(layer_3).__name__ == "Layer"
+    assert isinstance(layer_1, ElementObject) is True
+    assert (layer_1.thickness, layer_2.thickness) == (0.2, 0.4)
+    assert layer_3.density == 500
+    # All layers of a project with the same fields share the same class
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project_data", data=project_file
+    )
+    layer_classes: set = {
+        type(layer)
+        for boundary in project_data.boundaries
+        for layer in boundary.layers
+    }
+    assert len(layer_classes) == 1
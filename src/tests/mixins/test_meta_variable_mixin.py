@@ -17,7 +17,9 @@ from colibri.project_objects import (
     Boundary,
     Space,
 )
+from colibri.utils.colibri_utils import Attachment
 from colibri.utils.enums_utils import (
+    ColibriProjectObjects,
     Roles,
     Units,
 )
@@ -45,7 +47,9 @@ def test_meta_fields_mixin() -> None:
             )
 
     new_object: NewClass = NewClass()
-    assert new_object.parameters == new_object.get_fields(role=Roles.PARAMETERS)
+    assert new_object.parameters == tuple(
+        new_object.get_fields(role=Roles.PARAMETERS)
+    )
     assert new_object.to_scheme() == {
         "NewClass": {
             "z": {
@@ -528,3 +532,93 @@ if __name__ == "__main__":
     test_meta_fields_mixin()
     test_to_scheme()
     test_from_template()
+
+
+def test_shared_fields_metadata() -> None:
+    """Test the fields' metadata shared by project objects' instances."""
+    space_1: Space = Space(id="space_1", label="Living room")
+    space_2: Space = Space(id="space_2", label="Kitchen")
+    assert space_1._fields_metadata is space_2._fields_metadata
+    assert space_1.parameters == space_2.parameters
+    assert (space_1.id, space_2.id) == ("space_1", "space_2")
+    assert Space.to_scheme() == space_1.to_scheme()
+
+    class NewSpace(Space):
+        def __init__(self, id, label, area=None):
+            super().__init__(id=id, label=label)
+            if area is not None:
+                self.area = self.define_parameter(
+                    name="area",
+                    default_value=area,
+                    description="Area of the space.",
+                    format=float,
+                    min=0,
+                    max=float("inf"),
+                    unit=Units.SQUARE_METER,
+                    attached_to=None,
+                )
+
+    new_space_1: NewSpace = NewSpace(id="space_1", label="Living room")
+    new_space_2: NewSpace = NewSpace(id="space_2", label="Kitchen", area=12)
+    assert new_space_1._fields_metadata is NewSpace.get_shared_fields_metadata()
+    assert new_space_2._fields_metadata is not new_space_1._fields_metadata
+    assert "area" in new_space_2._fields_metadata
+    assert "area" not in new_space_1._fields_metadata
+    # Fields differing only by their attachment are not shared either
+    attached_space: Space = Space(id="space_3", label="Bedroom")
+    attached_space.label = attached_space.define_parameter(
+        name="label",
+        default_value="Bedroom",
+        description=space_1._fields_metadata["label"].description,
+        format=str,
+        min=None,
+        max=None,
+        unit=Units.UNITLESS,
+        attached_to=Attachment(category=ColibriProjectObjects.SPACE),
+    )
+    assert attached_space._fields_metadata is not space_1._fields_metadata
+    assert space_1._fields_metadata["label"].attached_to is None
+    assert LimitedGenerator(name="a")._fields_metadata is not (
+        LimitedGenerator(name="b")._fields_metadata
+    )
+
+
+def test_fields_by_role() -> None:
+    """Test the fields indexed by role."""
+
+    class NewClass(MetaFieldMixin):
+        def __init__(self):
+            super().__init__()
+            for name, role in [
+                ("x", Roles.INPUTS),
+                ("y", Roles.OUTPUTS),
+                ("z", Roles.PARAMETERS),
+                ("x", Roles.OUTPUTS),
+            ]:
+                setattr(
+                    self,
+                    name,
+                    self._define_field(
+                        name=name,
+                        default_value=0.0,
+                        role=role,
+                        unit=Units.UNITLESS,
+                        description="Value.",
+                        format=float,
+                        min=None,
+                        max=None,
+                    ),
+                )
+
+    new_object: NewClass = NewClass()
+    assert new_object.outputs is new_object.outputs
+    assert new_object.inputs == ()
+    assert [field.name for field in new_object.outputs] == ["x", "y"]
+    assert [field.name for field in new_object.parameters] == ["z"]
+    assert new_object.get_fields(role=Roles.OUTPUTS) == list(new_object.outputs)
+    space: Space = Space(id="space_1", label="Living room")
+    assert space.parameters is Space(id="space_2", label="Kitchen").parameters
+    # Fields shared by all spaces can not be modified through one of them
+    assert isinstance(space.parameters, tuple)
+    with pytest.raises(AttributeError):
+        space.parameters.append(space.parameters[0])
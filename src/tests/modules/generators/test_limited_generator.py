@@ -2,7 +2,7 @@
 Tests for the `limited_generator.py` module.
 """
 
-from typing import List
+from typing import Dict, List
 
 import pytest
 
@@ -77,5 +77,65 @@ def test_limited_generator() -> None:
     assert generator.has_converged(time_step=1, number_of_iterations=1) is True
 
 
+def test_limited_generator_spaces() -> None:
+    """Test the LimitedGenerator class with several emitters per space."""
+    spaces: List[Space] = [
+        Space(id="kitchen", label="kitchen", q_needs=0.0),
+        Space(id="living-room", label="living room", q_needs=400.0),
+    ]
+    emitters: List[BoundaryObject] = [
+        BoundaryObject(
+            id=f"emitter-{index}",
+            label=f"Emitter {index}",
+            type=emitter_type,
+            type_id="electric_convector",
+            efficiency=0.5,
+            pn=nominal_power,
+        )
+        for index, (emitter_type, nominal_power) in enumerate(
+            [("emitter", 600.0), ("Emitter", 300.0), ("emitter", 1_000.0)]
+        )
+    ]
+    boundaries: List[Boundary] = [
+        Boundary(
+            id="kitchen-exterior",
+            side_1="kitchen",
+            side_2="exterior",
+            object_collection=emitters[:2],
+        ),
+        Boundary(
+            id="living-room-exterior",
+            side_1="living-room",
+            side_2="exterior",
+            object_collection=[emitters[2]],
+        ),
+    ]
+    spaces[0].boundaries = [boundaries[0]]
+    spaces[1].boundaries = [boundaries[1]]
+    project_data: ProjectData = ProjectData("project-data-1", data=dict())
+    project_data.spaces = spaces
+    q_needs: Dict[str, float] = {"kitchen": 1_200.0}
+    generator: LimitedGenerator = LimitedGenerator(
+        name="generator-1",
+        q_needs=q_needs,
+        project_data=project_data,
+    )
+    assert generator.initialize() is True
+    generator.run(time_step=0, number_of_iterations=1)
+    # The kitchen's needs are capped by its emitters' nominal power, the
+    # living room's needs are taken from the space
+    assert generator.q_provided == pytest.approx(
+        {"emitter-0": 600.0, "emitter-1": 300.0, "emitter-2": 400.0}
+    )
+    assert generator.q_consumed == pytest.approx(
+        {"emitter-0": 1_200.0, "emitter-1": 600.0, "emitter-2": 800.0}
+    )
+    q_needs["kitchen"] = 300.0
+    generator.run(time_step=1, number_of_iterations=1)
+    assert generator.q_provided["emitter-0"] == pytest.approx(200.0)
+    assert generator.q_provided["emitter-1"] == pytest.approx(100.0)
+
+
 if __name__ == "__main__":
     test_limited_generator()
+    test_limited_generator_spaces()
@@ -2,12 +2,16 @@
 Tests for the `occupant.py` module.
 """
 
+from pathlib import Path
+from typing import List
+
 import pytest
 
 from colibri.core import ProjectData
 from colibri.interfaces import Occupants
 from colibri.modules import OccupantModel
 from colibri.project_objects import Space
+from colibri.utils.exceptions_utils import UserInputError
 
 
 def test_occupant_model() -> None:
@@ -45,5 +49,53 @@ def test_occupant_model() -> None:
     assert occupant.has_converged(time_step=1, number_of_iterations=2) is True
 
 
+def test_occupant_model_schedules() -> None:
+    """Test the OccupantModel class over the whole simulation."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[1] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    occupant: OccupantModel = OccupantModel(
+        name="occupant-1", project_data=project_data
+    )
+    assert occupant.initialize() is True
+    spaces: List[Space] = project_data.spaces
+    for time_step in range(0, len(spaces[0].occupation)):
+        occupant.run(time_step=time_step, number_of_iterations=1)
+        for space in spaces:
+            occupation: float = space.occupation[time_step]
+            assert occupant.gains[space.id] == pytest.approx(
+                occupation * space.reference_area / 40.0 * 100.0
+            )
+            assert occupant.setpoint_temperatures[space.id] == (
+                space.presence_setpoint_temperature
+                if occupation > 0
+                else space.absence_setpoint_temperature
+            )
+    # The schedules are computed again when the module is initialized again
+    spaces_path: str = "/project/node_collection/space_collection"
+    project_data.patch(
+        {f"{spaces_path}/{space.id}/occupation": [0.0, 4.0] for space in spaces}
+    )
+    assert occupant.initialize() is True
+    occupant.run(time_step=1, number_of_iterations=1)
+    kitchen: Space = next(space for space in spaces if space.id == "kitchen_1")
+    assert occupant.gains["kitchen_1"] == pytest.approx(
+        4.0 * kitchen.reference_area / 40.0 * 100.0
+    )
+    with pytest.raises(IndexError):
+        occupant.run(time_step=2, number_of_iterations=1)
+    # Occupations of different lengths are rejected at the initialization
+    project_data.patch({f"{spaces_path}/kitchen_1/occupation": [1.0]})
+    with pytest.raises(
+        UserInputError,
+        match="the occupations of the spaces must have the same length",
+    ):
+        occupant.initialize()
+
+
 if __name__ == "__main__":
     test_occupant_model()
+    test_occupant_model_schedules()
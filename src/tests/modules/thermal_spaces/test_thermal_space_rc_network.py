@@ -0,0 +1,287 @@
+"""
+Tests for the `thermal_space_rc_network.py` module.
+"""
+
+import math
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from colibri.core import ProjectData
+from colibri.interfaces import BoundaryObject, ThermalSpace
+from colibri.modules import ThermalSpaceRcNetwork
+from colibri.project_objects import Boundary, Space
+
+
+def test_thermal_space_rc_network() -> None:
+    """Test the ThermalSpaceRcNetwork class, heated up to steady state."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    thermal_space: ThermalSpaceRcNetwork = ThermalSpaceRcNetwork(
+        name="thermal-space-1",
+        exterior_air_temperature=5.0,
+        project_data=project_data,
+    )
+    assert isinstance(thermal_space, ThermalSpaceRcNetwork) is True
+    assert isinstance(thermal_space, ThermalSpace) is True
+    assert thermal_space.initialize() is True
+    assert thermal_space.inside_air_temperatures == {
+        "living_room_1": 20.0,
+        "kitchen_1": 20.0,
+    }
+    # Each space is heated by its emitter, with the needs of the time step
+    emitter_spaces: Dict[str, str] = {
+        boundary_object.id: space.id
+        for space in project_data.spaces
+        for boundary in space.boundaries
+        for boundary_object in boundary.object_collection
+        if boundary_object.type == "emitter"
+    }
+    assert len(emitter_spaces) == 2
+    annual_needs: Dict[str, float] = {
+        space.id: 0.0 for space in project_data.spaces
+    }
+    for time_step in range(0, 1_000):
+        thermal_space.q_provided.clear()
+        thermal_space.run(time_step=time_step, number_of_iterations=1)
+        thermal_space.q_provided.update(
+            {
+                emitter_id: thermal_space.q_needs[space_id]
+                for emitter_id, space_id in emitter_spaces.items()
+            }
+        )
+        # The time step is computed again, from the same temperatures
+        thermal_space.run(time_step=time_step, number_of_iterations=2)
+        assert thermal_space.has_converged(
+            time_step=time_step, number_of_iterations=2
+        )
+        thermal_space.end_time_step(time_step=time_step)
+        for space in project_data.spaces:
+            annual_needs[space.id] += (
+                thermal_space.q_needs[space.id] / space.reference_area
+            )
+    # Steady state: needs are the losses through the exterior boundaries
+    for space in project_data.spaces:
+        losses: float = sum(
+            boundary.area
+            / sum(
+                layer.thickness / layer.thermal_conductivity
+                for layer in boundary.layers
+            )
+            * (space.setpoint_temperature - 5.0)
+            for boundary in space.boundaries
+            if {boundary.side_1, boundary.side_2}
+            != {"kitchen_1", "living_room_1"}
+        )
+        assert thermal_space.inside_air_temperatures[space.id] == (
+            pytest.approx(space.setpoint_temperature, abs=0.01)
+        )
+        assert thermal_space.q_needs[space.id] == pytest.approx(losses, abs=1)
+    thermal_space.end_simulation()
+    assert thermal_space.annual_needs == pytest.approx(annual_needs)
+
+
+def test_thermal_space_rc_network_time_step() -> None:
+    """Test the ThermalSpaceRcNetwork class with large time steps."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    thermal_space: ThermalSpaceRcNetwork = ThermalSpaceRcNetwork(
+        name="thermal-space-1",
+        exterior_air_temperature=-10.0,
+        time_step_duration=7 * 24 * 3_600.0,
+        project_data=project_data,
+    )
+    thermal_space.initialize()
+    previous_temperatures: Dict[str, float] = dict(
+        thermal_space.inside_air_temperatures
+    )
+    for time_step in range(0, 10):
+        thermal_space.run(time_step=time_step, number_of_iterations=1)
+        thermal_space.end_time_step(time_step=time_step)
+        # Free floating spaces cool down, without oscillating
+        for space_id, temperature in previous_temperatures.items():
+            assert -10.0 <= thermal_space.inside_air_temperatures[space_id]
+            assert thermal_space.inside_air_temperatures[space_id] <= (
+                temperature
+            )
+        previous_temperatures = dict(thermal_space.inside_air_temperatures)
+    assert previous_temperatures["kitchen_1"] == pytest.approx(-10.0, abs=1)
+
+
+def test_thermal_space_rc_network_solvers() -> None:
+    """Test the solvers of the ThermalSpaceRcNetwork class with a single
+    space (only air node), whose response is known."""
+    space: Space = Space(
+        id="space-1",
+        label="kitchen",
+        reference_area=40,
+        height=2.5,
+        inside_air_temperature=20,
+        setpoint_temperature=19,
+        gain=0,
+    )
+    boundary: Boundary = Boundary(
+        id="wall-1", side_1="exterior", side_2="space-1", area=20, u_value=1.5
+    )
+    project_data: ProjectData = ProjectData("project-data-1", data=dict())
+    project_data.spaces = [space]
+    project_data.boundaries = [boundary]
+    # Exponential decay towards 5 + 150 / (1.5 * 20) = 10 °C
+    time_constant: float = 1_230.0 * 40 * 2.5 / (1.5 * 20)
+    expected_temperatures: List[float] = [
+        10.0 + 10.0 * math.exp(-(time_step + 1) * 3_600.0 / time_constant)
+        for time_step in range(0, 24)
+    ]
+    for solver in ["implicit", "state_space"]:
+        thermal_space: ThermalSpaceRcNetwork = ThermalSpaceRcNetwork(
+            name="thermal-space-1",
+            gains={"space-1": 150.0},
+            exterior_air_temperature=5.0,
+            solver=solver,
+            project_data=project_data,
+        )
+        thermal_space.initialize()
+        inside_air_temperatures: List[float] = list()
+        for time_step in range(0, 24):
+            thermal_space.run(time_step=time_step, number_of_iterations=1)
+            thermal_space.end_time_step(time_step=time_step)
+            inside_air_temperatures.append(
+                thermal_space.inside_air_temperatures["space-1"]
+            )
+        # The state space is exact, the implicit scheme damps the response
+        if solver == "state_space":
+            assert inside_air_temperatures == pytest.approx(
+                expected_temperatures
+            )
+        else:
+            assert inside_air_temperatures[0] > expected_temperatures[0]
+            assert inside_air_temperatures[-1] == pytest.approx(10.0, abs=0.01)
+
+
+def test_thermal_space_rc_network_compute_response() -> None:
+    """Test the compute_response method of the ThermalSpaceRcNetwork
+    class, against a simulation time step by time step."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    thermal_space: ThermalSpaceRcNetwork = ThermalSpaceRcNetwork(
+        name="thermal-space-1",
+        solver="state_space",
+        project_data=project_data,
+    )
+    thermal_space.initialize()
+    exterior_air_temperatures: npt.NDArray[np.float64] = np.linspace(
+        -5.0, 15.0, 48
+    )
+    gains: npt.NDArray[np.float64] = np.tile([200.0, 0.0], (48, 1))
+    gains[12:20, 1] = 800.0
+    inside_air_temperatures: npt.NDArray[np.float64] = (
+        thermal_space.compute_response(
+            exterior_air_temperatures=exterior_air_temperatures,
+            powers=gains,
+        )
+    )
+    assert inside_air_temperatures.shape == (48, 2)
+    for time_step in range(0, 48):
+        thermal_space.exterior_air_temperature = exterior_air_temperatures[
+            time_step
+        ]
+        thermal_space.gains.update(
+            {
+                "living_room_1": gains[time_step, 0],
+                "kitchen_1": gains[time_step, 1],
+            }
+        )
+        thermal_space.run(time_step=time_step, number_of_iterations=1)
+        thermal_space.end_time_step(time_step=time_step)
+        assert [
+            thermal_space.inside_air_temperatures["living_room_1"],
+            thermal_space.inside_air_temperatures["kitchen_1"],
+        ] == pytest.approx(inside_air_temperatures[time_step].tolist())
+
+
+def test_thermal_space_rc_network_emitters() -> None:
+    """Test the emitters of the ThermalSpaceRcNetwork class: an emitter
+    between two spaces heats the first one only, whatever the case of its
+    type."""
+    spaces: List[Space] = [
+        Space(
+            id=f"space-{index}",
+            label=f"space {index}",
+            reference_area=20,
+            height=2.5,
+            inside_air_temperature=20,
+            setpoint_temperature=19,
+            gain=0,
+        )
+        for index in range(2)
+    ]
+    emitter: BoundaryObject = BoundaryObject(
+        id="emitter-1", label="Emitter", type="Emitter", type_id=""
+    )
+    boundaries: List[Boundary] = [
+        Boundary(
+            id="wall-0-1",
+            side_1="space-0",
+            side_2="space-1",
+            area=10,
+            u_value=2.0,
+            object_collection=[emitter],
+        ),
+        Boundary(
+            id="wall-1", side_1="space-1", side_2="exterior", area=20, u_value=1
+        ),
+    ]
+    spaces[0].boundaries = boundaries[:1]
+    spaces[1].boundaries = boundaries
+    project_data: ProjectData = ProjectData("project-data-1", data=dict())
+    project_data.spaces = spaces
+    project_data.boundaries = boundaries
+    # The power of the emitter is the same as a gain of its space
+    inside_air_temperatures: List[Dict[str, float]] = list()
+    for q_provided, gains in [
+        ({"emitter-1": 1_000.0}, dict()),
+        (dict(), {"space-0": 1_000.0}),
+    ]:
+        thermal_space: ThermalSpaceRcNetwork = ThermalSpaceRcNetwork(
+            name="thermal-space-1",
+            q_provided=q_provided,
+            gains=gains,
+            exterior_air_temperature=5.0,
+            project_data=project_data,
+        )
+        thermal_space.initialize()
+        for time_step in range(0, 4):
+            thermal_space.run(time_step=time_step, number_of_iterations=1)
+            thermal_space.end_time_step(time_step=time_step)
+        inside_air_temperatures.append(
+            dict(thermal_space.inside_air_temperatures)
+        )
+    assert inside_air_temperatures[0] == pytest.approx(
+        inside_air_temperatures[1]
+    )
+    assert inside_air_temperatures[0]["space-0"] > (
+        inside_air_temperatures[0]["space-1"]
+    )
+
+
+if __name__ == "__main__":
+    test_thermal_space_rc_network()
+    test_thermal_space_rc_network_time_step()
+    test_thermal_space_rc_network_solvers()
+    test_thermal_space_rc_network_compute_response()
+    test_thermal_space_rc_network_emitters()
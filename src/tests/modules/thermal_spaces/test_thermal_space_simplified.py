@@ -2,12 +2,14 @@
 Tests for the `thermal_space_simplified.py` module.
 """
 
+from typing import Dict, List
+
 import pytest
 
 from colibri.core import ProjectData
-from colibri.interfaces import ThermalSpace
+from colibri.interfaces import BoundaryObject, ThermalSpace
 from colibri.modules import ThermalSpaceSimplified
-from colibri.project_objects import Space
+from colibri.project_objects import Boundary, Space
 
 
 def test_thermal_space_simplified() -> None:
@@ -55,5 +57,98 @@ def test_thermal_space_simplified() -> None:
     )
 
 
+def test_thermal_space_simplified_spaces() -> None:
+    """Test the ThermalSpaceSimplified class with several spaces, sharing
+    boundaries and emitters (an emitter between two spaces heats the first
+    one only, whatever the case of its type)."""
+    spaces: List[Space] = [
+        Space(
+            id=f"space-{index}",
+            label=f"space {index}",
+            reference_area=20 + 10 * index,
+            inside_air_temperature=19 + index,
+            height=2.5,
+            setpoint_temperature=20 + index,
+            gain=100 * index,
+        )
+        for index in range(3)
+    ]
+    emitters: List[BoundaryObject] = [
+        BoundaryObject(
+            id=f"emitter-{index}",
+            label="Emitter",
+            type=emitter_type,
+            type_id="",
+        )
+        for index, emitter_type in enumerate(["emitter", "Emitter"])
+    ]
+    boundaries: List[Boundary] = [
+        Boundary(id="wall-0", object_collection=[emitters[0]]),
+        Boundary(id="wall-0-1", object_collection=[emitters[1]]),
+        Boundary(id="wall-1-2", object_collection=[]),
+    ]
+    spaces[0].boundaries = boundaries[:2]
+    spaces[1].boundaries = boundaries[1:]
+    spaces[2].boundaries = boundaries[2:]
+    project_data: ProjectData = ProjectData("project-data-1", data=dict())
+    project_data.spaces = spaces
+    q_walls: Dict[str, float] = {"wall-0": 300.0, "wall-0-1": -50.0}
+    q_provided: Dict[str, float] = {"emitter-0": 800.0, "emitter-1": 200.0}
+    thermal_space_simplified: ThermalSpaceSimplified = ThermalSpaceSimplified(
+        name="thermal-space-1",
+        q_walls=q_walls,
+        q_provided=q_provided,
+        setpoint_temperatures={"space-2": 25.0},
+        previous_inside_air_temperatures={"space-1": 18.0},
+        project_data=project_data,
+    )
+    thermal_space_simplified.initialize()
+    thermal_space_simplified.run(time_step=1, number_of_iterations=1)
+    thermal_space_simplified.run(time_step=2, number_of_iterations=1)
+    thermal_space_simplified.end_simulation()
+    # Expected values, space by space
+    for space in spaces:
+        capacity: float = 1_230.0 * space.reference_area * space.height
+        space_q_walls: float = sum(
+            q_walls.get(boundary.id, 0.0) for boundary in space.boundaries
+        )
+        space_q_provided: float = {"space-0": 1_000.0}.get(space.id, 0.0)
+        setpoint_temperature: float = (
+            thermal_space_simplified.setpoint_temperatures.get(
+                space.id, space.setpoint_temperature
+            )
+        )
+        previous_inside_air_temperature: float = (
+            thermal_space_simplified.previous_inside_air_temperatures.get(
+                space.id, space.inside_air_temperature
+            )
+        )
+        assert thermal_space_simplified.q_needs[space.id] == pytest.approx(
+            max(
+                (setpoint_temperature - previous_inside_air_temperature)
+                * capacity
+                + space_q_walls
+                - space.gain,
+                0,
+            )
+        )
+        assert thermal_space_simplified.inside_air_temperatures[
+            space.id
+        ] == pytest.approx(
+            previous_inside_air_temperature
+            + (space_q_provided + space.gain - space_q_walls) / capacity
+        )
+        assert thermal_space_simplified.annual_needs[space.id] == pytest.approx(
+            2
+            * (
+                (setpoint_temperature - 20.0) * capacity
+                + space_q_walls
+                - space.gain
+            )
+            / space.reference_area
+        )
+
+
 if __name__ == "__main__":
     test_thermal_space_simplified()
+    test_thermal_space_simplified_spaces()
@@ -0,0 +1,172 @@
+"""
+Tests for the `ctf_wall_losses.py` module.
+"""
+
+import math
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from colibri.core import ProjectData
+from colibri.interfaces import ElementObject, WallLosses
+from colibri.modules import CtfWallLosses, LayerWallLosses, TransientWallLosses
+from colibri.project_objects import Boundary, Space
+
+
+def test_ctf_wall_losses() -> None:
+    """Test the CtfWallLosses class, against the steady state of the
+    LayerWallLosses class."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    inside_air_temperatures: Dict[str, float] = {
+        "living_room_1": 21.0,
+        "kitchen_1": 18.0,
+    }
+    wall_losses: CtfWallLosses = CtfWallLosses(
+        name="wall-losses-1",
+        inside_air_temperatures=inside_air_temperatures,
+        exterior_air_temperature=5.0,
+        project_data=project_data,
+    )
+    assert isinstance(wall_losses, CtfWallLosses) is True
+    assert isinstance(wall_losses, WallLosses) is True
+    layer_wall_losses: LayerWallLosses = LayerWallLosses(
+        name="wall-losses-2",
+        inside_air_temperatures=inside_air_temperatures,
+        exterior_air_temperature=5.0,
+        project_data=project_data,
+    )
+    assert wall_losses.initialize() is True
+    # The boundaries start at the steady state of the air temperatures
+    for time_step in range(0, 3):
+        wall_losses.run(time_step=time_step, number_of_iterations=1)
+        wall_losses.end_time_step(time_step=time_step)
+        layer_wall_losses.run(time_step=time_step, number_of_iterations=1)
+        assert len(wall_losses.q_walls) == 12
+        assert wall_losses.q_walls == pytest.approx(layer_wall_losses.q_walls)
+    # And converge to the steady state of new air temperatures
+    wall_losses.exterior_air_temperature = -5.0
+    layer_wall_losses.exterior_air_temperature = -5.0
+    layer_wall_losses.run(time_step=0, number_of_iterations=1)
+    for time_step in range(3, 24 * 30):
+        wall_losses.run(time_step=time_step, number_of_iterations=1)
+        wall_losses.end_time_step(time_step=time_step)
+    assert wall_losses.q_walls == pytest.approx(layer_wall_losses.q_walls)
+
+
+def test_ctf_wall_losses_transient() -> None:
+    """Test the CtfWallLosses class, against the TransientWallLosses class
+    with short time steps."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    wall_losses: CtfWallLosses = CtfWallLosses(
+        name="wall-losses-1",
+        project_data=project_data,
+    )
+    transient_wall_losses: TransientWallLosses = TransientWallLosses(
+        name="wall-losses-2",
+        time_step_duration=60.0,
+        maximum_cell_thickness=0.01,
+        project_data=project_data,
+    )
+    wall_losses.initialize()
+    transient_wall_losses.initialize()
+    for time_step in range(0, 48):
+        for module in [wall_losses, transient_wall_losses]:
+            module.exterior_air_temperature = 5.0 + 10.0 * math.sin(
+                2.0 * math.pi * time_step / 24
+            )
+            module.inside_air_temperatures.update(
+                {"living_room_1": 20.0 + time_step % 4, "kitchen_1": 18.0}
+            )
+        wall_losses.run(time_step=time_step, number_of_iterations=1)
+        wall_losses.end_time_step(time_step=time_step)
+        for _ in range(0, 60):
+            transient_wall_losses.run(
+                time_step=time_step, number_of_iterations=1
+            )
+            transient_wall_losses.end_time_step(time_step=time_step)
+        for boundary_id, q_wall in transient_wall_losses.q_walls.items():
+            assert wall_losses.q_walls[boundary_id] == pytest.approx(
+                q_wall, rel=0.02, abs=1.0
+            )
+
+
+def test_ctf_wall_losses_thick_boundary() -> None:
+    """Test the CtfWallLosses class with a thick boundary (concrete and
+    insulation) at a short time step, whose modes span many orders of
+    magnitude."""
+    layers: List[ElementObject] = [
+        ElementObject.create_instance(
+            class_name="Layer",
+            fields={
+                "name": name,
+                "label": name,
+                "thermal_conductivity": thermal_conductivity,
+                "specific_heat": specific_heat,
+                "density": density,
+                "thickness": thickness,
+            },
+        )
+        for name, thermal_conductivity, specific_heat, density, thickness in [
+            ("concrete", 1.75, 900, 2_300, 0.4),
+            ("insulation", 0.04, 1_400, 30, 0.1),
+        ]
+    ]
+    u_value: float = 1.0 / (0.4 / 1.75 + 0.1 / 0.04)
+    space: Space = Space(
+        id="space-1", label="kitchen", inside_air_temperature=20.0
+    )
+    project_data: ProjectData = ProjectData("project-data-1", data=dict())
+    project_data.spaces = [space]
+    project_data.boundaries = [
+        Boundary(
+            id="boundary-1",
+            side_1="space-1",
+            side_2="exterior",
+            area=10,
+            layers=layers,
+        )
+    ]
+    wall_losses: CtfWallLosses = CtfWallLosses(
+        name="wall-losses-1",
+        exterior_air_temperature=0.0,
+        time_step_duration=60.0,
+        maximum_cell_thickness=0.01,
+        project_data=project_data,
+    )
+    # Stable modes, whose steady state gain is the U-value
+    poles, inputs, outputs, direct_gains = wall_losses._compute_coefficients(
+        layers=layers
+    )
+    assert len(poles) > 1
+    assert np.all((0.0 < poles) & (poles < 1.0))
+    gains: npt.NDArray[np.float64] = direct_gains + outputs @ (
+        inputs / (1.0 - poles)[:, None]
+    )
+    assert gains == pytest.approx(u_value * np.array([[1, -1], [-1, 1]]))
+    # Constant air temperatures keep the boundary at steady state
+    wall_losses.initialize()
+    for time_step in range(0, 1_000):
+        wall_losses.run(time_step=time_step, number_of_iterations=1)
+        wall_losses.end_time_step(time_step=time_step)
+        assert wall_losses.q_walls["boundary-1"] == pytest.approx(
+            u_value * 10 * 20.0
+        )
+
+
+if __name__ == "__main__":
+    test_ctf_wall_losses()
+    test_ctf_wall_losses_transient()
+    test_ctf_wall_losses_thick_boundary()
@@ -2,7 +2,8 @@
 Tests for the `simplified_wall_losses.py` module.
 """
 
-from typing import List
+from pathlib import Path
+from typing import Dict, List
 
 import pytest
 
@@ -82,5 +83,48 @@ def test_simplified_wall_losses() -> None:
     assert wall_losses_2.project_data is None
 
 
+def test_simplified_wall_losses_spaces() -> None:
+    """Test the SimplifiedWallLosses class with boundaries between two
+    spaces."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    inside_air_temperatures: Dict[str, float] = {
+        "living_room_1": 21.0,
+        "kitchen_1": 18.0,
+    }
+    wall_losses: SimplifiedWallLosses = SimplifiedWallLosses(
+        name="wall-losses-1",
+        inside_air_temperatures=inside_air_temperatures,
+        exterior_air_temperature=5.0,
+        project_data=project_data,
+    )
+    assert wall_losses.initialize() is True
+    wall_losses.run(time_step=0, number_of_iterations=1)
+    assert len(wall_losses.q_walls) == 12
+    for boundary in project_data.boundaries:
+        # Losses of the space on side 1, gains of the space on side 2
+        if boundary.side_1 in inside_air_temperatures:
+            temperature_difference: float = inside_air_temperatures[
+                boundary.side_1
+            ] - inside_air_temperatures.get(boundary.side_2, 5.0)
+        else:
+            temperature_difference = (
+                inside_air_temperatures[boundary.side_2] - 5.0
+            )
+        assert wall_losses.q_walls[boundary.id] == pytest.approx(
+            boundary.u_value * boundary.area * temperature_difference
+        )
+    assert wall_losses.q_walls["mur_salon_cuisine"] < 0.0
+    # The spaces' temperatures are updated in place by the linked modules
+    inside_air_temperatures["kitchen_1"] = 21.0
+    wall_losses.run(time_step=1, number_of_iterations=1)
+    assert wall_losses.q_walls["mur_salon_cuisine"] == pytest.approx(0.0)
+
+
 if __name__ == "__main__":
     test_simplified_wall_losses()
+    test_simplified_wall_losses_spaces()
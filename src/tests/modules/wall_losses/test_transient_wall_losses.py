@@ -0,0 +1,131 @@
+"""
+Tests for the `transient_wall_losses.py` module.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from colibri.core import ProjectData
+from colibri.interfaces import WallLosses
+from colibri.modules import LayerWallLosses, TransientWallLosses
+
+
+def test_transient_wall_losses() -> None:
+    """Test the TransientWallLosses class, against the steady state of
+    the LayerWallLosses class."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    inside_air_temperatures: Dict[str, float] = {
+        "living_room_1": 21.0,
+        "kitchen_1": 18.0,
+    }
+    wall_losses: TransientWallLosses = TransientWallLosses(
+        name="wall-losses-1",
+        inside_air_temperatures=inside_air_temperatures,
+        exterior_air_temperature=5.0,
+        project_data=project_data,
+    )
+    assert isinstance(wall_losses, TransientWallLosses) is True
+    assert isinstance(wall_losses, WallLosses) is True
+    layer_wall_losses: LayerWallLosses = LayerWallLosses(
+        name="wall-losses-2",
+        inside_air_temperatures=inside_air_temperatures,
+        exterior_air_temperature=5.0,
+        project_data=project_data,
+    )
+    assert wall_losses.initialize() is True
+    layer_wall_losses.initialize()
+    # The boundaries start at the steady state of the air temperatures
+    wall_losses.run(time_step=0, number_of_iterations=1)
+    layer_wall_losses.run(time_step=0, number_of_iterations=1)
+    assert len(wall_losses.q_walls) == 12
+    assert wall_losses.q_walls == pytest.approx(layer_wall_losses.q_walls)
+    # The losses rise slowly after a drop of the exterior air temperature
+    wall_losses.exterior_air_temperature = -5.0
+    layer_wall_losses.exterior_air_temperature = -5.0
+    layer_wall_losses.run(time_step=0, number_of_iterations=1)
+    previous_q_walls: Dict[str, float] = dict(wall_losses.q_walls)
+    for time_step in range(0, 24 * 30):
+        for number_of_iterations in range(1, 3):
+            wall_losses.run(
+                time_step=time_step, number_of_iterations=number_of_iterations
+            )
+        assert wall_losses.has_converged(
+            time_step=time_step, number_of_iterations=2
+        )
+        wall_losses.end_time_step(time_step=time_step)
+        for boundary_id in ["mur_salon_sud_1", "plancher_cuisine"]:
+            assert (
+                wall_losses.q_walls[boundary_id]
+                >= (previous_q_walls[boundary_id])
+            )
+            assert wall_losses.q_walls[boundary_id] <= (
+                layer_wall_losses.q_walls[boundary_id] + 1e-6
+            )
+        # Thermal mass: after an hour, only a small part of the change
+        if time_step == 0:
+            assert wall_losses.q_walls["mur_salon_sud_1"] - (
+                previous_q_walls["mur_salon_sud_1"]
+            ) < 0.1 * (
+                layer_wall_losses.q_walls["mur_salon_sud_1"]
+                - previous_q_walls["mur_salon_sud_1"]
+            )
+        previous_q_walls = dict(wall_losses.q_walls)
+    assert wall_losses.q_walls == pytest.approx(layer_wall_losses.q_walls)
+
+
+def test_transient_wall_losses_boundaries() -> None:
+    """Test the TransientWallLosses class: boundaries solved together or
+    one by one have the same losses."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[2] / "data" / "house_1.json"
+    )
+    project_data: ProjectData = ProjectData(
+        name="project-data-1", data=project_file
+    )
+    wall_losses: List[TransientWallLosses] = [
+        TransientWallLosses(
+            name="wall-losses-1",
+            time_step_duration=600.0,
+            maximum_cell_thickness=0.02,
+            project_data=project_data,
+        )
+    ]
+    for boundary in project_data.boundaries:
+        boundary_data: ProjectData = ProjectData(
+            name=f"project-data-{boundary.id}", data=dict()
+        )
+        boundary_data.spaces = project_data.spaces
+        boundary_data.boundaries = [boundary]
+        wall_losses.append(
+            TransientWallLosses(
+                name=f"wall-losses-{boundary.id}",
+                time_step_duration=600.0,
+                maximum_cell_thickness=0.02,
+                project_data=boundary_data,
+            )
+        )
+    for time_step in range(0, 36):
+        for module in wall_losses:
+            module.exterior_air_temperature = 10.0 - time_step
+            module.inside_air_temperatures.update(
+                {"living_room_1": 20.0 + time_step % 3, "kitchen_1": 19.0}
+            )
+            module.run(time_step=time_step, number_of_iterations=1)
+            module.end_time_step(time_step=time_step)
+        for module in wall_losses[1:]:
+            for boundary_id, q_wall in module.q_walls.items():
+                assert wall_losses[0].q_walls[boundary_id] == pytest.approx(
+                    q_wall
+                )
+
+
+if __name__ == "__main__":
+    test_transient_wall_losses()
+    test_transient_wall_losses_boundaries()
@@ -2,8 +2,11 @@
 Tests for the `weather_model.py` module.
 """
 
+from pathlib import Path
 from typing import List
 
+import pytest
+
 from colibri.interfaces import Weather
 from colibri.modules import WeatherModel
 
@@ -33,5 +36,31 @@ def test_weather_model() -> None:
         )
 
 
+def test_weather_model_epw_file() -> None:
+    """Test the WeatherModel class with an EPW file."""
+    epw_file: Path = (
+        Path(__file__).resolve().parents[2]
+        / "data"
+        / "weather"
+        / "epw"
+        / "Paris.epw"
+    )
+    weather: WeatherModel = WeatherModel(
+        name="weather-1", altitudes=[100.0], epw_file=str(epw_file)
+    )
+    assert weather.initialize() is True
+    assert len(weather.corrected_exterior_air_temperatures) == 8_760
+    assert weather.weather_data["relative_humidity"].shape == (8_760,)
+    weather.run(time_step=1, number_of_iterations=1)
+    assert weather.exterior_air_temperature == pytest.approx(4.3 - 0.65)
+    # Scenario temperatures are used instead of the EPW file's
+    weather.scenario_exterior_air_temperatures = [20.0, 30.0]
+    weather.initialize()
+    assert weather.corrected_exterior_air_temperatures == pytest.approx(
+        [19.35, 29.35]
+    )
+
+
 if __name__ == "__main__":
     test_weather_model()
+    test_weather_model_epw_file()
@@ -0,0 +1,230 @@
+"""
+Tests for the `array_utils.py` module.
+"""
+
+from types import SimpleNamespace
+from typing import Dict, List
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+from scipy import sparse
+
+from colibri.core.fields import Parameter
+from colibri.interfaces import BoundaryObject
+from colibri.project_objects import Boundary, Space
+from colibri.utils.array_utils import (
+    create_incidence_matrix,
+    get_boundary_sides,
+    get_boundary_space_indices,
+    get_layer_cells,
+    get_layer_value,
+    get_space_emitters,
+    get_values,
+    index_boundaries,
+)
+from colibri.utils.enums_utils import Units
+from colibri.utils.exceptions_utils import UserInputError
+
+
+def test_get_values() -> None:
+    """Test the get_values function."""
+    default_values: npt.NDArray[np.float64] = np.array([1.0, 2.0, 3.0])
+    assert (
+        get_values(
+            values=dict(), ids=["a", "b", "c"], default_values=default_values
+        )
+        is default_values
+    )
+    assert get_values(
+        values={"c": 30.0, "a": 10.0, "d": 40.0},
+        ids=["a", "b", "c"],
+        default_values=default_values,
+    ).tolist() == [10.0, 2.0, 30.0]
+
+
+def test_create_incidence_matrix() -> None:
+    """Test the create_incidence_matrix function."""
+    incidence_matrix: sparse.csr_matrix = create_incidence_matrix(
+        entries=[(0, 0), (0, 1), (1, 1), (1, 1)], shape=(3, 2)
+    )
+    assert incidence_matrix.toarray().tolist() == [
+        [1.0, 1.0],
+        [0.0, 2.0],
+        [0.0, 0.0],
+    ]
+    assert (incidence_matrix @ np.array([5.0, 7.0])).tolist() == [
+        12.0,
+        14.0,
+        0.0,
+    ]
+    assert create_incidence_matrix(entries=[], shape=(2, 0)).shape == (2, 0)
+    assert create_incidence_matrix(
+        entries=[(0, 0), (0, 1)], shape=(1, 2), values=[1.0, -1.0]
+    ).toarray().tolist() == [[1.0, -1.0]]
+
+
+def test_get_boundary_space_indices() -> None:
+    """Test the get_boundary_space_indices function."""
+    space_indices: Dict[str, int] = {"kitchen": 0, "living-room": 1}
+    boundaries: List[Boundary] = [
+        Boundary(side_1="kitchen", side_2="living-room"),
+        Boundary(side_1="exterior", side_2="living-room"),
+        Boundary(side_1="kitchen", side_2="ground"),
+        Boundary(
+            side_1="Space1",
+            spaces=[Space(id="living-room", label="Living room")],
+        ),
+        Boundary(side_1="Space1"),
+    ]
+    assert [
+        get_boundary_space_indices(
+            boundary=boundary, space_indices=space_indices
+        )
+        for boundary in boundaries
+    ] == [(0, 1), (1, None), (0, None), (1, None), (None, None)]
+
+
+def test_get_boundary_sides() -> None:
+    """Test the get_boundary_sides function."""
+    space_indices: Dict[str, int] = {"kitchen": 0, "living-room": 1}
+    boundaries: List[Boundary] = [
+        Boundary(side_1="kitchen", side_2="living-room"),
+        Boundary(side_1="exterior", side_2="living-room"),
+        Boundary(side_1="kitchen", side_2="ground"),
+        Boundary(side_1="exterior", side_2="ground"),
+    ]
+    assert [
+        get_boundary_sides(boundary=boundary, space_indices=space_indices)
+        for boundary in boundaries
+    ] == [((0, 1), 0), ((2, 1), 1), ((0, 2), 0), None]
+
+
+def test_index_boundaries() -> None:
+    """Test the index_boundaries function."""
+    boundaries: List[Boundary] = [
+        Boundary(id="wall", side_1="kitchen", side_2="living-room", area=2.0),
+        Boundary(id="roof", side_1="exterior", side_2="living-room", area=3.0),
+        Boundary(id="floor", side_1="exterior", side_2="ground", area=4.0),
+    ]
+    boundary_ids, conductances, sides_incidence = index_boundaries(
+        boundaries=boundaries,
+        space_ids=["kitchen", "living-room"],
+        get_conductance=lambda boundary: boundary.area,
+    )
+    assert boundary_ids == ["wall", "roof"]
+    assert np.array_equal(conductances, [2.0, 3.0])
+    assert np.array_equal(
+        sides_incidence.toarray(), [[1.0, -1.0, 0.0], [0.0, 1.0, -1.0]]
+    )
+    # q_walls are lost by the first space of each boundary
+    assert np.array_equal(
+        conductances * (sides_incidence @ np.array([20.0, 18.0, 5.0])),
+        [4.0, 39.0],
+    )
+
+
+def test_get_space_emitters() -> None:
+    """Test the get_space_emitters function."""
+    boundary_objects: List[BoundaryObject] = [
+        BoundaryObject(
+            id=boundary_object_id,
+            label=boundary_object_id,
+            type=boundary_object_type,
+            type_id=f"{boundary_object_type.lower()}_1",
+        )
+        for boundary_object_id, boundary_object_type in [
+            ("emitter-1", "emitter"),
+            ("window-1", "window"),
+            ("emitter-2", "Emitter"),
+        ]
+    ]
+    interior_wall: Boundary = Boundary(
+        side_1="kitchen",
+        side_2="living-room",
+        object_collection=boundary_objects[:2],
+    )
+    spaces: List[Space] = [
+        Space(id="kitchen", label="Kitchen"),
+        Space(id="living-room", label="Living room"),
+        Space(id="restroom", label="Restroom"),
+    ]
+    spaces[0].boundaries = [interior_wall]
+    spaces[1].boundaries = [
+        interior_wall,
+        Boundary(side_1="living-room", object_collection=boundary_objects[2:]),
+    ]
+    emitters, space_indices = get_space_emitters(spaces=spaces)
+    assert [emitter.id for emitter in emitters] == ["emitter-1", "emitter-2"]
+    assert space_indices.tolist() == [0, 1]
+
+
+def test_get_layer_value() -> None:
+    """Test the get_layer_value function."""
+    parameters: List[Parameter] = [
+        Parameter(
+            name=name,
+            default_value=default_value,
+            description=name,
+            format=float,
+            min=0,
+            max=float("inf"),
+            unit=Units.UNITLESS,
+            attached_to=None,
+        )
+        for name, default_value in [("density", 2_000.0), ("thickness", 0.2)]
+    ]
+    layer: SimpleNamespace = SimpleNamespace(name="concrete", thickness=0.1)
+    assert (
+        get_layer_value(layer=layer, name="thickness", parameters=parameters)
+        == 0.1
+    )
+    assert (
+        get_layer_value(layer=layer, name="density", parameters=parameters)
+        == 2_000.0
+    )
+    with pytest.raises(
+        UserInputError,
+        match="Layer 'concrete' has no specific_heat and no default value.",
+    ):
+        get_layer_value(layer=layer, name="specific_heat", parameters=[])
+
+
+def test_get_layer_cells() -> None:
+    """Test the get_layer_cells function."""
+    layers: List[SimpleNamespace] = [
+        SimpleNamespace(
+            name="concrete",
+            thickness=0.25,
+            thermal_conductivity=2.0,
+            density=2_000.0,
+            specific_heat=1_000.0,
+        ),
+        SimpleNamespace(
+            name="insulation",
+            thickness=0.05,
+            thermal_conductivity=0.05,
+            specific_heat=1_500.0,
+        ),
+    ]
+    parameters: List[Parameter] = [
+        Parameter(
+            name="density",
+            default_value=20.0,
+            description="density",
+            format=float,
+            min=0.0,
+            max=float("inf"),
+            unit=Units.UNITLESS,
+            attached_to=None,
+        )
+    ]
+    cells = get_layer_cells(
+        layers=layers, parameters=parameters, maximum_cell_thickness=0.1
+    )
+    # Each layer is cut into equal cells no thicker than the maximum
+    assert len(cells) == 4
+    assert np.allclose(
+        cells,
+        [(0.25 / 3 * 2_000_000.0, 0.25 / 12.0)] * 3 + [(1_500.0, 0.5)],
+    )
@@ -0,0 +1,62 @@
+"""
+Tests for the `cache_utils.py` module.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pytest import MonkeyPatch
+
+from colibri.config.constants import COLIBRI_CACHE_DIR
+from colibri.core import ProjectOrchestrator
+from colibri.modules import LimitedGenerator, OccupantModel
+from colibri.utils.cache_utils import SCHEME_CACHE, SchemeCache
+
+
+def test_scheme_cache(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test the SchemeCache class."""
+    monkeypatch.setenv(COLIBRI_CACHE_DIR, str(tmp_path))
+    scheme_cache: SchemeCache = SchemeCache()
+    key: str = scheme_cache.get_key(
+        modules=["LimitedGenerator"], classes=[LimitedGenerator]
+    )
+    assert key == scheme_cache.get_key(
+        modules=["LimitedGenerator"], classes=[LimitedGenerator]
+    )
+    assert key != scheme_cache.get_key(
+        modules=["OccupantModel"], classes=[OccupantModel]
+    )
+    assert scheme_cache.get(key=key) is None
+    scheme: Dict[str, Any] = {"Modules": {"LimitedGenerator": {"x": 1}}}
+    scheme_cache.set(key=key, scheme=scheme)
+    assert scheme_cache.get_cache_file(key=key).is_file()
+    cached_scheme: Dict[str, Any] = scheme_cache.get(key=key)
+    assert cached_scheme == scheme
+    cached_scheme["Modules"].clear()
+    assert scheme_cache.get(key=key) == scheme
+    # Schemes are read back from their cache file
+    assert SchemeCache().get(key=key) == scheme
+    monkeypatch.delenv(COLIBRI_CACHE_DIR)
+    assert SchemeCache().get(key=key) is None
+
+
+def test_generate_scheme_cache(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test the schemes cached by ProjectOrchestrator.generate_scheme."""
+    monkeypatch.setenv(COLIBRI_CACHE_DIR, str(tmp_path))
+    SCHEME_CACHE.clear()
+    modules: List[str] = ["LimitedGenerator", "OccupantModel"]
+    scheme: Dict[str, Any] = ProjectOrchestrator.generate_scheme(
+        modules=modules
+    )
+    assert len(list(tmp_path.glob("scheme_*.json"))) == 1
+    # The same (serialized) scheme is returned, whether it was cached or not
+    assert ProjectOrchestrator.generate_scheme(modules=modules) == scheme
+    scheme["StructureObject"].clear()
+    cached_scheme: Dict[str, Any] = ProjectOrchestrator.generate_scheme(
+        modules=modules
+    )
+    assert cached_scheme["StructureObject"] != dict()
+    SCHEME_CACHE.clear()
+    assert ProjectOrchestrator.generate_scheme(modules=modules) == cached_scheme
@@ -2,11 +2,22 @@
 Tests for the `class_utils.py` module.
 """
 
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from typing import List
+
 import pytest
+from pytest import MonkeyPatch
 
+import colibri.modules
+import colibri.utils.class_utils
+from colibri.interfaces import Weather
 from colibri.modules import AcvExploitationOnly
 from colibri.project_objects import Space
 from colibri.utils.class_utils import (
+    CLASS_REGISTRY,
+    ClassRecord,
     create_class_instance,
     get_class,
 )
@@ -17,6 +28,29 @@ from colibri.utils.exceptions_utils import (
 )
 
 
+class PluginWeather(Weather):
+    """Weather module provided by another package (entry point)."""
+
+    def __init__(self, name: str, exterior_air_temperature: float = 10.0):
+        super().__init__(
+            name=name, exterior_air_temperature=exterior_air_temperature
+        )
+
+    def initialize(self) -> bool:
+        return True
+
+    def run(self, time_step: int, number_of_iterations: int) -> None: ...
+
+    def end_iteration(self, time_step: int) -> None: ...
+
+    def end_time_step(self, time_step: int) -> None: ...
+
+    def end_simulation(self) -> None: ...
+
+    def has_converged(self, time_step: int, number_of_iterations: int) -> bool:
+        return True
+
+
 def test_create_class_instance() -> None:
     """Test the create_class_instance function."""
     acv: AcvExploitationOnly = create_class_instance(
@@ -64,3 +98,105 @@ def test_get_class() -> None:
         ).__name__
         == "ElementObject"
     )
+
+
+def test_class_registry(monkeypatch: MonkeyPatch) -> None:
+    """Test the ClassRegistry class."""
+    record: ClassRecord = CLASS_REGISTRY.get_record(
+        class_name="Space", output_type=ColibriObjectTypes.PROJECT_OBJECT
+    )
+    assert record.class_signature is Space
+    assert record.parameter_names[:2] == ("id", "label")
+    assert set(record.default_values) == set(record.parameter_names)
+    assert record.is_project_object is True
+    # Classes are only resolved once
+    assert (
+        CLASS_REGISTRY.get_record(
+            class_name="Space", output_type=ColibriObjectTypes.PROJECT_OBJECT
+        )
+        is record
+    )
+    space: Space = record.create_instance(
+        class_parameters={"id": "space-1", "volume": 52.25}
+    )
+    assert space.id == "space-1"
+    assert space.volume == 52.25
+    record = CLASS_REGISTRY.get_record(
+        class_name="AcvExploitationOnly",
+        output_type=ColibriObjectTypes.MODULE,
+    )
+    assert record.default_values["name"] is None
+    assert record.is_project_object is False
+    with pytest.raises(ColibriModuleNotFoundError):
+        CLASS_REGISTRY.get_record(
+            class_name="WrongName", output_type=ColibriObjectTypes.MODULE
+        )
+    monkeypatch.setattr(
+        colibri.modules, "FakeModule", type("FakeModule", (), {}), raising=False
+    )
+    with pytest.raises(UnauthorizedColibriModule):
+        CLASS_REGISTRY.get_record(
+            class_name="FakeModule", output_type=ColibriObjectTypes.MODULE
+        )
+    CLASS_REGISTRY.clear()
+    assert (
+        CLASS_REGISTRY.get_record(
+            class_name="AcvExploitationOnly",
+            output_type=ColibriObjectTypes.MODULE,
+        )
+        is not record
+    )
+
+
+def test_class_registry_entry_points(monkeypatch: MonkeyPatch) -> None:
+    """Test the discovery of modules through entry points."""
+    plugin_entry_points: List[EntryPoint] = [
+        EntryPoint(
+            name="PluginWeather",
+            value=f"{__name__}:PluginWeather",
+            group="colibri.modules",
+        )
+    ]
+    monkeypatch.setattr(
+        colibri.utils.class_utils,
+        "entry_points",
+        lambda group: plugin_entry_points if group == "colibri.modules" else [],
+    )
+    CLASS_REGISTRY.clear()
+    assert "PluginWeather" in CLASS_REGISTRY.get_module_names()
+    assert "WeatherModel" in CLASS_REGISTRY.get_module_names()
+    weather: PluginWeather = create_class_instance(
+        class_name="PluginWeather",
+        class_parameters={"name": "weather"},
+        output_type=ColibriObjectTypes.MODULE,
+    )
+    assert type(weather).__name__ == "PluginWeather"
+    assert weather.exterior_air_temperature == 10.0
+    assert (
+        get_class(
+            class_name="PluginWeather", output_type=ColibriObjectTypes.MODULE
+        ).__name__
+        == "PluginWeather"
+    )
+    monkeypatch.undo()
+    CLASS_REGISTRY.clear()
+    with pytest.raises(ColibriModuleNotFoundError):
+        create_class_instance(
+            class_name="PluginWeather",
+            class_parameters={"name": "weather"},
+            output_type=ColibriObjectTypes.MODULE,
+        )
+
+
+def test_modules_lazy_import() -> None:
+    """Test that modules are only imported when they are used."""
+    code: str = (
+        "import sys, colibri\n"
+        "from colibri.utils.class_utils import get_class\n"
+        "from colibri.utils.enums_utils import ColibriObjectTypes\n"
+        "assert 'colibri.modules.occupants.occupant' not in sys.modules\n"
+        "get_class('OccupantModel', ColibriObjectTypes.MODULE)\n"
+        "assert 'colibri.modules.occupants.occupant' in sys.modules\n"
+        "assert 'colibri.modules.weathers.weather_model' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -4,8 +4,11 @@ Tests for the `data_utils.py` module.
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Union
 
+import numpy as np
+
 from colibri.project_objects import (
     LinearJunction,
     PunctualJunction,
@@ -13,6 +16,8 @@ from colibri.project_objects import (
 )
 from colibri.utils.data_utils import (
     are_dictionaries_equal,
+    is_array_reference,
+    load_array_reference,
     turn_format_to_string,
     turn_max_min_to_string,
 )
@@ -79,6 +84,15 @@ def test_turn_format_to_string() -> None:
         turn_format_to_string(field_format=List["AcvExploitationOnly"])
         == "List[AcvExploitationOnly]"
     )
+    # Resolved formats are cached, equal formats keep their own string
+    assert (
+        turn_format_to_string(
+            field_format=Union[PunctualJunction, LinearJunction]
+        )
+        == "Union[PunctualJunction, LinearJunction]"
+    )
+    assert turn_format_to_string(field_format=List[Space]) == "List[Space]"
+    assert turn_format_to_string(field_format="List[Space]") == "List[Space]"
 
 
 def test_turn_max_min_to_string() -> None:
@@ -89,3 +103,32 @@ def test_turn_max_min_to_string() -> None:
     assert turn_max_min_to_string(max_or_min=-1) == -1
     assert turn_max_min_to_string(max_or_min=44) == 44
     assert turn_max_min_to_string(max_or_min=float("inf")) == "inf"
+
+
+def test_array_reference(tmp_path: Path) -> None:
+    """Test the is_array_reference and load_array_reference functions."""
+    assert is_array_reference(value={"array_file": "a.npy"}) is True
+    assert (
+        is_array_reference(value={"array_file": "a.npy", "memory_map": True})
+        is True
+    )
+    assert is_array_reference(value={"array_file": "a.npy", "a": 1}) is False
+    assert is_array_reference(value=[1, 2]) is False
+    np.save(tmp_path / "occupation.npy", np.arange(6, dtype=float))
+    array: np.ndarray = load_array_reference(
+        array_reference={"array_file": "occupation.npy"}, directory=tmp_path
+    )
+    assert array.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    array = load_array_reference(
+        array_reference={
+            "array_file": str(tmp_path / "occupation.npy"),
+            "memory_map": True,
+        }
+    )
+    assert isinstance(array, np.memmap)
+    assert array[4] == 4.0
+    try:
+        load_array_reference(array_reference={"array_file": "missing.npy"})
+        assert False
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,78 @@
+"""
+Tests for the `epw_utils.py` module.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+from pytest import MonkeyPatch
+
+from colibri.config.constants import COLIBRI_CACHE_DIR
+from colibri.utils.epw_utils import (
+    clear_epw_cache,
+    get_epw_cache_file,
+    get_epw_key,
+    read_epw,
+)
+
+EPW_FILE: Path = (
+    Path(__file__).resolve().parents[1]
+    / "data"
+    / "weather"
+    / "epw"
+    / "Paris.epw"
+)
+
+
+def test_read_epw() -> None:
+    """Test the read_epw function."""
+    epw_data: Dict[str, npt.NDArray[np.float64]] = read_epw(epw_file=EPW_FILE)
+    assert epw_data["dry_bulb_temperature"].shape == (8_760,)
+    assert epw_data["dry_bulb_temperature"][:3].tolist() == [2.9, 4.3, 5.3]
+    assert epw_data["relative_humidity"][0] == 94.0
+    assert epw_data["wind_speed"][0] == 3.1
+    assert epw_data["hour"][[0, -1]].tolist() == [1.0, 24.0]
+    assert [
+        float(epw_data[name])
+        for name in ["latitude", "longitude", "time_zone", "elevation"]
+    ] == [48.73, 2.4, 1.0, 96.0]
+    assert epw_data["ground_temperature_depths"].tolist() == [0.5, 2.0, 4.0]
+    assert epw_data["ground_temperatures"].shape == (3, 12)
+    assert epw_data["ground_temperatures"][0, 0] == 3.98
+    # Arrays are shared by the readers of the same EPW file
+    assert read_epw(epw_file=EPW_FILE)["wind_speed"] is epw_data["wind_speed"]
+    with pytest.raises(ValueError):
+        epw_data["wind_speed"][0] = 0.0
+
+
+def test_read_epw_cache(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test the cache files of the read_epw function."""
+    monkeypatch.setenv(COLIBRI_CACHE_DIR, str(tmp_path))
+    clear_epw_cache()
+    epw_data: Dict[str, npt.NDArray[np.float64]] = read_epw(epw_file=EPW_FILE)
+    cache_file: Path = get_epw_cache_file(
+        key=get_epw_key(content=EPW_FILE.read_bytes())
+    )
+    assert cache_file.is_file()
+    assert list(tmp_path.iterdir()) == [cache_file]
+    # EPW data are read back from their cache file
+    clear_epw_cache()
+    cached_epw_data: Dict[str, npt.NDArray[np.float64]] = read_epw(
+        epw_file=EPW_FILE
+    )
+    assert cached_epw_data.keys() == epw_data.keys()
+    for name, values in epw_data.items():
+        assert np.array_equal(cached_epw_data[name], values)
+    # An invalid cache file is ignored
+    clear_epw_cache()
+    cache_file.write_bytes(b"not a NumPy file")
+    assert np.array_equal(
+        read_epw(epw_file=EPW_FILE)["dry_bulb_temperature"],
+        epw_data["dry_bulb_temperature"],
+    )
+    monkeypatch.delenv(COLIBRI_CACHE_DIR)
+    assert get_epw_cache_file(key="key") is None
+    clear_epw_cache()
@@ -0,0 +1,100 @@
+"""
+Tests for the `json_utils.py` module.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from colibri.utils.json_utils import JsonStream
+
+
+def test_json_stream() -> None:
+    """Test the JsonStream class."""
+    project_file: Path = (
+        Path(__file__).resolve().parents[1] / "data" / "house_1.json"
+    )
+    with open(project_file, "r") as _file_descriptor:
+        project_data: Dict[str, Any] = json.load(_file_descriptor)
+    # Small chunks to split keys, numbers, etc. between two chunks
+    for chunk_size in [7, 64, 1 << 20]:
+        with JsonStream(
+            file_path=project_file, chunk_size=chunk_size
+        ) as json_stream:
+            boundaries: List[Tuple[str, Any]] = list(
+                json_stream.iter_items(keys=["project", "boundary_collection"])
+            )
+        assert boundaries == list(
+            project_data["project"]["boundary_collection"].items()
+        )
+        with JsonStream(
+            file_path=project_file, chunk_size=chunk_size
+        ) as json_stream:
+            spaces: List[Tuple[str, Any]] = list(
+                json_stream.iter_items(
+                    keys=["project", "node_collection", "space_collection"]
+                )
+            )
+        assert spaces == list(
+            project_data["project"]["node_collection"][
+                "space_collection"
+            ].items()
+        )
+        with JsonStream(
+            file_path=project_file, chunk_size=chunk_size
+        ) as json_stream:
+            skeleton: Dict[str, Any] = json_stream.read(
+                skipped_keys=[
+                    ["project", "boundary_collection"],
+                    ["project", "node_collection", "space_collection"],
+                ]
+            )
+            skipped_positions: Dict[Tuple[str, ...], Tuple[int, int]] = (
+                json_stream.skipped_positions
+            )
+        assert sorted(skipped_positions) == [
+            ("project", "boundary_collection"),
+            ("project", "node_collection", "space_collection"),
+        ]
+        assert skeleton["project"]["boundary_collection"] == dict()
+        assert skeleton["project"]["node_collection"] == {
+            **project_data["project"]["node_collection"],
+            "space_collection": dict(),
+        }
+        assert (
+            skeleton["project"]["archetype_collection"]
+            == project_data["project"]["archetype_collection"]
+        )
+        # Skipped objects are read again from their position only
+        with JsonStream(
+            file_path=project_file, chunk_size=chunk_size
+        ) as json_stream:
+            for keys, position in skipped_positions.items():
+                collection: Dict[str, Any] = project_data
+                for key in keys:
+                    collection = collection[key]
+                items: List[Tuple[str, Any]] = list(
+                    json_stream.iter_items_at(position=position)
+                )
+                assert items == list(collection.items())
+    with JsonStream(file_path=project_file) as json_stream:
+        assert list(json_stream.iter_items(keys=["project", "unknown"])) == []
+
+
+def test_json_stream_errors(tmp_path: Path) -> None:
+    """Test the JsonStream class with invalid JSON files."""
+    json_file: Path = tmp_path / "invalid.json"
+    json_file.write_text('{"project": {"a": 1, "b": [1, 2}}')
+    with pytest.raises(json.JSONDecodeError):
+        with JsonStream(file_path=json_file, chunk_size=4) as json_stream:
+            json_stream.read(skipped_keys=[])
+    json_file.write_text('{"project": {"a": 1 "b": 2}}')
+    with pytest.raises(json.JSONDecodeError):
+        with JsonStream(file_path=json_file, chunk_size=4) as json_stream:
+            list(json_stream.iter_items(keys=["project", "b"]))
+
+
+if __name__ == "__main__":
+    test_json_stream()
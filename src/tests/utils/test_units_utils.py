@@ -2,6 +2,7 @@
 Tests for the `units_utils.py` module.
 """
 
+import numpy as np
 import pytest
 
 from colibri.utils.enums_utils import Units
@@ -114,8 +115,45 @@ def test_unit_converter() -> None:
     assert str(unit_converter) == repr(unit_converter)
 
 
+def test_unit_converter_convert_array() -> None:
+    """Test the UnitConverter class' convert_array function."""
+    unit_converter: UnitConverter = get_unit_converter()
+    temperatures: np.ndarray = np.array([-10.0, 0.0, 20.0, 100.0])
+    assert unit_converter.convert_array(
+        values=temperatures,
+        unit_from=Units.DEGREE_CELSIUS,
+        unit_to=Units.DEGREE_FAHRENHEIT,
+    ) == pytest.approx([14.0, 32.0, 68.0, 212.0])
+    energies: np.ndarray = unit_converter.convert_array(
+        values=[1000.0, 2500.0],
+        unit_from=Units.WATT_HOUR,
+        unit_to=Units.KILO_WATT_HOUR,
+    )
+    assert energies == pytest.approx(
+        [
+            unit_converter.convert(
+                value=value,
+                unit_from=Units.WATT_HOUR,
+                unit_to=Units.KILO_WATT_HOUR,
+            )
+            for value in [1000.0, 2500.0]
+        ]
+    )
+    assert energies == pytest.approx([1.0, 2.5])
+    assert unit_converter.get_conversion_factors(
+        unit_from=Units.DEGREE_CELSIUS, unit_to=Units.KELVIN
+    ) == pytest.approx((1.0, 273.15))
+    with pytest.raises(UnitError):
+        unit_converter.convert_array(
+            values=temperatures,
+            unit_from=Units.CO2_KILO_GRAM_EQUIVALENT,
+            unit_to=Units.KELVIN,
+        )
+
+
 if __name__ == "__main__":
     test_unit()
     test_dimension()
     test_get_unit_converter()
     test_unit_converter()
+    test_unit_converter_convert_array()